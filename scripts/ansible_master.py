@@ -8,52 +8,190 @@ Includes inventory management, playbook execution, testing, and performance moni
 import os
 import sys
 import argparse
+import importlib
+import io
 import json
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import cached_property
+from itertools import islice
 from pathlib import Path
 from typing import Dict, List, Optional
-from rich.console import Console
+from rich.console import Console, Group
 from rich.panel import Panel
 from rich.table import Table
-from rich.prompt import Prompt, Confirm, IntPrompt
+from rich.prompt import Prompt, Confirm, IntPrompt, InvalidResponse
+from rich.style import Style
+from rich.text import Text
 from rich.tree import Tree
 
-# Import our custom modules
-sys.path.append(str(Path(__file__).parent))
+# Our custom modules live alongside this script and are imported on first use
+_SCRIPT_DIR = Path(__file__).resolve().parent
+if str(_SCRIPT_DIR) not in sys.path:
+    sys.path.append(str(_SCRIPT_DIR))
 
-try:
-    from ansible_runner import AnsibleRunner
-    from vault_manager import AnsibleVaultManager
-    from playbook_generator import PlaybookGenerator
-    from ansible_tester import AnsibleTester
-    from performance_monitor import AnsiblePerformanceMonitor
-except ImportError as e:
-    print(f"Error importing modules: {e}")
-    print("Make sure all Python scripts are in the same directory")
-    sys.exit(1)
+# Working directory captured on first use as the default project base path
+_DEFAULT_BASE = None
+
+def _default_base() -> Path:
+    """Return the current working directory, resolved once per process"""
+    global _DEFAULT_BASE
+    if _DEFAULT_BASE is None:
+        _DEFAULT_BASE = Path.cwd()
+    return _DEFAULT_BASE
+
+# Marker written once the directory structure has been bootstrapped; bump the
+# version whenever the required directory list changes
+_INIT_SENTINEL = ".ansible_master_initialized"
+_INIT_SCHEMA_VERSION = "v1"
+
+# Playbook menus show at most this many entries so large playbook
+# directories don't have to be scanned in full
+_MAX_PLAYBOOK_DISPLAY = 100
+
+# Menu titles are prebuilt so printing them skips markup parsing
+_HEADER_STYLE = Style(bold=True, color="blue")
+_TITLE_PLAYBOOK_EXECUTION = Text("Playbook Execution", style=_HEADER_STYLE)
+_TITLE_PLAYBOOK_GENERATION = Text("Playbook Generation", style=_HEADER_STYLE)
+_TITLE_TEST_SUITE = Text("Test Suite", style=_HEADER_STYLE)
+_TITLE_VAULT = Text("Vault Management", style=_HEADER_STYLE)
+_TITLE_PERFORMANCE = Text("Performance Analysis", style=_HEADER_STYLE)
+_TITLE_INVENTORY = Text("Inventory Management", style=_HEADER_STYLE)
+_TITLE_SYSTEM_STATUS = Text("System Status", style=_HEADER_STYLE)
+
+# Static menu definitions
+_MAIN_MENU_ITEMS = [
+    ("1", "Run Playbook - Execute Ansible playbooks with monitoring"),
+    ("2", "Generate Playbook - Create new playbooks from templates"),
+    ("3", "Test Suite - Run comprehensive tests on playbooks and inventory"),
+    ("4", "Vault Management - Encrypt/decrypt sensitive data"),
+    ("5", "Performance Analysis - Monitor and analyze playbook performance"),
+    ("6", "Inventory Management - View and validate inventory"),
+    ("7", "System Status - Check connectivity and system health"),
+    ("8", "Bulk Operations - Perform operations across multiple playbooks"),
+    ("9", "Reports - Generate and view reports"),
+    ("0", "Exit")
+]
+
+_TEST_OPTIONS = {
+    "1": "syntax",
+    "2": "inventory", 
+    "3": "roles",
+    "4": "connectivity",
+    "5": "dry_run",
+    "6": "all"
+}
+
+_VAULT_OPTIONS = {
+    "1": "Create new vault file",
+    "2": "Encrypt existing file",
+    "3": "Decrypt file",
+    "4": "Edit encrypted file",
+    "5": "View encrypted file",
+    "6": "Show vault status",
+    "7": "Encrypt string"
+}
+
+_INVENTORY_OPTIONS = {
+    "1": "View inventory tree",
+    "2": "Validate inventory",
+    "3": "List all hosts",
+    "4": "Show inventory statistics"
+}
+
+# Prompt choices for the sub-menus
+_TEST_CHOICES = tuple(_TEST_OPTIONS)
+_VAULT_CHOICES = tuple(_VAULT_OPTIONS)
+_INVENTORY_CHOICES = tuple(_INVENTORY_OPTIONS)
+
+class RangeIntPrompt(IntPrompt):
+    """Integer prompt that accepts values within [low, high] without a choices list"""
+    
+    def __init__(self, prompt: str = "", *, low: int, high: int, **kwargs):
+        super().__init__(prompt, **kwargs)
+        self.low = low
+        self.high = high
+    
+    def process_response(self, value: str) -> int:
+        return_value = super().process_response(value)
+        if not self.low <= return_value <= self.high:
+            raise InvalidResponse(f"[prompt.invalid]Please enter a number between {self.low} and {self.high}")
+        return return_value
+
+def _numbered_list(title: str, items) -> Group:
+    """Build a titled list of "key. description" lines as a single renderable"""
+    return Group(
+        Text.from_markup(f"\n[bold]{title}[/bold]"),
+        *(Text(f"  {key}. {description}") for key, description in items)
+    )
 
 class AnsibleMasterController:
     """Master controller for all Ansible operations"""
     
     def __init__(self, base_path: str = None):
         self.console = Console()
-        self.base_path = Path(base_path) if base_path else Path.cwd()
-        
-        # Initialize all components
-        self.runner = AnsibleRunner(base_path)
-        self.vault_manager = AnsibleVaultManager(base_path)
-        self.playbook_generator = PlaybookGenerator(base_path)
-        self.tester = AnsibleTester(base_path)
-        self.performance_monitor = AnsiblePerformanceMonitor(base_path)
+        self.base_path = Path(base_path) if base_path else _default_base()
+        
+        # Directory listings keyed by name -> (mtime key, result)
+        self._listing_cache = {}
+        
+        # Static menus are built once and printed in a single call
+        self._main_menu_renderable = self._build_main_menu()
+        self._test_menu_renderable = _numbered_list(
+            "Available Tests:",
+            [
+                (key, "Run all tests" if test_type == "all" else f"{test_type.replace('_', ' ').title()} tests")
+                for key, test_type in _TEST_OPTIONS.items()
+            ]
+        )
+        self._vault_menu_renderable = _numbered_list("Vault Operations:", _VAULT_OPTIONS.items())
+        self._inventory_menu_renderable = _numbered_list("Inventory Operations:", _INVENTORY_OPTIONS.items())
         
         # Ensure directory structure
         self._ensure_directory_structure()
     
+    def _import_component(self, module_name: str, class_name: str):
+        """Import a component class, exiting with a clear message if it is unavailable"""
+        try:
+            module = importlib.import_module(module_name)
+        except ImportError as e:
+            self.console.print(f"[red]{class_name} unavailable: {e}[/red]")
+            self.console.print("Make sure all Python scripts are in the same directory")
+            raise SystemExit(1)
+        return getattr(module, class_name)
+    
+    # Components are imported and constructed lazily so that single-purpose
+    # invocations (e.g. --vault-status) only pay for, and only depend on,
+    # the module they use
+    @cached_property
+    def runner(self):
+        return self._import_component("ansible_runner", "AnsibleRunner")(self.base_path)
+    
+    @cached_property
+    def vault_manager(self):
+        return self._import_component("vault_manager", "AnsibleVaultManager")(self.base_path)
+    
+    @cached_property
+    def playbook_generator(self):
+        return self._import_component("playbook_generator", "PlaybookGenerator")(self.base_path)
+    
+    @cached_property
+    def tester(self):
+        return self._import_component("ansible_tester", "AnsibleTester")(self.base_path)
+    
+    @cached_property
+    def performance_monitor(self):
+        return self._import_component("performance_monitor", "AnsiblePerformanceMonitor")(self.base_path)
+    
     def _ensure_directory_structure(self):
         """Ensure all required directories exist"""
+        sentinel = self.base_path / _INIT_SENTINEL
+        if sentinel.exists() and sentinel.read_text() == _INIT_SCHEMA_VERSION:
+            return
+        
+        # Only leaf directories are listed; makedirs creates the parents
         required_dirs = [
             "playbooks",
-            "inventories", 
             "inventories/production",
             "inventories/staging",
             "inventories/development",
@@ -69,74 +207,107 @@ class AnsibleMasterController:
         ]
         
         for dir_name in required_dirs:
-            dir_path = self.base_path / dir_name
-            dir_path.mkdir(exist_ok=True)
-    
-    def display_main_menu(self):
-        """Display the main interactive menu"""
-        self.console.clear()
+            os.makedirs(self.base_path / dir_name, exist_ok=True)
         
-        # Header
+        sentinel.write_text(_INIT_SCHEMA_VERSION)
+    
+    def _cached_listing(self, name: str, mtime_key, loader) -> List[str]:
+        """Return a cached directory listing while its mtime key is unchanged"""
+        cached = self._listing_cache.get(name)
+        if cached and cached[0] == mtime_key:
+            return cached[1]
+        
+        result = loader()
+        self._listing_cache[name] = (mtime_key, result)
+        return result
+    
+    def _list_playbooks(self) -> List[str]:
+        """List up to a page of playbooks, re-scanning only when the playbooks directory changes"""
+        def load_page():
+            return sorted(islice(self.runner.iter_playbooks(), _MAX_PLAYBOOK_DISPLAY))
+        
+        try:
+            mtime_key = (self.base_path / "playbooks").stat().st_mtime_ns
+        except FileNotFoundError:
+            return load_page()
+        return self._cached_listing("playbooks", mtime_key, load_page)
+    
+    def _print_playbook_list(self, playbooks: List[str]):
+        """Print the numbered playbook menu"""
+        self.console.print(_numbered_list("Available Playbooks:", enumerate(playbooks, 1)))
+        if len(playbooks) == _MAX_PLAYBOOK_DISPLAY:
+            self.console.print(f"[dim]Showing the first {_MAX_PLAYBOOK_DISPLAY} playbooks found[/dim]")
+    
+    def _list_inventories(self) -> List[str]:
+        """List inventories, re-scanning only when an inventory directory changes"""
+        inventories_dir = self.base_path / "inventories"
+        try:
+            # A hosts.yml added to an existing environment only touches that
+            # environment's directory, so include the subdirectory mtimes
+            with os.scandir(inventories_dir) as entries:
+                mtime_key = (
+                    inventories_dir.stat().st_mtime_ns,
+                    tuple(sorted(
+                        (entry.name, entry.stat().st_mtime_ns)
+                        for entry in entries if entry.is_dir()
+                    ))
+                )
+        except FileNotFoundError:
+            return self.runner.list_inventories()
+        return self._cached_listing("inventories", mtime_key, self.runner.list_inventories)
+    
+    def _pause(self):
+        """Wait for the user to press Enter"""
+        self.console.print("\n[dim]Press Enter to continue[/dim]", end="")
+        sys.stdin.readline()
+    
+    def _ask_int_in_range(self, prompt: str, low: int, high: int, default: int = ...) -> int:
+        """Prompt for an integer until it falls within [low, high]"""
+        return RangeIntPrompt(prompt, low=low, high=high, console=self.console)(default=default)
+    
+    def _build_main_menu(self) -> Group:
+        """Build the main menu header and option table"""
         header = Panel.fit(
             "[bold blue]Ansible Master Controller[/bold blue]\n"
             "[dim]Comprehensive Ansible automation and management toolkit[/dim]",
             border_style="blue"
         )
-        self.console.print(header)
         
-        # Menu options
         menu_table = Table(show_header=False, box=None)
         menu_table.add_column("Option", style="cyan", width=8)
         menu_table.add_column("Description", style="white")
         
-        menu_items = [
-            ("1", "Run Playbook - Execute Ansible playbooks with monitoring"),
-            ("2", "Generate Playbook - Create new playbooks from templates"),
-            ("3", "Test Suite - Run comprehensive tests on playbooks and inventory"),
-            ("4", "Vault Management - Encrypt/decrypt sensitive data"),
-            ("5", "Performance Analysis - Monitor and analyze playbook performance"),
-            ("6", "Inventory Management - View and validate inventory"),
-            ("7", "System Status - Check connectivity and system health"),
-            ("8", "Bulk Operations - Perform operations across multiple playbooks"),
-            ("9", "Reports - Generate and view reports"),
-            ("0", "Exit")
-        ]
-        
-        for option, description in menu_items:
+        for option, description in _MAIN_MENU_ITEMS:
             menu_table.add_row(f"[bold]{option}[/bold]", description)
         
-        self.console.print(menu_table)
+        return Group(header, menu_table)
+    
+    def display_main_menu(self):
+        """Display the main interactive menu"""
+        self.console.clear()
+        self.console.print(self._main_menu_renderable)
         
-        return Prompt.ask(
-            "\n[bold]Select an option[/bold]",
-            choices=[str(i) for i in range(10)],
-            default="0"
-        )
+        return self._ask_int_in_range("\n[bold]Select an option[/bold]", 0, 9, default=0)
     
     def run_playbook_menu(self):
         """Interactive playbook execution menu"""
-        self.console.print("[bold blue]Playbook Execution[/bold blue]")
+        self.console.print(_TITLE_PLAYBOOK_EXECUTION)
         
         # List available playbooks
-        playbooks = self.runner.list_playbooks()
+        playbooks = self._list_playbooks()
         if not playbooks:
             self.console.print("[red]No playbooks found![/red]")
             return
         
-        self.console.print("\n[bold]Available Playbooks:[/bold]")
-        for i, playbook in enumerate(playbooks, 1):
-            self.console.print(f"  {i}. {playbook}")
+        self._print_playbook_list(playbooks)
         
         # Select playbook
-        choice = IntPrompt.ask(
-            "Select playbook",
-            choices=[str(i) for i in range(1, len(playbooks) + 1)]
-        )
+        choice = self._ask_int_in_range("Select playbook", 1, len(playbooks))
         
         selected_playbook = playbooks[choice - 1]
         
         # Select inventory
-        inventories = self.runner.list_inventories()
+        inventories = self._list_inventories()
         inventory = "production"
         if inventories:
             self.console.print(f"\n[bold]Available Inventories:[/bold] {', '.join(inventories)}")
@@ -146,7 +317,7 @@ class AnsibleMasterController:
         limit = Prompt.ask("Limit to specific hosts (optional)", default="")
         tags = Prompt.ask("Run only specific tags (optional)", default="")
         dry_run = Confirm.ask("Run in check mode (dry run)?", default=False)
-        verbose = IntPrompt.ask("Verbosity level (0-4)", default=0, choices=[str(i) for i in range(5)])
+        verbose = self._ask_int_in_range("Verbosity level (0-4)", 0, 4, default=0)
         
         # Performance monitoring
         monitor_performance = Confirm.ask("Monitor performance during execution?", default=True)
@@ -156,19 +327,17 @@ class AnsibleMasterController:
             self.console.print("[blue]Starting monitored playbook execution...[/blue]")
             
             # Build command for monitoring
-            cmd = ["ansible-playbook", str(self.base_path / "playbooks" / selected_playbook)]
+            playbook_path = self.base_path / "playbooks" / selected_playbook
             inventory_path = self.base_path / "inventories" / inventory / "hosts.yml"
-            if inventory_path.exists():
-                cmd.extend(["-i", str(inventory_path)])
-            
-            if limit:
-                cmd.extend(["--limit", limit])
-            if tags:
-                cmd.extend(["--tags", tags])
-            if dry_run:
-                cmd.append("--check")
-            if verbose > 0:
-                cmd.append("-" + "v" * verbose)
+            cmd = [
+                "ansible-playbook",
+                str(playbook_path),
+                *(("-i", str(inventory_path)) if inventory_path.exists() else ()),
+                *(("--limit", limit) if limit else ()),
+                *(("--tags", tags) if tags else ()),
+                *(("--check",) if dry_run else ()),
+                *(("-" + "v" * verbose,) if verbose > 0 else ())
+            ]
             
             # Monitor execution
             metrics, stdout, stderr, return_code = self.performance_monitor.monitor_playbook_execution(cmd)
@@ -204,63 +373,47 @@ class AnsibleMasterController:
             else:
                 self.console.print("[red]✗ Playbook execution failed![/red]")
         
-        Prompt.ask("\nPress Enter to continue")
+        self._pause()
     
     def generate_playbook_menu(self):
         """Interactive playbook generation menu"""
-        self.console.print("[bold blue]Playbook Generation[/bold blue]")
+        self.console.print(_TITLE_PLAYBOOK_GENERATION)
         
         success = self.playbook_generator.interactive_generator()
         
         if success:
             if Confirm.ask("Test the generated playbook?"):
-                # Get the generated playbook name
-                playbooks = self.playbook_generator.list_playbooks()
-                if playbooks:
-                    latest_playbook = sorted(playbooks)[-1]  # Get the most recent
-                    result = self.tester.syntax_check_playbook(latest_playbook)
+                # The generator records the file it just wrote
+                generated = self.playbook_generator.last_generated
+                if generated:
+                    result = self.tester.syntax_check_playbook(generated.name)
                     
                     if result["status"] == "PASS":
                         self.console.print("[green]✓ Generated playbook passed syntax check![/green]")
                     else:
                         self.console.print(f"[red]✗ Syntax check failed: {result['message']}[/red]")
         
-        Prompt.ask("\nPress Enter to continue")
+        self._pause()
     
     def test_suite_menu(self):
         """Interactive test suite menu"""
-        self.console.print("[bold blue]Test Suite[/bold blue]")
-        
-        # Test options
-        test_options = {
-            "1": "syntax",
-            "2": "inventory", 
-            "3": "roles",
-            "4": "connectivity",
-            "5": "dry_run",
-            "6": "all"
-        }
-        
-        self.console.print("\n[bold]Available Tests:[/bold]")
-        for key, test_type in test_options.items():
-            if test_type == "all":
-                self.console.print(f"  {key}. Run all tests")
-            else:
-                self.console.print(f"  {key}. {test_type.replace('_', ' ').title()} tests")
+        self.console.print(_TITLE_TEST_SUITE)
+        
+        self.console.print(self._test_menu_renderable)
         
         choice = Prompt.ask(
             "Select test type",
-            choices=list(test_options.keys()),
+            choices=_TEST_CHOICES,
             default="6"
         )
         
         if choice == "6":
             test_types = ["syntax", "inventory", "roles", "connectivity"]
         else:
-            test_types = [test_options[choice]]
+            test_types = [_TEST_OPTIONS[choice]]
         
         # Select inventory for tests
-        inventories = self.runner.list_inventories()
+        inventories = self._list_inventories()
         inventory = "production"
         if inventories:
             self.console.print(f"\n[bold]Available Inventories:[/bold] {', '.join(inventories)}")
@@ -268,38 +421,64 @@ class AnsibleMasterController:
         
         # Run tests
         self.console.print(f"\n[blue]Running test suite...[/blue]")
-        results = self.tester.run_test_suite(
-            test_types=test_types,
-            inventory=inventory,
-            parallel=True
-        )
+        if len(test_types) > 1:
+            results = self._run_test_types_concurrently(test_types, inventory)
+        else:
+            results = self.tester.run_test_suite(
+                test_types=test_types,
+                inventory=inventory,
+                parallel=True
+            )
         
         # Display results
         self.tester.display_test_results(results)
         
-        Prompt.ask("\nPress Enter to continue")
+        self._pause()
+    
+    def _run_test_types_concurrently(self, test_types: List[str], inventory: str) -> Dict:
+        """Run each test type as its own suite in parallel and merge the results"""
+        # Each suite blocks on ansible subprocesses, so threads overlap well
+        with ThreadPoolExecutor(max_workers=len(test_types)) as executor:
+            futures = [
+                executor.submit(
+                    self.tester.run_test_suite,
+                    test_types=[test_type],
+                    inventory=inventory,
+                    parallel=True,
+                    show_progress=False
+                )
+                for test_type in test_types
+            ]
+            all_results = []
+            for future in futures:
+                all_results.extend(future.result()["results"])
+        
+        return self.tester.summarize_results(all_results)
+    
+    def _show_vault_status(self):
+        """Show vault status, skipping the recursive scan when there is nothing to scan"""
+        def has_files(path: Path) -> bool:
+            # Stops at the first file; a fresh tree holds only directories
+            for _, _, files in os.walk(path):
+                if files:
+                    return True
+            return False
+        
+        if not any(has_files(path) for path in self.vault_manager.search_paths):
+            self.console.print("[yellow]No vault files.[/yellow]")
+            return
+        
+        self.vault_manager.display_vault_status()
     
     def vault_management_menu(self):
         """Interactive vault management menu"""
-        self.console.print("[bold blue]Vault Management[/bold blue]")
-        
-        vault_options = {
-            "1": "Create new vault file",
-            "2": "Encrypt existing file",
-            "3": "Decrypt file",
-            "4": "Edit encrypted file",
-            "5": "View encrypted file",
-            "6": "Show vault status",
-            "7": "Encrypt string"
-        }
-        
-        self.console.print("\n[bold]Vault Operations:[/bold]")
-        for key, description in vault_options.items():
-            self.console.print(f"  {key}. {description}")
+        self.console.print(_TITLE_VAULT)
+        
+        self.console.print(self._vault_menu_renderable)
         
         choice = Prompt.ask(
             "Select operation",
-            choices=list(vault_options.keys())
+            choices=_VAULT_CHOICES
         )
         
         if choice == "1":
@@ -348,7 +527,7 @@ class AnsibleMasterController:
         
         elif choice == "6":
             # Show vault status
-            self.vault_manager.display_vault_status()
+            self._show_vault_status()
         
         elif choice == "7":
             # Encrypt string
@@ -363,31 +542,31 @@ class AnsibleMasterController:
             if encrypted:
                 self.console.print(Panel(encrypted, title="Encrypted String"))
         
-        Prompt.ask("\nPress Enter to continue")
+        self._pause()
     
     def performance_analysis_menu(self):
         """Interactive performance analysis menu"""
-        self.console.print("[bold blue]Performance Analysis[/bold blue]")
+        self.console.print(_TITLE_PERFORMANCE)
         
-        playbooks = self.runner.list_playbooks()
+        playbooks = self._list_playbooks()
         if not playbooks:
             self.console.print("[red]No playbooks found![/red]")
-            Prompt.ask("Press Enter to continue")
+            self._pause()
             return
         
-        self.console.print("\n[bold]Available Playbooks:[/bold]")
-        for i, playbook in enumerate(playbooks, 1):
-            self.console.print(f"  {i}. {playbook}")
+        self._print_playbook_list(playbooks)
         
-        choice = IntPrompt.ask(
-            "Select playbook for performance testing",
-            choices=[str(i) for i in range(1, len(playbooks) + 1)]
-        )
+        choice = self._ask_int_in_range("Select playbook for performance testing", 1, len(playbooks))
         
         selected_playbook = playbooks[choice - 1]
         
         # Test parameters
         iterations = IntPrompt.ask("Number of test iterations", default=1)
+        concurrency = 1
+        if iterations > 1:
+            concurrency = IntPrompt.ask("Iterations to run in parallel", default=1)
+            if concurrency > 1:
+                self.console.print("[yellow]CPU and memory samples are system-wide, so parallel iterations will include each other's load[/yellow]")
         inventory = Prompt.ask("Inventory to use", default="production")
         
         # Run performance test
@@ -396,7 +575,8 @@ class AnsibleMasterController:
         metrics_list = self.performance_monitor.run_performance_test(
             playbook_name=selected_playbook,
             inventory=inventory,
-            iterations=iterations
+            iterations=iterations,
+            concurrency=concurrency
         )
         
         # Analyze and display results
@@ -408,17 +588,17 @@ class AnsibleMasterController:
             filename = Prompt.ask("Filename", default=f"perf_test_{selected_playbook}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
             self.performance_monitor.save_metrics(metrics_list, filename)
         
-        Prompt.ask("\nPress Enter to continue")
+        self._pause()
     
     def inventory_management_menu(self):
         """Interactive inventory management menu"""
-        self.console.print("[bold blue]Inventory Management[/bold blue]")
+        self.console.print(_TITLE_INVENTORY)
         
-        inventories = self.runner.list_inventories()
+        inventories = self._list_inventories()
         
         if not inventories:
             self.console.print("[red]No inventories found![/red]")
-            Prompt.ask("Press Enter to continue")
+            self._pause()
             return
         
         self.console.print(f"\n[bold]Available Inventories:[/bold] {', '.join(inventories)}")
@@ -426,18 +606,9 @@ class AnsibleMasterController:
         inventory = Prompt.ask("Select inventory", default="production")
         
         # Inventory operations
-        inv_options = {
-            "1": "View inventory tree",
-            "2": "Validate inventory",
-            "3": "List all hosts",
-            "4": "Show inventory statistics"
-        }
+        self.console.print(self._inventory_menu_renderable)
         
-        self.console.print("\n[bold]Inventory Operations:[/bold]")
-        for key, description in inv_options.items():
-            self.console.print(f"  {key}. {description}")
-        
-        choice = Prompt.ask("Select operation", choices=list(inv_options.keys()))
+        choice = Prompt.ask("Select operation", choices=_INVENTORY_CHOICES)
         
         if choice == "1":
             self.runner.display_inventory_tree(inventory)
@@ -449,35 +620,76 @@ class AnsibleMasterController:
             # Show statistics
             result = self.runner.run_ad_hoc_command("all", "setup", "filter=ansible_distribution*", inventory)
         
-        Prompt.ask("\nPress Enter to continue")
+        self._pause()
     
     def system_status_menu(self):
         """System status and health check menu"""
-        self.console.print("[bold blue]System Status[/bold blue]")
+        self.console.print(_TITLE_SYSTEM_STATUS)
         
-        inventories = self.runner.list_inventories()
+        inventories = self._list_inventories()
         inventory = "production"
         
         if inventories:
             self.console.print(f"\n[bold]Available Inventories:[/bold] {', '.join(inventories)}")
             inventory = Prompt.ask("Select inventory for health check", default="production")
         
-        # Run connectivity check
-        self.console.print(f"\n[blue]Checking connectivity to {inventory} inventory...[/blue]")
-        connectivity_result = self.runner.check_connectivity(inventory)
-        
-        # Run basic system info gathering
-        if connectivity_result["successful_hosts"]:
-            self.console.print("\n[blue]Gathering system information from reachable hosts...[/blue]")
-            
-            system_info = self.runner.run_ad_hoc_command(
+        # Connectivity check and system info gathering are independent, so run
+        # them side by side; each reports to its own buffer, replayed in order
+        self.console.print(f"\n[blue]Checking connectivity and gathering system information for {inventory} inventory...[/blue]")
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            connectivity_future = executor.submit(self._buffered, self.runner.check_connectivity, inventory)
+            system_info_future = executor.submit(
+                self._buffered,
+                self.runner.run_ad_hoc_command,
                 "all",
                 "setup",
                 "filter=ansible_system*",
                 inventory
             )
+            
+            connectivity_result, connectivity_output = connectivity_future.result()
+            system_info, system_info_output = system_info_future.result()
         
-        Prompt.ask("\nPress Enter to continue")
+        for output in (connectivity_output, system_info_output):
+            self.console.print(Text.from_ansi(output), end="", soft_wrap=True)
+        
+        if not connectivity_result["successful_hosts"]:
+            self.console.print("[yellow]No reachable hosts - system information unavailable[/yellow]")
+        
+        self._pause()
+    
+    def _buffered(self, func, *args):
+        """Call a runner method with a private console; return its result and output"""
+        console = Console(
+            file=io.StringIO(),
+            force_terminal=self.console.is_terminal,
+            color_system=self.console.color_system,
+            width=self.console.width
+        )
+        return func(*args, console=console), console.file.getvalue()
+    
+    def bulk_operations_menu(self):
+        """Bulk operations placeholder"""
+        self.console.print("[yellow]Bulk operations coming soon![/yellow]")
+        self._pause()
+    
+    def reports_menu(self):
+        """Reports placeholder"""
+        self.console.print("[yellow]Reports feature coming soon![/yellow]")
+        self._pause()
+    
+    # Main menu selection -> handler
+    _DISPATCH = {
+        1: run_playbook_menu,
+        2: generate_playbook_menu,
+        3: test_suite_menu,
+        4: vault_management_menu,
+        5: performance_analysis_menu,
+        6: inventory_management_menu,
+        7: system_status_menu,
+        8: bulk_operations_menu,
+        9: reports_menu
+    }
     
     def run_interactive_mode(self):
         """Run the interactive menu system"""
@@ -485,29 +697,13 @@ class AnsibleMasterController:
             try:
                 choice = self.display_main_menu()
                 
-                if choice == "0":
+                if choice == 0:
                     self.console.print("[blue]Goodbye![/blue]")
                     break
-                elif choice == "1":
-                    self.run_playbook_menu()
-                elif choice == "2":
-                    self.generate_playbook_menu()
-                elif choice == "3":
-                    self.test_suite_menu()
-                elif choice == "4":
-                    self.vault_management_menu()
-                elif choice == "5":
-                    self.performance_analysis_menu()
-                elif choice == "6":
-                    self.inventory_management_menu()
-                elif choice == "7":
-                    self.system_status_menu()
-                elif choice == "8":
-                    self.console.print("[yellow]Bulk operations coming soon![/yellow]")
-                    Prompt.ask("Press Enter to continue")
-                elif choice == "9":
-                    self.console.print("[yellow]Reports feature coming soon![/yellow]")
-                    Prompt.ask("Press Enter to continue")
+                
+                handler = self._DISPATCH.get(choice)
+                if handler:
+                    handler(self)
                 
             except KeyboardInterrupt:
                 self.console.print("\n[blue]Operation cancelled by user[/blue]")
@@ -557,7 +753,7 @@ def main():
                 sys.exit(0 if success else 1)
             
             elif args.vault_status:
-                controller.vault_manager.display_vault_status()
+                controller._show_vault_status()
             
             elif args.connectivity:
                 controller.runner.check_connectivity(args.inventory)
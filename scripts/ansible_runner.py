@@ -8,12 +8,19 @@ Supports inventory management, vault operations, and execution monitoring
 import os
 import sys
 import argparse
+import asyncio
+import importlib.util
+import selectors
 import subprocess
 import yaml
 import json
+import hashlib
+import pickle
+import re
+import tempfile
 import logging
 from pathlib import Path
-from typing import Dict, List, Optional, Union
+from typing import Callable, Dict, Iterator, List, Optional, Union
 from datetime import datetime
 import concurrent.futures
 from rich.console import Console
@@ -21,32 +28,155 @@ from rich.table import Table
 from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.panel import Panel
 from rich.tree import Tree
+from rich.text import Text
+from rich.markup import escape
+
+# Prefer the libyaml-backed loader; fall back to the pure-Python one
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+# Optional faster JSON codec for callback output and serialized results
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Setup logging
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
     handlers=[
-        logging.FileHandler('ansible_runner.log'),
+        # delay=True: read-only commands never create or open the log file
+        logging.FileHandler('ansible_runner.log', delay=True),
         logging.StreamHandler()
     ]
 )
 logger = logging.getLogger(__name__)
 
+# Bump when the pickled inventory format changes so old cache files are ignored
+INVENTORY_CACHE_VERSION = 1
+
+# blake2b digest size of inventory content, in bytes
+INVENTORY_DIGEST_SIZE = 16
+
+# Fixed tree and table labels, built once so Rich never parses their markup
+_HOSTS_LABEL = Text("hosts", style="green")
+_CHILDREN_LABEL = Text("children", style="magenta")
+_VARS_LABEL = Text("vars", style="blue")
+_REACHABLE_LABEL = Text("✓ Reachable", style="green")
+_UNREACHABLE_LABEL = Text("✗ Unreachable", style="red")
+
+# Children inherit no stray descriptors (PEP 446), so skip the close-all sweep on Linux
+_CLOSE_FDS = sys.platform != "linux"
+
 class AnsibleRunner:
     """Main class for running Ansible operations"""
     
-    def __init__(self, base_path: str = None):
+    def __init__(self, base_path: str = None, forks: int = 20, poll_interval: float = 0.01):
         self.console = Console()
         self.base_path = Path(base_path) if base_path else Path.cwd()
         self.inventory_path = self.base_path / "inventories"
         self.playbook_path = self.base_path / "playbooks"
         self.vault_path = self.base_path / "vault"
+        self.cache_path = self.base_path / ".cache"
+        self._inventory_cache = {}
+        self._resolved_inventories = {}
+        self._listing_cache = {}
+        
+        # Spare every child a chdir when we are already in the project root
+        self._cwd = None if self.base_path.resolve() == Path.cwd() else self.base_path
+        
+        # Shared by every ansible subprocess; the stock 0.001s internal poll
+        # interval keeps the controller busy-waiting on workers
+        self._subprocess_env = {
+            **os.environ,
+            "ANSIBLE_FORKS": str(forks),
+            "ANSIBLE_INTERNAL_POLL_INTERVAL": str(poll_interval),
+        }
+    
+    def _resolve_inventory(self, inventory: str) -> Optional[Path]:
+        """Return the hosts.yml of a named inventory, or None; hits are memoized"""
+        hosts_file = self._resolved_inventories.get(inventory)
+        if hosts_file is None:
+            candidate = self.inventory_path / inventory / "hosts.yml"
+            # Misses are not cached so inventories generated mid-session are picked up
+            if not candidate.exists():
+                return None
+            hosts_file = self._resolved_inventories[inventory] = candidate
+        return hosts_file
+    
+    def _inventory_arg(self, inventory: str) -> str:
+        """Value for -i: the inventory's hosts.yml if it exists, else the name as given"""
+        hosts_file = self._resolve_inventory(inventory)
+        return str(hosts_file) if hosts_file else inventory
+    
+    def _mitogen_env(self) -> Dict[str, str]:
+        """Environment that switches ansible-playbook to the Mitogen strategy when installed"""
+        spec = importlib.util.find_spec("ansible_mitogen")
+        if spec is None or spec.origin is None:
+            return {}
+        
+        strategy_path = Path(spec.origin).parent / "plugins" / "strategy"
+        if not strategy_path.is_dir():
+            return {}
+        
+        # Respect a strategy chosen explicitly by the caller
+        if "ANSIBLE_STRATEGY" in os.environ:
+            return {}
+        
+        plugin_paths = [str(strategy_path)]
+        if os.environ.get("ANSIBLE_STRATEGY_PLUGINS"):
+            plugin_paths.append(os.environ["ANSIBLE_STRATEGY_PLUGINS"])
+        
+        return {
+            "ANSIBLE_STRATEGY": "mitogen_linear",
+            "ANSIBLE_STRATEGY_PLUGINS": os.pathsep.join(plugin_paths),
+        }
+    
+    def _stream_run(self, cmd: List[str], on_line: Callable[[str, str], None], env: Dict[str, str] = None) -> int:
+        """Run cmd, passing each ("stdout"|"stderr", line) to on_line as it is written; return the exit code"""
+        process = subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            cwd=self._cwd,
+            close_fds=_CLOSE_FDS,
+            env=env or self._subprocess_env
+        )
+        
+        selector = selectors.DefaultSelector()
+        selector.register(process.stdout, selectors.EVENT_READ, "stdout")
+        selector.register(process.stderr, selectors.EVENT_READ, "stderr")
+        pending = {"stdout": b"", "stderr": b""}
         
-        # Ensure required directories exist
-        self.inventory_path.mkdir(exist_ok=True)
-        self.playbook_path.mkdir(exist_ok=True)
-        self.vault_path.mkdir(exist_ok=True)
+        try:
+            while selector.get_map():
+                for key, _ in selector.select():
+                    chunk = os.read(key.fd, 65536)
+                    if not chunk:
+                        selector.unregister(key.fileobj)
+                        if pending[key.data]:
+                            on_line(key.data, pending[key.data].decode(errors="replace"))
+                        continue
+                    
+                    # Decode each read's complete lines in one call; keep the tail as bytes
+                    complete, newline, pending[key.data] = (pending[key.data] + chunk).rpartition(b"\n")
+                    if newline:
+                        for line in complete.decode(errors="replace").split("\n"):
+                            on_line(key.data, line)
+        except BaseException:
+            # on_line raised or we were interrupted; don't leave the child running
+            process.kill()
+            process.wait()
+            raise
+        finally:
+            selector.close()
+            process.stdout.close()
+            process.stderr.close()
+        
+        return process.wait()
     
     def run_playbook(self, 
                     playbook_name: str,
@@ -56,7 +186,8 @@ class AnsibleRunner:
                     skip_tags: str = None,
                     extra_vars: Dict = None,
                     dry_run: bool = False,
-                    verbose: int = 0) -> Dict:
+                    verbose: int = 0,
+                    use_mitogen: bool = True) -> Dict:
         """
         Run an Ansible playbook with specified parameters
         
@@ -69,6 +200,7 @@ class AnsibleRunner:
             extra_vars: Extra variables to pass to playbook
             dry_run: Run in check mode
             verbose: Verbosity level (0-4)
+            use_mitogen: Use the Mitogen strategy when it is installed
         
         Returns:
             Dict with execution results
@@ -84,11 +216,7 @@ class AnsibleRunner:
         cmd.append(str(playbook_path))
         
         # Inventory
-        inventory_path = self.inventory_path / inventory / "hosts.yml"
-        if inventory_path.exists():
-            cmd.extend(["-i", str(inventory_path)])
-        else:
-            cmd.extend(["-i", inventory])
+        cmd.extend(["-i", self._inventory_arg(inventory)])
         
         # Optional parameters
         if limit:
@@ -102,62 +230,89 @@ class AnsibleRunner:
         if verbose > 0:
             cmd.append("-" + "v" * min(verbose, 4))
         
-        # Extra variables
-        if extra_vars:
+        # Extra variables; larger sets go through one JSON file instead of N -e pairs
+        extra_vars_file = None
+        if extra_vars and len(extra_vars) > 4:
+            fd, extra_vars_file = tempfile.mkstemp(prefix="extra_vars_", suffix=".json")
+            with os.fdopen(fd, 'w') as f:
+                json.dump(extra_vars, f, default=str)
+            cmd.extend(["-e", f"@{extra_vars_file}"])
+        elif extra_vars:
             for key, value in extra_vars.items():
                 cmd.extend(["-e", f"{key}={value}"])
         
+        # Mitogen keeps one remote interpreter per host instead of one per task
+        mitogen_env = self._mitogen_env() if use_mitogen else {}
+        env = {**self._subprocess_env, **mitogen_env} if mitogen_env else None
+        
         # Execute command
-        self.console.print(f"[bold blue]Executing:[/bold blue] {' '.join(cmd)}")
+        cmd_str = " ".join(cmd)
+        self.console.print(f"[bold blue]Executing:[/bold blue] {cmd_str}")
+        if mitogen_env:
+            self.console.print("[dim]Using Mitogen strategy[/dim]")
         
         try:
+            # No spinner (or its refresh thread) when output is redirected
             with Progress(
                 SpinnerColumn(),
                 TextColumn("[progress.description]{task.description}"),
                 console=self.console,
+                disable=not self.console.is_terminal,
             ) as progress:
                 task = progress.add_task("Running playbook...", total=None)
+                stdout_lines = []
+                stderr_lines = []
                 
-                result = subprocess.run(
-                    cmd,
-                    capture_output=True,
-                    text=True,
-                    cwd=self.base_path
-                )
+                def on_line(stream: str, line: str):
+                    if stream == "stderr":
+                        stderr_lines.append(line)
+                        return
+                    stdout_lines.append(line)
+                    # Show the current play/task on the spinner as it starts; names
+                    # like [/etc/hosts] or [webservers] must not be read as markup
+                    if line.startswith(("PLAY [", "TASK [")):
+                        progress.update(task, description=escape(line.rstrip(" *")))
+                
+                return_code = self._stream_run(cmd, on_line, env=env)
                 
                 progress.update(task, completed=True)
             
+            stderr = "\n".join(stderr_lines)
             execution_result = {
-                "command": " ".join(cmd),
-                "return_code": result.returncode,
-                "stdout": result.stdout,
-                "stderr": result.stderr,
-                "success": result.returncode == 0,
+                "command": cmd_str,
+                "return_code": return_code,
+                "stdout": "\n".join(stdout_lines),
+                "stderr": stderr,
+                "success": return_code == 0,
                 "timestamp": datetime.now().isoformat()
             }
             
             # Display results
-            if result.returncode == 0:
+            if return_code == 0:
                 self.console.print("[bold green]✓ Playbook executed successfully[/bold green]")
             else:
-                self.console.print(f"[bold red]✗ Playbook failed with return code {result.returncode}[/bold red]")
-                self.console.print(f"[red]Error: {result.stderr}[/red]")
+                self.console.print(f"[bold red]✗ Playbook failed with return code {return_code}[/bold red]")
+                self.console.print(f"[red]Error: {stderr}[/red]")
             
             # Log execution
-            logger.info(f"Playbook {playbook_name} executed with return code {result.returncode}")
+            logger.info(f"Playbook {playbook_name} executed with return code {return_code}")
             
             return execution_result
             
         except Exception as e:
             logger.error(f"Error executing playbook: {str(e)}")
             raise
+        finally:
+            if extra_vars_file:
+                os.unlink(extra_vars_file)
     
     def run_ad_hoc_command(self,
                           hosts: str,
                           module: str,
                           args: str = "",
                           inventory: str = "production",
-                          become: bool = False) -> Dict:
+                          become: bool = False,
+                          console: Optional[Console] = None) -> Dict:
         """
         Run an ad-hoc Ansible command
         
@@ -167,6 +322,7 @@ class AnsibleRunner:
             args: Module arguments
             inventory: Inventory to use
             become: Use privilege escalation
+            console: Console to report to (defaults to the runner's own)
         
         Returns:
             Dict with execution results
@@ -178,40 +334,36 @@ class AnsibleRunner:
             cmd.extend(["-a", args])
         
         # Inventory
-        inventory_path = self.inventory_path / inventory / "hosts.yml"
-        if inventory_path.exists():
-            cmd.extend(["-i", str(inventory_path)])
-        else:
-            cmd.extend(["-i", inventory])
+        cmd.extend(["-i", self._inventory_arg(inventory)])
         
         if become:
             cmd.append("--become")
         
-        self.console.print(f"[bold blue]Executing ad-hoc command:[/bold blue] {' '.join(cmd)}")
+        cmd_str = " ".join(cmd)
+        console = console or self.console
+        console.print(f"[bold blue]Executing ad-hoc command:[/bold blue] {cmd_str}")
         
         try:
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                cwd=self.base_path
-            )
+            output = {"stdout": [], "stderr": []}
+            return_code = self._stream_run(cmd, lambda stream, line: output[stream].append(line))
+            stdout = "\n".join(output["stdout"])
+            stderr = "\n".join(output["stderr"])
             
             execution_result = {
-                "command": " ".join(cmd),
-                "return_code": result.returncode,
-                "stdout": result.stdout,
-                "stderr": result.stderr,
-                "success": result.returncode == 0,
+                "command": cmd_str,
+                "return_code": return_code,
+                "stdout": stdout,
+                "stderr": stderr,
+                "success": return_code == 0,
                 "timestamp": datetime.now().isoformat()
             }
             
-            if result.returncode == 0:
-                self.console.print("[bold green]✓ Ad-hoc command executed successfully[/bold green]")
-                self.console.print(result.stdout)
+            if return_code == 0:
+                console.print("[bold green]✓ Ad-hoc command executed successfully[/bold green]")
+                console.print(stdout)
             else:
-                self.console.print(f"[bold red]✗ Command failed[/bold red]")
-                self.console.print(f"[red]{result.stderr}[/red]")
+                console.print(f"[bold red]✗ Command failed[/bold red]")
+                console.print(f"[red]{stderr}[/red]")
             
             return execution_result
             
@@ -219,81 +371,234 @@ class AnsibleRunner:
             logger.error(f"Error executing ad-hoc command: {str(e)}")
             raise
     
+    @staticmethod
+    def result_to_json(result: Dict) -> str:
+        """Serialize an execution result dict, using orjson when installed"""
+        if orjson is not None:
+            return orjson.dumps(result).decode()
+        return json.dumps(result)
+    
+    def iter_playbooks(self) -> Iterator[str]:
+        """Yield playbook file names in directory order without stat calls"""
+        try:
+            entries = os.scandir(self.playbook_path)
+        except FileNotFoundError:
+            return
+        with entries:
+            for entry in entries:
+                if entry.name.endswith((".yml", ".yaml")) and entry.is_file():
+                    yield entry.name
+    
+    def _cached_scan(self, directory: Path, scan: Callable[[], List[str]]) -> List[str]:
+        """Return scan(), reusing the last result while the directory's mtime is unchanged"""
+        try:
+            mtime = directory.stat().st_mtime_ns
+        except FileNotFoundError:
+            return []
+        
+        cached = self._listing_cache.get(directory)
+        if cached and cached[0] == mtime:
+            return cached[1]
+        
+        result = scan()
+        self._listing_cache[directory] = (mtime, result)
+        return result
+    
     def list_playbooks(self) -> List[str]:
         """List available playbooks"""
-        playbooks = []
-        for file in self.playbook_path.glob("*.yml"):
-            playbooks.append(file.name)
-        for file in self.playbook_path.glob("*.yaml"):
-            playbooks.append(file.name)
-        return sorted(playbooks)
+        return list(self._cached_scan(self.playbook_path, lambda: sorted(self.iter_playbooks())))
+    
+    def _scan_inventory_dirs(self) -> List[str]:
+        """Sorted names of subdirectories under inventories/"""
+        with os.scandir(self.inventory_path) as entries:
+            return sorted(entry.name for entry in entries if entry.is_dir())
     
     def list_inventories(self) -> List[str]:
         """List available inventories"""
-        inventories = []
-        for directory in self.inventory_path.iterdir():
-            if directory.is_dir():
-                hosts_file = directory / "hosts.yml"
-                if hosts_file.exists():
-                    inventories.append(directory.name)
-        return sorted(inventories)
+        # A hosts.yml appearing in an existing directory does not touch the
+        # parent's mtime, so only the directory scan is cached
+        directories = self._cached_scan(self.inventory_path, self._scan_inventory_dirs)
+        return [
+            name for name in directories
+            if os.path.exists(os.path.join(self.inventory_path, name, "hosts.yml"))
+        ]
     
     def validate_inventory(self, inventory: str = "production") -> bool:
         """Validate inventory syntax"""
-        inventory_path = self.inventory_path / inventory / "hosts.yml"
+        inventory_path = self._resolve_inventory(inventory)
         
-        if not inventory_path.exists():
-            self.console.print(f"[red]Inventory file not found: {inventory_path}[/red]")
+        if inventory_path is None:
+            self.console.print(f"[red]Inventory file not found: {self.inventory_path / inventory / 'hosts.yml'}[/red]")
             return False
         
-        try:
-            with open(inventory_path, 'r') as f:
-                yaml.safe_load(f)
+        # An unchanged file that validated before needs neither a read nor a parse
+        st = inventory_path.stat()
+        stat_key = (st.st_mtime_ns, st.st_size)
+        validated_file = self.cache_path / "validated.pkl"
+        validated = self._read_validated(validated_file)
+        if validated.get(str(inventory_path)) == stat_key:
             self.console.print(f"[green]✓ Inventory {inventory} is valid[/green]")
             return True
+        
+        try:
+            self._load_inventory_data(inventory_path)
         except yaml.YAMLError as e:
             self.console.print(f"[red]✗ Inventory {inventory} has YAML errors: {e}[/red]")
             return False
+        
+        validated[str(inventory_path)] = stat_key
+        try:
+            self.cache_path.mkdir(exist_ok=True)
+            with open(validated_file, 'wb') as f:
+                pickle.dump(validated, f, protocol=pickle.HIGHEST_PROTOCOL)
+        except OSError as e:
+            logger.warning(f"Could not write validation cache {validated_file}: {e}")
+        
+        self.console.print(f"[green]✓ Inventory {inventory} is valid[/green]")
+        return True
+    
+    def _read_validated(self, validated_file: Path) -> Dict[str, tuple]:
+        """Load the {path: (mtime_ns, size)} map of inventories that last validated cleanly"""
+        try:
+            with open(validated_file, 'rb') as f:
+                return pickle.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, EOFError, pickle.UnpicklingError):
+            logger.warning(f"Ignoring unreadable validation cache {validated_file}")
+            return {}
+    
+    def _load_inventory_data(self, inventory_path: Path):
+        """Parse an inventory file, memoized in-process by stat and on disk by content"""
+        st = inventory_path.stat()
+        stat_key = (st.st_mtime_ns, st.st_size)
+        cached = self._inventory_cache.get(inventory_path)
+        if cached and cached[0] == stat_key:
+            return cached[1]
+        
+        inventory_data = self._load_inventory_file(inventory_path)
+        self._inventory_cache[inventory_path] = (stat_key, inventory_data)
+        return inventory_data
+    
+    def _load_inventory_file(self, inventory_path: Path):
+        """Parse an inventory file, reusing a pickled parse while its content is unchanged"""
+        content = inventory_path.read_bytes()
+        digest = hashlib.blake2b(content, digest_size=INVENTORY_DIGEST_SIZE).hexdigest()
+        cache_prefix = f"inv_v{INVENTORY_CACHE_VERSION}_{inventory_path.parent.name}_"
+        cache_file = self.cache_path / f"{cache_prefix}{digest}.pkl"
+        
+        if cache_file.exists():
+            try:
+                with open(cache_file, 'rb') as f:
+                    return pickle.load(f)
+            except (OSError, EOFError, pickle.UnpicklingError):
+                logger.warning(f"Ignoring unreadable inventory cache {cache_file}")
+        
+        # Only successful parses are cached, so a hit also implies valid YAML
+        inventory_data = yaml.load(content, Loader=SafeLoader)
+        
+        try:
+            self.cache_path.mkdir(exist_ok=True)
+            # Match the digest exactly, so 'prod' never evicts 'prod_east'
+            stale_re = re.compile(rf"{re.escape(cache_prefix)}[0-9a-f]{{{INVENTORY_DIGEST_SIZE * 2}}}\.pkl")
+            for stale_file in self.cache_path.glob(f"{cache_prefix}*.pkl"):
+                if stale_re.fullmatch(stale_file.name):
+                    stale_file.unlink()
+            with open(cache_file, 'wb') as f:
+                pickle.dump(inventory_data, f, protocol=pickle.HIGHEST_PROTOCOL)
+        except OSError as e:
+            logger.warning(f"Could not write inventory cache {cache_file}: {e}")
+        
+        return inventory_data
+    
+    def _resolve_hosts(self, pattern: str, inventory_arg: str, limit: str = None) -> List[str]:
+        """Expand a host pattern against an inventory with a single --list-hosts call"""
+        cmd = ["ansible", pattern, "--list-hosts", "-i", inventory_arg]
+        if limit:
+            cmd.extend(["--limit", limit])
+        
+        result = subprocess.run(cmd, capture_output=True, cwd=self._cwd,
+                                close_fds=_CLOSE_FDS, env=self._subprocess_env)
+        if result.returncode != 0:
+            return []
+        
+        # First line is the "hosts (N):" header
+        lines = result.stdout.decode(errors="replace").splitlines()
+        return [line.strip() for line in lines[1:] if line.strip()]
+    
+    async def _run_sharded(self, cmd: List[str], shards: List[List[str]], env: Dict[str, str] = None) -> List[tuple]:
+        """Run cmd once per host shard, all shards concurrently"""
+        
+        async def run_shard(hosts: List[str]) -> tuple:
+            process = await asyncio.create_subprocess_exec(
+                *cmd, "--limit", ",".join(hosts),
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                cwd=self._cwd,
+                close_fds=_CLOSE_FDS,
+                env=env or self._subprocess_env
+            )
+            stdout, stderr = await process.communicate()
+            return process.returncode, stdout, stderr
+        
+        return await asyncio.gather(*(run_shard(hosts) for hosts in shards))
+    
+    def _ping_results(self, stdout: bytes) -> Iterator[tuple]:
+        """Yield (host, reachable) pairs from json-callback ping output"""
+        try:
+            data = orjson.loads(stdout) if orjson is not None else json.loads(stdout)
+        except ValueError:
+            logger.warning("Could not decode ansible JSON output")
+            return
+        
+        for play in data.get("plays", []):
+            for task in play.get("tasks", []):
+                for host, result in task.get("hosts", {}).items():
+                    yield host, not (result.get("unreachable") or result.get("failed"))
     
     def check_connectivity(self, 
                           inventory: str = "production",
                           limit: str = None,
-                          timeout: int = 10) -> Dict:
-        """Check connectivity to all hosts in inventory"""
+                          timeout: int = 10,
+                          shards: int = 1,
+                          console: Optional[Console] = None) -> Dict:
+        """Check connectivity to all hosts in inventory, reporting to console (default: the runner's)"""
         
-        cmd = ["ansible", "all", "-m", "ping", "-f", "20", "--timeout", str(timeout)]
+        cmd = ["ansible", "all", "-m", "ping", "--timeout", str(timeout)]
         
-        inventory_path = self.inventory_path / inventory / "hosts.yml"
-        if inventory_path.exists():
-            cmd.extend(["-i", str(inventory_path)])
-        else:
-            cmd.extend(["-i", inventory])
+        inventory_arg = self._inventory_arg(inventory)
+        cmd.extend(["-i", inventory_arg])
         
-        if limit:
-            cmd.extend(["--limit", limit])
+        console = console or self.console
+        console.print(f"[bold blue]Checking connectivity...[/bold blue]")
         
-        self.console.print(f"[bold blue]Checking connectivity...[/bold blue]")
+        # One JSON document per run instead of scraping the human-readable output
+        env = {
+            **self._subprocess_env,
+            "ANSIBLE_STDOUT_CALLBACK": "json",
+            "ANSIBLE_LOAD_CALLBACK_PLUGINS": "True",
+        }
         
         try:
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                cwd=self.base_path
-            )
-            
-            # Parse results
-            lines = result.stdout.split('\n')
             successful_hosts = []
             failed_hosts = []
             
-            for line in lines:
-                if 'SUCCESS' in line:
-                    host = line.split()[0]
-                    successful_hosts.append(host)
-                elif 'UNREACHABLE' in line or 'FAILED' in line:
-                    host = line.split()[0]
-                    failed_hosts.append(host)
+            # Large inventories outgrow a single controller's fork loop, so
+            # split the resolved hosts across several ansible processes
+            hosts = self._resolve_hosts("all", inventory_arg, limit) if shards > 1 else []
+            if len(hosts) > 1:
+                shard_size = -(-len(hosts) // shards)
+                host_shards = [hosts[i:i + shard_size] for i in range(0, len(hosts), shard_size)]
+                outputs = [stdout for _, stdout, _ in asyncio.run(self._run_sharded(cmd, host_shards, env))]
+            else:
+                if limit:
+                    cmd.extend(["--limit", limit])
+                result = subprocess.run(cmd, capture_output=True, cwd=self._cwd, close_fds=_CLOSE_FDS, env=env)
+                outputs = [result.stdout]
+            
+            for stdout in outputs:
+                for host, reachable in self._ping_results(stdout):
+                    (successful_hosts if reachable else failed_hosts).append(host)
             
             # Display results table
             table = Table(title="Connectivity Check Results")
@@ -302,17 +607,17 @@ class AnsibleRunner:
             table.add_column("Hosts")
             
             table.add_row(
-                "[green]✓ Reachable[/green]", 
+                _REACHABLE_LABEL, 
                 str(len(successful_hosts)),
-                ", ".join(successful_hosts[:10]) + ("..." if len(successful_hosts) > 10 else "")
+                Text(", ".join(successful_hosts[:10]) + ("..." if len(successful_hosts) > 10 else ""))
             )
             table.add_row(
-                "[red]✗ Unreachable[/red]", 
+                _UNREACHABLE_LABEL, 
                 str(len(failed_hosts)),
-                ", ".join(failed_hosts[:10]) + ("..." if len(failed_hosts) > 10 else "")
+                Text(", ".join(failed_hosts[:10]) + ("..." if len(failed_hosts) > 10 else ""))
             )
             
-            self.console.print(table)
+            console.print(table)
             
             return {
                 "successful_hosts": successful_hosts,
@@ -327,36 +632,36 @@ class AnsibleRunner:
     
     def display_inventory_tree(self, inventory: str = "production"):
         """Display inventory structure as a tree"""
-        inventory_path = self.inventory_path / inventory / "hosts.yml"
+        inventory_path = self._resolve_inventory(inventory)
         
-        if not inventory_path.exists():
-            self.console.print(f"[red]Inventory file not found: {inventory_path}[/red]")
+        if inventory_path is None:
+            self.console.print(f"[red]Inventory file not found: {self.inventory_path / inventory / 'hosts.yml'}[/red]")
             return
         
         try:
-            with open(inventory_path, 'r') as f:
-                inventory_data = yaml.safe_load(f)
+            inventory_data = self._load_inventory_data(inventory_path)
             
-            tree = Tree(f"[bold blue]Inventory: {inventory}[/bold blue]")
+            tree = Tree(Text(f"Inventory: {inventory}", style="bold blue"))
             
+            # Names come from YAML, so wrap them in Text rather than markup
             def add_group_to_tree(parent_node, group_name, group_data):
                 if isinstance(group_data, dict):
-                    group_node = parent_node.add(f"[yellow]{group_name}[/yellow]")
+                    group_node = parent_node.add(Text(str(group_name), style="yellow"))
                     
                     if 'hosts' in group_data:
-                        hosts_node = group_node.add("[green]hosts[/green]")
+                        hosts_node = group_node.add(_HOSTS_LABEL)
                         for host_name in group_data['hosts']:
-                            hosts_node.add(f"[cyan]{host_name}[/cyan]")
+                            hosts_node.add(Text(str(host_name), style="cyan"))
                     
                     if 'children' in group_data:
-                        children_node = group_node.add("[magenta]children[/magenta]")
+                        children_node = group_node.add(_CHILDREN_LABEL)
                         for child_name, child_data in group_data['children'].items():
                             add_group_to_tree(children_node, child_name, child_data)
                     
                     if 'vars' in group_data:
-                        vars_node = group_node.add("[blue]vars[/blue]")
+                        vars_node = group_node.add(_VARS_LABEL)
                         for var_name in group_data['vars']:
-                            vars_node.add(f"{var_name}")
+                            vars_node.add(Text(str(var_name)))
             
             if 'all' in inventory_data:
                 add_group_to_tree(tree, 'all', inventory_data['all'])
@@ -369,10 +674,90 @@ class AnsibleRunner:
         except Exception as e:
             self.console.print(f"[red]Error reading inventory: {e}[/red]")
 
+def _cmd_playbook(runner: AnsibleRunner, args):
+    """Run a playbook and exit with its status"""
+    extra_vars = {}
+    if args.extra_vars:
+        for var in args.extra_vars:
+            key, value = var.split("=", 1)
+            extra_vars[key] = value
+    
+    result = runner.run_playbook(
+        playbook_name=args.name,
+        inventory=args.inventory,
+        limit=args.limit,
+        tags=args.tags,
+        skip_tags=args.skip_tags,
+        extra_vars=extra_vars,
+        dry_run=args.check,
+        verbose=args.verbose,
+        use_mitogen=not args.no_mitogen
+    )
+    
+    if args.json:
+        print(runner.result_to_json(result))
+    
+    sys.exit(0 if result["success"] else 1)
+
+def _cmd_adhoc(runner: AnsibleRunner, args):
+    """Run an ad-hoc command and exit with its status"""
+    result = runner.run_ad_hoc_command(
+        hosts=args.hosts,
+        module=args.module,
+        args=args.args,
+        inventory=args.inventory,
+        become=args.become
+    )
+    
+    if args.json:
+        print(runner.result_to_json(result))
+    
+    sys.exit(0 if result["success"] else 1)
+
+def _print_names(runner: AnsibleRunner, title: str, names: List[str]):
+    """Print a list of names, plain when stdout is not a terminal"""
+    if not sys.stdout.isatty():
+        if names:
+            print("\n".join(names))
+        return
+    runner.console.print(f"[bold blue]{title}:[/bold blue]")
+    for name in names:
+        runner.console.print(f"  • {name}")
+
+def _cmd_list_playbooks(runner: AnsibleRunner, args):
+    """List available playbooks"""
+    _print_names(runner, "Available Playbooks", runner.list_playbooks())
+
+def _cmd_list_inventories(runner: AnsibleRunner, args):
+    """List available inventories"""
+    _print_names(runner, "Available Inventories", runner.list_inventories())
+
+def _cmd_inventory(runner: AnsibleRunner, args):
+    """Validate or display an inventory"""
+    if args.action == "validate":
+        runner.validate_inventory(args.inventory)
+    elif args.action == "tree":
+        runner.display_inventory_tree(args.inventory)
+
+def _cmd_ping(runner: AnsibleRunner, args):
+    """Check host connectivity"""
+    runner.check_connectivity(args.inventory, args.limit, args.timeout, args.shards)
+
+COMMANDS = {
+    "playbook": _cmd_playbook,
+    "adhoc": _cmd_adhoc,
+    "list-playbooks": _cmd_list_playbooks,
+    "list-inventories": _cmd_list_inventories,
+    "inventory": _cmd_inventory,
+    "ping": _cmd_ping,
+}
+
 def main():
     """Main CLI interface"""
     parser = argparse.ArgumentParser(description="Ansible Runner - Execute Ansible operations")
     parser.add_argument("--base-path", help="Base path for Ansible project")
+    parser.add_argument("--forks", type=int, default=20, help="Parallel processes per ansible run")
+    parser.add_argument("--poll-interval", type=float, default=0.01, help="Ansible internal worker poll interval in seconds")
     
     subparsers = parser.add_subparsers(dest="command", help="Available commands")
     
@@ -386,6 +771,8 @@ def main():
     playbook_parser.add_argument("-e", "--extra-vars", action="append", help="Extra variables (key=value)")
     playbook_parser.add_argument("-c", "--check", action="store_true", help="Run in check mode")
     playbook_parser.add_argument("-v", "--verbose", action="count", default=0, help="Verbose output")
+    playbook_parser.add_argument("--no-mitogen", action="store_true", help="Use the stock strategy even if Mitogen is installed")
+    playbook_parser.add_argument("--json", action="store_true", help="Print the execution result as JSON")
     
     # Ad-hoc command
     adhoc_parser = subparsers.add_parser("adhoc", help="Run ad-hoc command")
@@ -394,6 +781,7 @@ def main():
     adhoc_parser.add_argument("-a", "--args", default="", help="Module arguments")
     adhoc_parser.add_argument("-i", "--inventory", default="production", help="Inventory to use")
     adhoc_parser.add_argument("-b", "--become", action="store_true", help="Use privilege escalation")
+    adhoc_parser.add_argument("--json", action="store_true", help="Print the execution result as JSON")
     
     # List commands
     subparsers.add_parser("list-playbooks", help="List available playbooks")
@@ -409,6 +797,7 @@ def main():
     ping_parser.add_argument("-i", "--inventory", default="production", help="Inventory to use")
     ping_parser.add_argument("-l", "--limit", help="Limit to specific hosts")
     ping_parser.add_argument("--timeout", type=int, default=10, help="Connection timeout")
+    ping_parser.add_argument("--shards", type=int, default=1, help="Split hosts across this many parallel ansible processes")
     
     args = parser.parse_args()
     
@@ -417,60 +806,10 @@ def main():
         return
     
     # Initialize runner
-    runner = AnsibleRunner(args.base_path)
+    runner = AnsibleRunner(args.base_path, forks=args.forks, poll_interval=args.poll_interval)
     
     try:
-        if args.command == "playbook":
-            extra_vars = {}
-            if args.extra_vars:
-                for var in args.extra_vars:
-                    key, value = var.split("=", 1)
-                    extra_vars[key] = value
-            
-            result = runner.run_playbook(
-                playbook_name=args.name,
-                inventory=args.inventory,
-                limit=args.limit,
-                tags=args.tags,
-                skip_tags=args.skip_tags,
-                extra_vars=extra_vars,
-                dry_run=args.check,
-                verbose=args.verbose
-            )
-            
-            sys.exit(0 if result["success"] else 1)
-        
-        elif args.command == "adhoc":
-            result = runner.run_ad_hoc_command(
-                hosts=args.hosts,
-                module=args.module,
-                args=args.args,
-                inventory=args.inventory,
-                become=args.become
-            )
-            
-            sys.exit(0 if result["success"] else 1)
-        
-        elif args.command == "list-playbooks":
-            playbooks = runner.list_playbooks()
-            runner.console.print("[bold blue]Available Playbooks:[/bold blue]")
-            for playbook in playbooks:
-                runner.console.print(f"  • {playbook}")
-        
-        elif args.command == "list-inventories":
-            inventories = runner.list_inventories()
-            runner.console.print("[bold blue]Available Inventories:[/bold blue]")
-            for inventory in inventories:
-                runner.console.print(f"  • {inventory}")
-        
-        elif args.command == "inventory":
-            if args.action == "validate":
-                runner.validate_inventory(args.inventory)
-            elif args.action == "tree":
-                runner.display_inventory_tree(args.inventory)
-        
-        elif args.command == "ping":
-            runner.check_connectivity(args.inventory, args.limit, args.timeout)
+        COMMANDS[args.command](runner, args)
     
     except Exception as e:
         runner.console.print(f"[bold red]Error: {str(e)}[/bold red]")
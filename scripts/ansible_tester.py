@@ -8,13 +8,21 @@ Supports syntax checking, dry runs, and validation tests
 import os
 import sys
 import argparse
+import asyncio
 import subprocess
 import yaml
 import json
+import re
 import time
+import hashlib
+import tempfile
+from collections import Counter
+import shutil
+import importlib.metadata
+import importlib.util
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Optional, Union, Tuple
-from concurrent.futures import ThreadPoolExecutor, as_completed
 from rich.console import Console
 from rich.table import Table
 from rich.progress import Progress, TaskID
@@ -22,22 +30,370 @@ from rich.panel import Panel
 from rich.tree import Tree
 import logging
 
+# Prefer the libyaml-backed loader; fall back to the pure-Python one
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+# Optional faster JSON decoder for ansible-inventory and callback output
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Optional incremental JSON parser, so huge inventories are counted, not loaded
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
 # Setup logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Concurrent ansible-playbook processes when checking playbooks one by one.
+# Each check is mostly interpreter and plugin-loader startup, so one per core.
+SYNTAX_CHECK_CONCURRENCY = os.cpu_count() or 4
+DRY_RUN_CONCURRENCY = 2
+
+# ansible-inventory output larger than this is streamed through ijson
+INVENTORY_STREAM_THRESHOLD = 1024 * 1024
+
+# Rows per detailed results table when printing to a terminal
+RESULTS_TABLE_ROWS = 200
+
+# Rich markup for each result status
+_STATUS_STYLE = {
+    "PASS": "[green]PASS[/green]",
+    "FAIL": "[red]FAIL[/red]",
+    "ERROR": "[magenta]ERROR[/magenta]",
+    "WARN": "[yellow]WARN[/yellow]",
+    "SKIP": "[blue]SKIP[/blue]",
+    "TIMEOUT": "[red]TIMEOUT[/red]"
+}
+
+# Below this many roles, worker start-up costs more than it saves
+ROLE_POOL_THRESHOLD = 32
+
+# "host | SUCCESS => {" lines, for when the json callback could not be used
+PING_RE = re.compile(rb"^(\S+)\s*\|\s*(SUCCESS|UNREACHABLE|FAILED)", re.M)
+
+def _ansible_version() -> str:
+    """Identify the installed Ansible without starting it"""
+    for dist in ("ansible-core", "ansible-base", "ansible"):
+        try:
+            return f"{dist}-{importlib.metadata.version(dist)}"
+        except importlib.metadata.PackageNotFoundError:
+            continue
+    
+    # Not pip-installed in this interpreter; fall back to the executable itself
+    executable = shutil.which("ansible-playbook")
+    return f"{executable}:{os.stat(executable).st_mtime_ns}" if executable else "unknown"
+
+def _host_run_env() -> Dict[str, str]:
+    """Environment for ansible runs that touch hosts: more forks, Mitogen when installed"""
+    env = {**os.environ, "ANSIBLE_FORKS": str(max(20, (os.cpu_count() or 1) * 4))}
+    
+    # Pipelining and ControlPersist already come from ansible.cfg
+    spec = importlib.util.find_spec("ansible_mitogen")
+    if spec is not None and spec.origin and "ANSIBLE_STRATEGY" not in os.environ:
+        strategy_path = Path(spec.origin).parent / "plugins" / "strategy"
+        if strategy_path.is_dir():
+            env["ANSIBLE_STRATEGY"] = "mitogen_linear"
+            env["ANSIBLE_STRATEGY_PLUGINS"] = os.pathsep.join(
+                filter(None, [str(strategy_path), os.environ.get("ANSIBLE_STRATEGY_PLUGINS")])
+            )
+    
+    return env
+
+def _validate_role(role_path: str) -> Dict:
+    """Check one role's layout and main.yml files; module-level so worker processes can run it"""
+    role_path = Path(role_path)
+    start_time = time.time()
+    role_name = role_path.name
+    
+    # One directory read per role instead of a stat per expected path
+    with os.scandir(role_path) as entries:
+        role_dirs = {entry.name for entry in entries if entry.is_dir()}
+    
+    # Check role structure
+    required_dirs = ['tasks', 'handlers', 'vars', 'defaults', 'meta', 'templates', 'files']
+    missing_dirs = [d for d in required_dirs if d not in role_dirs]
+    
+    # Check main.yml files
+    main_files = ['tasks/main.yml', 'handlers/main.yml', 'vars/main.yml', 
+                 'defaults/main.yml', 'meta/main.yml']
+    missing_main_files = []
+    invalid_yaml_files = []
+    
+    for main_file in main_files:
+        file_path = role_path / main_file
+        if file_path.parent.name in role_dirs and file_path.is_file():
+            try:
+                with open(file_path, 'rb') as f:
+                    yaml.load(f, Loader=SafeLoader)
+            except yaml.YAMLError:
+                invalid_yaml_files.append(main_file)
+        else:
+            if main_file in ['tasks/main.yml', 'meta/main.yml']:  # Required files
+                missing_main_files.append(main_file)
+    
+    duration = time.time() - start_time
+    
+    # Determine status
+    if missing_main_files or invalid_yaml_files:
+        status = "FAIL"
+        message_parts = []
+        if missing_main_files:
+            message_parts.append(f"Missing required files: {', '.join(missing_main_files)}")
+        if invalid_yaml_files:
+            message_parts.append(f"Invalid YAML files: {', '.join(invalid_yaml_files)}")
+        message = "; ".join(message_parts)
+    elif missing_dirs:
+        status = "WARN"
+        message = f"Missing optional directories: {', '.join(missing_dirs)}"
+    else:
+        status = "PASS"
+        message = "Role structure valid"
+    
+    return {
+        "test": "role_validation",
+        "role": role_name,
+        "status": status,
+        "message": message,
+        "duration": duration
+    }
+
 class AnsibleTester:
     """Comprehensive Ansible testing framework"""
     
     def __init__(self, base_path: str = None):
         self.console = Console()
+        self._is_terminal = self.console.is_terminal
         self.base_path = Path(base_path) if base_path else Path.cwd()
         self.playbook_path = self.base_path / "playbooks"
         self.inventory_path = self.base_path / "inventories"
+        self.roles_path = self.base_path / "roles"
         self.test_results = []
+        self._inv_cache = {}
+        self._playbook_files_cache = None
+        self._host_env = _host_run_env()
+        self._ansible_api = None
+        
+        # Playbooks that passed syntax checks in earlier runs, by content hash
+        self._result_cache_path = self.base_path / ".ansible_tester_cache.json"
+        try:
+            self._result_cache = json.loads(self._result_cache_path.read_text())
+        except (OSError, ValueError):
+            self._result_cache = {}
+        
+    async def _exec_async(self, cmd: List[str], semaphore: asyncio.Semaphore = None,
+                          timeout: float = None, env: Dict[str, str] = None,
+                          capture_stdout: bool = True) -> Tuple[int, str, str]:
+        """Run cmd without blocking the event loop; return (returncode, stdout, stderr)"""
+        # nullcontext only supports async with from Python 3.10, so branch explicitly
+        if semaphore is None:
+            return await self._spawn_and_wait(cmd, timeout, env, capture_stdout)
+        async with semaphore:
+            return await self._spawn_and_wait(cmd, timeout, env, capture_stdout)
+    
+    async def _spawn_and_wait(self, cmd: List[str], timeout: float, env: Dict[str, str],
+                              capture_stdout: bool) -> Tuple[int, str, str]:
+        """Spawn cmd and collect its output, killing it on timeout or cancellation"""
+        process = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE if capture_stdout else asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.PIPE,
+            cwd=self.base_path,
+            env=env
+        )
+        try:
+            stdout, stderr = await asyncio.wait_for(process.communicate(), timeout)
+        except (asyncio.TimeoutError, asyncio.CancelledError):
+            process.kill()
+            await process.wait()
+            raise
+        
+        return process.returncode, (stdout or b"").decode(errors="replace"), stderr.decode(errors="replace")
+    
+    @staticmethod
+    async def _gather_results(coros, fail_fast: bool = False) -> List[Dict]:
+        """Await test coroutines; with fail_fast, cancel the rest after the first non-PASS"""
+        if not fail_fast:
+            return list(await asyncio.gather(*coros))
+        
+        tasks = [asyncio.create_task(coro) for coro in coros]
+        results = []
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                result = await next_done
+                results.append(result)
+                if result["status"] != "PASS":
+                    break
+        finally:
+            # Cancelling a task kills its ansible-playbook child in _exec_async
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+        
+        return results
+    
+    def syntax_check_playbook(self, playbook_name: str, fast: bool = False) -> Dict:
+        """Check playbook syntax; fast mode only parses the YAML in-process"""
+        if fast:
+            return self._fast_syntax_check(playbook_name)
+        return self._run_syntax_tests(playbooks=[self.playbook_path / playbook_name])[0]
+    
+    def _syntax_fingerprint(self) -> str:
+        """Ansible version plus the stat of every role, playbook and shared task file"""
+        digest = hashlib.sha256(_ansible_version().encode())
+        
+        # Playbooks can import_playbook their top-level siblings (site.yml does),
+        # so a change anywhere under playbooks/ or roles/ invalidates every result
+        roots = [self.roles_path, self.playbook_path]
+        
+        for root in sorted(roots):
+            for dirpath, dirnames, filenames in os.walk(root):
+                dirnames.sort()
+                for name in sorted(filenames):
+                    st = os.stat(os.path.join(dirpath, name))
+                    digest.update(f"{dirpath}/{name}:{st.st_mtime_ns}:{st.st_size}\n".encode())
+        
+        return digest.hexdigest()
+    
+    def _save_result_cache(self, keys: List[str] = None):
+        """Write the syntax result cache, keeping only keys when given"""
+        if keys is not None:
+            self._result_cache = {key: self._result_cache[key] for key in keys if key in self._result_cache}
+        try:
+            self._result_cache_path.write_text(json.dumps(self._result_cache))
+        except OSError as e:
+            logger.warning(f"Could not write result cache {self._result_cache_path}: {e}")
+    
+    def _fast_syntax_check(self, playbook_name: str) -> Dict:
+        """Load the playbook with the in-process Ansible API, or just parse its YAML"""
+        if self._ansible_api is None:
+            self._ansible_api = self._init_ansible_api()
+        if self._ansible_api:
+            return self._api_syntax_check(playbook_name)
+        return self._yaml_syntax_check(playbook_name)
+    
+    def _init_ansible_api(self):
+        """DataLoader and VariableManager for in-process playbook loading, or False"""
+        if importlib.util.find_spec("ansible") is None:
+            return False
+        
+        # Ansible reads its configuration on import; use the project's ansible.cfg
+        config_path = self.base_path / "ansible.cfg"
+        if config_path.exists():
+            os.environ.setdefault("ANSIBLE_CONFIG", str(config_path))
+        # No inventory is needed to load a playbook, so don't warn about its absence
+        os.environ.setdefault("ANSIBLE_INVENTORY_UNPARSED_WARNING", "False")
+        
+        from ansible.parsing.dataloader import DataLoader
+        from ansible.inventory.manager import InventoryManager
+        from ansible.vars.manager import VariableManager
+        try:
+            # ansible-core 2.15+ needs the collection loader set up explicitly
+            from ansible.plugins.loader import init_plugin_loader
+            init_plugin_loader()
+        except ImportError:
+            pass
+        
+        loader = DataLoader()
+        loader.set_basedir(str(self.base_path))
+        inventory = InventoryManager(loader=loader, sources=[])
+        return loader, VariableManager(loader=loader, inventory=inventory)
+    
+    def _api_syntax_check(self, playbook_name: str) -> Dict:
+        """Load a playbook with Playbook.load, as --syntax-check does, without a subprocess"""
+        from ansible.errors import AnsibleError
+        from ansible.playbook import Playbook
         
-    def syntax_check_playbook(self, playbook_name: str) -> Dict:
-        """Check playbook syntax"""
+        playbook_path = self.playbook_path / playbook_name
+        start_time = time.time()
+        
+        if not playbook_path.exists():
+            return {
+                "test": "syntax_check",
+                "playbook": playbook_name,
+                "status": "FAIL",
+                "message": f"Playbook not found: {playbook_path}",
+                "duration": 0
+            }
+        
+        loader, variable_manager = self._ansible_api
+        try:
+            Playbook.load(str(playbook_path), variable_manager=variable_manager, loader=loader)
+        except AnsibleError as e:
+            # Older ansible-core puts the file, line and column in the message;
+            # 2.19+ keeps them apart as source context
+            message = str(e)
+            source_context = getattr(e, "_formatted_source_context", None)
+            if source_context:
+                message += "\n" + source_context
+            return {
+                "test": "syntax_check",
+                "playbook": playbook_name,
+                "status": "FAIL",
+                "message": message,
+                "duration": time.time() - start_time
+            }
+        except Exception as e:
+            return {
+                "test": "syntax_check",
+                "playbook": playbook_name,
+                "status": "ERROR",
+                "message": str(e),
+                "duration": time.time() - start_time
+            }
+        
+        return {
+            "test": "syntax_check",
+            "playbook": playbook_name,
+            "status": "PASS",
+            "message": "Syntax check passed (in-process)",
+            "duration": time.time() - start_time
+        }
+    
+    def _yaml_syntax_check(self, playbook_name: str) -> Dict:
+        """Parse a playbook with the C YAML loader instead of starting ansible-playbook"""
+        playbook_path = self.playbook_path / playbook_name
+        start_time = time.time()
+        
+        try:
+            with open(playbook_path, 'rb') as f:
+                yaml.load(f, Loader=SafeLoader)
+        except FileNotFoundError:
+            return {
+                "test": "syntax_check",
+                "playbook": playbook_name,
+                "status": "FAIL",
+                "message": f"Playbook not found: {playbook_path}",
+                "duration": 0
+            }
+        except yaml.YAMLError as e:
+            mark = getattr(e, "problem_mark", None)
+            location = f" at line {mark.line + 1}, column {mark.column + 1}" if mark else ""
+            return {
+                "test": "syntax_check",
+                "playbook": playbook_name,
+                "status": "FAIL",
+                "message": f"YAML syntax error{location}: {getattr(e, 'problem', None) or e}",
+                "duration": time.time() - start_time
+            }
+        
+        return {
+            "test": "syntax_check",
+            "playbook": playbook_name,
+            "status": "PASS",
+            "message": "YAML syntax valid (fast mode)",
+            "duration": time.time() - start_time
+        }
+    
+    async def _syntax_check_async(self, playbook_name: str, semaphore: asyncio.Semaphore = None) -> Dict:
+        """Check playbook syntax, sharing semaphore with other concurrent checks"""
         playbook_path = self.playbook_path / playbook_name
         
         if not playbook_path.exists():
@@ -54,16 +410,12 @@ class AnsibleTester:
         cmd = ["ansible-playbook", "--syntax-check", str(playbook_path)]
         
         try:
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                cwd=self.base_path
-            )
+            # Only stderr matters for a syntax check
+            returncode, _, stderr = await self._exec_async(cmd, semaphore, capture_stdout=False)
             
             duration = time.time() - start_time
             
-            if result.returncode == 0:
+            if returncode == 0:
                 return {
                     "test": "syntax_check",
                     "playbook": playbook_name,
@@ -76,7 +428,7 @@ class AnsibleTester:
                     "test": "syntax_check",
                     "playbook": playbook_name,
                     "status": "FAIL",
-                    "message": result.stderr,
+                    "message": stderr,
                     "duration": duration
                 }
                 
@@ -94,6 +446,14 @@ class AnsibleTester:
                         inventory: str = "production",
                         limit: str = None) -> Dict:
         """Run playbook in check mode (dry run)"""
+        return asyncio.run(self._dry_run_async(playbook_name, inventory, limit))
+    
+    async def _dry_run_async(self,
+                             playbook_name: str,
+                             inventory: str = "production",
+                             limit: str = None,
+                             semaphore: asyncio.Semaphore = None) -> Dict:
+        """Run playbook in check mode, sharing semaphore with other concurrent runs"""
         playbook_path = self.playbook_path / playbook_name
         
         if not playbook_path.exists():
@@ -121,36 +481,32 @@ class AnsibleTester:
             cmd.extend(["--limit", limit])
         
         try:
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                cwd=self.base_path,
-                timeout=300  # 5 minute timeout
+            returncode, stdout, stderr = await self._exec_async(
+                cmd, semaphore, timeout=300, env=self._host_env  # 5 minute timeout
             )
             
             duration = time.time() - start_time
             
-            if result.returncode == 0:
+            if returncode == 0:
                 return {
                     "test": "dry_run",
                     "playbook": playbook_name,
                     "status": "PASS",
                     "message": "Dry run completed successfully",
                     "duration": duration,
-                    "output": result.stdout
+                    "output": stdout
                 }
             else:
                 return {
                     "test": "dry_run",
                     "playbook": playbook_name,
                     "status": "FAIL",
-                    "message": result.stderr,
+                    "message": stderr,
                     "duration": duration,
-                    "output": result.stdout
+                    "output": stdout
                 }
                 
-        except subprocess.TimeoutExpired:
+        except asyncio.TimeoutError:
             return {
                 "test": "dry_run",
                 "playbook": playbook_name,
@@ -183,42 +539,25 @@ class AnsibleTester:
             }
         
         try:
-            # Check YAML syntax
-            with open(inventory_path, 'r') as f:
-                yaml.safe_load(f)
-            
-            # Test inventory with ansible-inventory
-            cmd = ["ansible-inventory", "-i", str(inventory_path), "--list"]
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                cwd=self.base_path
-            )
+            host_count = self._inventory_host_count(inventory_path)
             
-            duration = time.time() - start_time
-            
-            if result.returncode == 0:
-                inventory_data = json.loads(result.stdout)
-                host_count = len(inventory_data.get('_meta', {}).get('hostvars', {}))
-                
-                return {
-                    "test": "inventory_validation",
-                    "inventory": inventory,
-                    "status": "PASS",
-                    "message": f"Inventory valid with {host_count} hosts",
-                    "duration": duration,
-                    "host_count": host_count
-                }
-            else:
-                return {
-                    "test": "inventory_validation",
-                    "inventory": inventory,
-                    "status": "FAIL",
-                    "message": result.stderr,
-                    "duration": duration
-                }
+            return {
+                "test": "inventory_validation",
+                "inventory": inventory,
+                "status": "PASS",
+                "message": f"Inventory valid with {host_count} hosts",
+                "duration": time.time() - start_time,
+                "host_count": host_count
+            }
                 
+        except subprocess.CalledProcessError as e:
+            return {
+                "test": "inventory_validation",
+                "inventory": inventory,
+                "status": "FAIL",
+                "message": e.stderr,
+                "duration": time.time() - start_time
+            }
         except yaml.YAMLError as e:
             return {
                 "test": "inventory_validation",
@@ -236,6 +575,77 @@ class AnsibleTester:
                 "duration": time.time() - start_time
             }
     
+    def _inventory_host_count(self, inventory_path: Path) -> int:
+        """Count the hosts ansible-inventory --list reports, cached until the file changes"""
+        key = (str(inventory_path), inventory_path.stat().st_mtime_ns)
+        if key in self._inv_cache:
+            return self._inv_cache[key]
+        
+        # Check YAML syntax
+        with open(inventory_path, 'r') as f:
+            yaml.safe_load(f)
+        
+        # Test inventory with ansible-inventory. stderr goes to a file so that
+        # warnings cannot fill the pipe while stdout is still being read.
+        cmd = ["ansible-inventory", "-i", str(inventory_path), "--list"]
+        with tempfile.TemporaryFile() as stderr_file:
+            with subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=stderr_file,
+                                  cwd=self.base_path) as proc:
+                head = proc.stdout.read(INVENTORY_STREAM_THRESHOLD)
+                if len(head) < INVENTORY_STREAM_THRESHOLD:
+                    host_count = None
+                elif ijson is not None:
+                    host_count = self._stream_host_count(head, proc.stdout)
+                else:
+                    head += proc.stdout.read()
+                    host_count = None
+                returncode = proc.wait()
+            
+            if returncode != 0:
+                stderr_file.seek(0)
+                raise subprocess.CalledProcessError(
+                    returncode, cmd, None, stderr_file.read().decode(errors="replace")
+                )
+        
+        if host_count is None:
+            # Small output: a full parse of the raw bytes is faster than streaming
+            inventory_data = orjson.loads(head) if orjson is not None else json.loads(head)
+            host_count = len(inventory_data.get('_meta', {}).get('hostvars', {}))
+        
+        self._inv_cache[key] = host_count
+        return host_count
+    
+    @staticmethod
+    def _stream_host_count(head: bytes, stream) -> int:
+        """Count _meta.hostvars keys with ijson, holding only one host's vars at a time"""
+        events = ijson.sendable_list()
+        parser = ijson.kvitems_coro(events, "_meta.hostvars")
+        host_count = 0
+        chunk = head
+        while chunk:
+            parser.send(chunk)
+            host_count += len(events)
+            del events[:]
+            chunk = stream.read(64 * 1024)
+        parser.close()
+        return host_count + len(events)
+    
+    def _playbook_files(self) -> List[Path]:
+        """Playbook files under playbooks/, rescanned only when the directory changes"""
+        try:
+            mtime = self.playbook_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            return []
+        
+        if self._playbook_files_cache is None or self._playbook_files_cache[0] != mtime:
+            with os.scandir(self.playbook_path) as entries:
+                playbooks = sorted(
+                    Path(entry.path) for entry in entries
+                    if entry.name.endswith((".yml", ".yaml")) and entry.is_file()
+                )
+            self._playbook_files_cache = (mtime, playbooks)
+        return list(self._playbook_files_cache[1])
+    
     def test_host_connectivity(self, 
                               inventory: str = "production",
                               limit: str = None,
@@ -243,7 +653,7 @@ class AnsibleTester:
         """Test connectivity to inventory hosts"""
         start_time = time.time()
         
-        cmd = ["ansible", "all", "-m", "ping", "-f", "20", "--timeout", str(timeout)]
+        cmd = ["ansible", "all", "-m", "ping", "--timeout", str(timeout)]
         
         inventory_path = self.inventory_path / inventory / "hosts.yml"
         if inventory_path.exists():
@@ -254,46 +664,74 @@ class AnsibleTester:
         if limit:
             cmd.extend(["--limit", limit])
         
+        # One JSON document per run instead of scraping the human-readable output
+        env = {
+            **self._host_env,
+            "ANSIBLE_STDOUT_CALLBACK": "json",
+            "ANSIBLE_LOAD_CALLBACK_PLUGINS": "True",
+        }
+        
         try:
+            # Hosts are read from stdout; stderr explains runs that fail outright
             result = subprocess.run(
                 cmd,
-                capture_output=True,
-                text=True,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
                 cwd=self.base_path,
+                env=env,
                 timeout=timeout * 2  # Allow extra time for overall command
             )
             
             duration = time.time() - start_time
             
             # Parse results
-            lines = result.stdout.split('\n')
             successful_hosts = []
             failed_hosts = []
             
-            for line in lines:
-                if 'SUCCESS' in line:
-                    host = line.split()[0]
-                    successful_hosts.append(host)
-                elif 'UNREACHABLE' in line or 'FAILED' in line:
-                    host = line.split()[0] if line.split() else 'unknown'
-                    failed_hosts.append(host)
+            try:
+                data = orjson.loads(result.stdout) if orjson is not None else json.loads(result.stdout)
+            except ValueError:
+                # Callback overridden or unavailable: scan the default output in one pass
+                data = {}
+                for match in PING_RE.finditer(result.stdout):
+                    host = match.group(1).decode(errors="replace")
+                    (successful_hosts if match.group(2) == b"SUCCESS" else failed_hosts).append(host)
+            
+            for play in data.get("plays", []):
+                for task in play.get("tasks", []):
+                    for host, host_result in task.get("hosts", {}).items():
+                        if host_result.get("unreachable") or host_result.get("failed"):
+                            failed_hosts.append(host)
+                        else:
+                            successful_hosts.append(host)
             
             total_hosts = len(successful_hosts) + len(failed_hosts)
             success_rate = (len(successful_hosts) / total_hosts * 100) if total_hosts > 0 else 0
             
             status = "PASS" if success_rate >= 90 else "WARN" if success_rate >= 50 else "FAIL"
+            message = f"{len(successful_hosts)}/{total_hosts} hosts reachable ({success_rate:.1f}%)"
             
-            return {
+            test_result = {
                 "test": "connectivity",
                 "inventory": inventory,
                 "status": status,
-                "message": f"{len(successful_hosts)}/{total_hosts} hosts reachable ({success_rate:.1f}%)",
+                "message": message,
                 "duration": duration,
                 "successful_hosts": successful_hosts,
                 "failed_hosts": failed_hosts,
                 "success_rate": success_rate
             }
             
+            # A bad inventory, YAML error or missing collection only shows up on stderr
+            if result.returncode != 0 or total_hosts == 0:
+                stderr = result.stderr.decode(errors="replace").strip()
+                if stderr:
+                    test_result["details"] = stderr
+                    if total_hosts == 0:
+                        test_result["message"] = f"{message}: {stderr.splitlines()[-1]}"
+            
+            return test_result
+            
         except subprocess.TimeoutExpired:
             return {
                 "test": "connectivity",
@@ -313,8 +751,6 @@ class AnsibleTester:
     
     def validate_roles(self) -> List[Dict]:
         """Validate all roles in the roles directory"""
-        results = []
-        
         if not self.roles_path.exists():
             return [{
                 "test": "role_validation",
@@ -324,70 +760,22 @@ class AnsibleTester:
                 "duration": 0
             }]
         
-        roles = [d for d in self.roles_path.iterdir() if d.is_dir()]
+        with os.scandir(self.roles_path) as entries:
+            roles = [Path(entry.path) for entry in entries if entry.is_dir()]
         
-        for role_path in roles:
-            start_time = time.time()
-            role_name = role_path.name
-            
-            # Check role structure
-            required_dirs = ['tasks', 'handlers', 'vars', 'defaults', 'meta', 'templates', 'files']
-            missing_dirs = []
-            
-            for req_dir in required_dirs:
-                if not (role_path / req_dir).exists():
-                    missing_dirs.append(req_dir)
-            
-            # Check main.yml files
-            main_files = ['tasks/main.yml', 'handlers/main.yml', 'vars/main.yml', 
-                         'defaults/main.yml', 'meta/main.yml']
-            missing_main_files = []
-            invalid_yaml_files = []
-            
-            for main_file in main_files:
-                file_path = role_path / main_file
-                if file_path.exists():
-                    try:
-                        with open(file_path, 'r') as f:
-                            yaml.safe_load(f)
-                    except yaml.YAMLError:
-                        invalid_yaml_files.append(main_file)
-                else:
-                    if main_file in ['tasks/main.yml', 'meta/main.yml']:  # Required files
-                        missing_main_files.append(main_file)
-            
-            duration = time.time() - start_time
-            
-            # Determine status
-            if missing_main_files or invalid_yaml_files:
-                status = "FAIL"
-                message_parts = []
-                if missing_main_files:
-                    message_parts.append(f"Missing required files: {', '.join(missing_main_files)}")
-                if invalid_yaml_files:
-                    message_parts.append(f"Invalid YAML files: {', '.join(invalid_yaml_files)}")
-                message = "; ".join(message_parts)
-            elif missing_dirs:
-                status = "WARN"
-                message = f"Missing optional directories: {', '.join(missing_dirs)}"
-            else:
-                status = "PASS"
-                message = "Role structure valid"
-            
-            results.append({
-                "test": "role_validation",
-                "role": role_name,
-                "status": status,
-                "message": message,
-                "duration": duration
-            })
+        # Parsing is CPU-bound, so spread large role sets across processes
+        if len(roles) >= ROLE_POOL_THRESHOLD:
+            with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+                return list(executor.map(_validate_role, map(str, roles), chunksize=4))
         
-        return results
+        return [_validate_role(str(role_path)) for role_path in roles]
     
     def run_test_suite(self, 
                       test_types: List[str] = None,
                       inventory: str = "production",
-                      parallel: bool = True) -> Dict:
+                      parallel: bool = True,
+                      show_progress: bool = True,
+                      fail_fast: bool = False) -> Dict:
         """Run comprehensive test suite"""
         
         if test_types is None:
@@ -395,15 +783,19 @@ class AnsibleTester:
         
         all_results = []
         
-        with Progress(console=self.console) as progress:
+        # Rich allows one live display per console, so callers running several
+        # suites concurrently disable the progress bar; CI logs never get one
+        with Progress(console=self.console, disable=not (show_progress and self._is_terminal)) as progress:
             main_task = progress.add_task("Running test suite...", total=len(test_types))
             
             # Run tests
             if "syntax" in test_types:
                 progress.console.print("[blue]Running syntax checks...[/blue]")
-                syntax_results = self._run_syntax_tests(parallel=parallel)
+                syntax_results = self._run_syntax_tests(parallel=parallel, fail_fast=fail_fast)
                 all_results.extend(syntax_results)
                 progress.advance(main_task)
+                if fail_fast and any(r["status"] != "PASS" for r in syntax_results):
+                    return self.summarize_results(all_results)
             
             if "inventory" in test_types:
                 progress.console.print("[blue]Validating inventory...[/blue]")
@@ -425,16 +817,20 @@ class AnsibleTester:
             
             if "dry_run" in test_types:
                 progress.console.print("[blue]Running dry run tests...[/blue]")
-                dry_run_results = self._run_dry_run_tests(inventory, parallel=parallel)
+                dry_run_results = self._run_dry_run_tests(inventory, parallel=parallel, fail_fast=fail_fast)
                 all_results.extend(dry_run_results)
                 progress.advance(main_task)
         
-        # Calculate summary
+        return self.summarize_results(all_results)
+    
+    def summarize_results(self, all_results: List[Dict]) -> Dict:
+        """Build the suite summary for a list of individual test results"""
+        counts = Counter(r["status"] for r in all_results)
         total_tests = len(all_results)
-        passed_tests = len([r for r in all_results if r["status"] == "PASS"])
-        failed_tests = len([r for r in all_results if r["status"] == "FAIL"])
-        error_tests = len([r for r in all_results if r["status"] == "ERROR"])
-        warn_tests = len([r for r in all_results if r["status"] == "WARN"])
+        passed_tests = counts["PASS"]
+        failed_tests = counts["FAIL"]
+        error_tests = counts["ERROR"]
+        warn_tests = counts["WARN"]
         
         return {
             "summary": {
@@ -448,10 +844,12 @@ class AnsibleTester:
             "results": all_results
         }
     
-    def _run_syntax_tests(self, parallel: bool = True) -> List[Dict]:
-        """Run syntax tests on all playbooks"""
-        playbooks = list(self.playbook_path.glob("*.yml")) + list(self.playbook_path.glob("*.yaml"))
-        results = []
+    def _run_syntax_tests(self, parallel: bool = True, fast: bool = False,
+                          playbooks: List[Path] = None, fail_fast: bool = False) -> List[Dict]:
+        """Run syntax tests on all playbooks, or on the given ones"""
+        full_run = playbooks is None
+        if full_run:
+            playbooks = self._playbook_files()
         
         if not playbooks:
             return [{
@@ -462,24 +860,118 @@ class AnsibleTester:
                 "duration": 0
             }]
         
-        if parallel and len(playbooks) > 1:
-            with ThreadPoolExecutor(max_workers=4) as executor:
-                future_to_playbook = {
-                    executor.submit(self.syntax_check_playbook, pb.name): pb.name 
-                    for pb in playbooks
-                }
-                
-                for future in as_completed(future_to_playbook):
-                    result = future.result()
-                    results.append(result)
-        else:
-            for playbook in playbooks:
-                result = self.syntax_check_playbook(playbook.name)
-                results.append(result)
+        if fast:
+            results = []
+            for pb in playbooks:
+                results.append(self._fast_syntax_check(pb.name))
+                if fail_fast and results[-1]["status"] != "PASS":
+                    break
+            return results
+        
+        # Unchanged playbooks that passed before are not handed to ansible again
+        fingerprint = self._syntax_fingerprint()
+        keys = {}
+        for pb in playbooks:
+            try:
+                keys[pb.name] = hashlib.sha256(pb.read_bytes()).hexdigest() + "|" + fingerprint
+            except OSError:
+                pass
+        
+        results = [{
+            "test": "syntax_check",
+            "playbook": pb.name,
+            "status": "PASS",
+            "message": "Syntax check passed (cached)",
+            "duration": 0
+        } for pb in playbooks if self._result_cache.get(keys.get(pb.name)) == "PASS"]
+        cached_names = {r["playbook"] for r in results}
+        unchecked = [pb for pb in playbooks if pb.name not in cached_names]
+        
+        if len(unchecked) == 1:
+            results.append(asyncio.run(self._syntax_check_async(unchecked[0].name)))
+        elif unchecked:
+            results.extend(self._batch_syntax_check(unchecked, parallel=parallel, fail_fast=fail_fast))
+        
+        for result in results:
+            if result["status"] == "PASS" and result["playbook"] in keys:
+                self._result_cache[keys[result["playbook"]]] = "PASS"
+        # A full run sees every current key, so it also drops stale entries
+        self._save_result_cache(list(keys.values()) if full_run else None)
+        
+        return results
+    
+    def _batch_syntax_check(self, playbooks: List[Path], parallel: bool = True,
+                            fail_fast: bool = False) -> List[Dict]:
+        """Syntax check many playbooks with as few ansible-playbook runs as possible"""
+        results = []
+        remaining = [pb.absolute() for pb in playbooks]
+        
+        while remaining:
+            start_time = time.time()
+            cmd = ["ansible-playbook", "--syntax-check", *map(str, remaining)]
+            
+            try:
+                result = subprocess.run(
+                    cmd,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.PIPE,
+                    cwd=self.base_path
+                )
+            except Exception:
+                results.extend(self._syntax_check_individually(remaining, parallel, fail_fast))
+                break
+            stderr = result.stderr.decode(errors="replace") if result.returncode != 0 else ""
+            
+            # ansible-playbook stops at the first playbook that fails to load. The
+            # error only names the file it came from, which may be an imported
+            # sibling, so trust it only when it names the first unresolved playbook
+            if result.returncode == 0:
+                failed_index = len(remaining)
+            elif str(remaining[0]) in stderr:
+                failed_index = 0
+            else:
+                # Can't tell which playbook failed; check the rest one by one
+                results.extend(self._syntax_check_individually(remaining, parallel, fail_fast))
+                break
+            
+            duration = (time.time() - start_time) / min(failed_index + 1, len(remaining))
+            for pb in remaining[:failed_index]:
+                results.append({
+                    "test": "syntax_check",
+                    "playbook": pb.name,
+                    "status": "PASS",
+                    "message": "Syntax check passed",
+                    "duration": duration
+                })
+            if failed_index < len(remaining):
+                results.append({
+                    "test": "syntax_check",
+                    "playbook": remaining[failed_index].name,
+                    "status": "FAIL",
+                    "message": stderr,
+                    "duration": duration
+                })
+                if fail_fast:
+                    break
+            
+            remaining = remaining[failed_index + 1:]
         
         return results
     
-    def _run_dry_run_tests(self, inventory: str, parallel: bool = True) -> List[Dict]:
+    def _syntax_check_individually(self, playbooks: List[Path], parallel: bool = True,
+                                   fail_fast: bool = False) -> List[Dict]:
+        """Run one ansible-playbook --syntax-check per playbook"""
+        async def check_all():
+            # Created inside asyncio.run so it binds to that loop (required on Python 3.9)
+            semaphore = asyncio.Semaphore(SYNTAX_CHECK_CONCURRENCY if parallel else 1)
+            return await self._gather_results(
+                [self._syntax_check_async(pb.name, semaphore) for pb in playbooks], fail_fast
+            )
+        
+        return asyncio.run(check_all())
+    
+    def _run_dry_run_tests(self, inventory: str, parallel: bool = True,
+                           fail_fast: bool = False) -> List[Dict]:
         """Run dry run tests on selected playbooks"""
         # Only test a subset of playbooks for dry runs to avoid overwhelming tests
         critical_playbooks = [
@@ -489,19 +981,15 @@ class AnsibleTester:
             "network_health_check.yml"
         ]
         
-        existing_playbooks = []
-        for pb_name in critical_playbooks:
-            pb_path = self.playbook_path / pb_name
-            if pb_path.exists():
-                existing_playbooks.append(pb_name)
+        playbook_files = self._playbook_files()
+        playbook_names = {pb.name for pb in playbook_files}
+        existing_playbooks = [pb_name for pb_name in critical_playbooks if pb_name in playbook_names]
         
         if not existing_playbooks:
             # Fall back to first few playbooks
-            all_playbooks = list(self.playbook_path.glob("*.yml"))[:3]
+            all_playbooks = [pb for pb in playbook_files if pb.suffix == ".yml"][:3]
             existing_playbooks = [pb.name for pb in all_playbooks]
         
-        results = []
-        
         if not existing_playbooks:
             return [{
                 "test": "dry_run",
@@ -511,22 +999,15 @@ class AnsibleTester:
                 "duration": 0
             }]
         
-        if parallel and len(existing_playbooks) > 1:
-            with ThreadPoolExecutor(max_workers=2) as executor:  # Limit to 2 for dry runs
-                future_to_playbook = {
-                    executor.submit(self.dry_run_playbook, pb, inventory, "localhost"): pb 
-                    for pb in existing_playbooks[:2]  # Limit to 2 playbooks
-                }
-                
-                for future in as_completed(future_to_playbook):
-                    result = future.result()
-                    results.append(result)
-        else:
-            for playbook in existing_playbooks[:2]:  # Limit to 2 playbooks
-                result = self.dry_run_playbook(playbook, inventory, "localhost")
-                results.append(result)
+        async def run_all():
+            # Created inside asyncio.run so it binds to that loop (required on Python 3.9)
+            semaphore = asyncio.Semaphore(DRY_RUN_CONCURRENCY if parallel else 1)
+            return await self._gather_results([
+                self._dry_run_async(pb, inventory, "localhost", semaphore)
+                for pb in existing_playbooks[:2]  # Limit to 2 playbooks
+            ], fail_fast)
         
-        return results
+        return asyncio.run(run_all())
     
     def display_test_results(self, test_results: Dict):
         """Display test results in a formatted table"""
@@ -553,36 +1034,41 @@ class AnsibleTester:
         self.console.print()
         
         # Display detailed results
-        results_table = Table(title="Detailed Test Results")
-        results_table.add_column("Test Type", style="cyan")
-        results_table.add_column("Target", style="white")
-        results_table.add_column("Status", style="bold")
-        results_table.add_column("Duration", justify="right")
-        results_table.add_column("Message", style="dim")
-        
-        for result in test_results["results"]:
-            status_color = {
-                "PASS": "[green]PASS[/green]",
-                "FAIL": "[red]FAIL[/red]", 
-                "ERROR": "[magenta]ERROR[/magenta]",
-                "WARN": "[yellow]WARN[/yellow]",
-                "SKIP": "[blue]SKIP[/blue]",
-                "TIMEOUT": "[red]TIMEOUT[/red]"
-            }.get(result["status"], result["status"])
+        results = test_results["results"]
+        
+        # Plain tab-separated lines for CI logs; no table layout to render
+        if not self._is_terminal:
+            for result in results:
+                target = result.get("playbook", result.get("inventory", result.get("role", "N/A")))
+                self.console.out(f"{result['test']}\t{result['status']}\t{target}\t{result['duration']:.2f}s",
+                                 highlight=False)
+        else:
+            # Render large suites a block of rows at a time instead of as one grid
+            for offset in range(0, len(results), RESULTS_TABLE_ROWS):
+                results_table = Table(title="Detailed Test Results" if offset == 0 else None)
+                results_table.add_column("Test Type", style="cyan")
+                results_table.add_column("Target", style="white")
+                results_table.add_column("Status", style="bold")
+                results_table.add_column("Duration", justify="right")
+                results_table.add_column("Message", style="dim")
             
-            target = result.get("playbook", result.get("inventory", result.get("role", "N/A")))
-            duration = f"{result['duration']:.2f}s"
-            message = result["message"][:80] + "..." if len(result["message"]) > 80 else result["message"]
+                for result in results[offset:offset + RESULTS_TABLE_ROWS]:
+                    status_color = _STATUS_STYLE.get(result["status"], result["status"])
+                
+                    target = result.get("playbook", result.get("inventory", result.get("role", "N/A")))
+                    duration = f"{result['duration']:.2f}s"
+                    message = result["message"]
+                    message = message if len(message) <= 80 else message[:77] + "..."
+                
+                    results_table.add_row(
+                        result["test"],
+                        target,
+                        status_color,
+                        duration,
+                        message
+                    )
             
-            results_table.add_row(
-                result["test"],
-                target,
-                status_color,
-                duration,
-                message
-            )
-        
-        self.console.print(results_table)
+                self.console.print(results_table)
         
         # Show overall status
         if summary["success_rate"] >= 90:
@@ -607,10 +1093,13 @@ def main():
                              help="Test types to run")
     suite_parser.add_argument("-i", "--inventory", default="production", help="Inventory to test")
     suite_parser.add_argument("--no-parallel", action="store_true", help="Disable parallel execution")
+    suite_parser.add_argument("--fail-fast", action="store_true", help="Stop at the first failing check")
     
     # Individual test commands
     syntax_parser = subparsers.add_parser("syntax", help="Check playbook syntax")
     syntax_parser.add_argument("playbook", nargs="?", help="Specific playbook to check")
+    syntax_parser.add_argument("--fast", action="store_true", help="Load playbooks in-process (YAML only without ansible) instead of running ansible-playbook")
+    syntax_parser.add_argument("--fail-fast", action="store_true", help="Stop at the first failing playbook")
     
     inventory_parser = subparsers.add_parser("inventory", help="Validate inventory")
     inventory_parser.add_argument("-i", "--inventory", default="production", help="Inventory to validate")
@@ -641,7 +1130,8 @@ def main():
             results = tester.run_test_suite(
                 test_types=args.tests,
                 inventory=args.inventory,
-                parallel=not args.no_parallel
+                parallel=not args.no_parallel,
+                fail_fast=args.fail_fast
             )
             tester.display_test_results(results)
             
@@ -655,15 +1145,17 @@ def main():
         
         elif args.command == "syntax":
             if args.playbook:
-                result = tester.syntax_check_playbook(args.playbook)
+                result = tester.syntax_check_playbook(args.playbook, fast=args.fast)
                 status_color = "[green]PASS[/green]" if result["status"] == "PASS" else "[red]FAIL[/red]"
                 tester.console.print(f"Syntax check: {status_color} - {result['message']}")
                 sys.exit(0 if result["status"] == "PASS" else 1)
             else:
-                results = tester._run_syntax_tests()
+                results = tester._run_syntax_tests(fast=args.fast, fail_fast=args.fail_fast)
+                lines = []
                 for result in results:
                     status_color = "[green]PASS[/green]" if result["status"] == "PASS" else "[red]FAIL[/red]"
-                    tester.console.print(f"{result['playbook']}: {status_color} - {result['message']}")
+                    lines.append(f"{result['playbook']}: {status_color} - {result['message']}")
+                tester.console.print("\n".join(lines))
                 
                 failed = any(r["status"] != "PASS" for r in results)
                 sys.exit(1 if failed else 0)
@@ -676,12 +1168,7 @@ def main():
         
         elif args.command == "connectivity":
             result = tester.test_host_connectivity(args.inventory, args.limit, args.timeout)
-            status_colors = {
-                "PASS": "[green]PASS[/green]",
-                "WARN": "[yellow]WARN[/yellow]", 
-                "FAIL": "[red]FAIL[/red]"
-            }
-            status_color = status_colors.get(result["status"], result["status"])
+            status_color = _STATUS_STYLE.get(result["status"], result["status"])
             tester.console.print(f"Connectivity test: {status_color} - {result['message']}")
             sys.exit(0 if result["status"] in ["PASS", "WARN"] else 1)
         
@@ -695,14 +1182,11 @@ def main():
         
         elif args.command == "roles":
             results = tester.validate_roles()
+            lines = []
             for result in results:
-                status_colors = {
-                    "PASS": "[green]PASS[/green]",
-                    "WARN": "[yellow]WARN[/yellow]",
-                    "FAIL": "[red]FAIL[/red]"
-                }
-                status_color = status_colors.get(result["status"], result["status"])
-                tester.console.print(f"{result['role']}: {status_color} - {result['message']}")
+                status_color = _STATUS_STYLE.get(result["status"], result["status"])
+                lines.append(f"{result['role']}: {status_color} - {result['message']}")
+            tester.console.print("\n".join(lines))
             
             failed = any(r["status"] == "FAIL" for r in results)
             sys.exit(1 if failed else 0)
@@ -5,203 +5,451 @@ Automatically discovers network devices and generates Ansible inventory
 """
 
 import argparse
+import errno
 import ipaddress
 import json
+import selectors
 import socket
-import subprocess
-import sys
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import textwrap
+import time
+from collections import deque
 from pathlib import Path
 
-import yaml
+# Not available on Windows, where descriptor limits don't apply the same way
+try:
+    import resource
+except ImportError:
+    resource = None
 
-def ping_host(ip):
-    """Ping a host to check if it's reachable"""
-    try:
-        # Use ping command appropriate for the OS
-        cmd = ["ping", "-n", "1", "-w", "1000", str(ip)] if sys.platform == "win32" else ["ping", "-c", "1", "-W", "1", str(ip)]
-        result = subprocess.run(cmd, capture_output=True, timeout=5)
-        return ip if result.returncode == 0 else None
-    except (subprocess.TimeoutExpired, Exception):
-        return None
-
-def check_ssh_port(ip, port=22, timeout=3):
-    """Check if SSH port is open on the target host"""
-    try:
-        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        sock.settimeout(timeout)
-        result = sock.connect_ex((str(ip), port))
-        sock.close()
-        return ip if result == 0 else None
-    except Exception:
-        return None
-
-def discover_network_devices(network_range, max_workers=50):
-    """Discover network devices in the given range"""
+# SSH, HTTPS (eAPI/httpapi) and NETCONF; any of them open marks a manageable device
+MANAGEMENT_PORTS = (22, 443, 830)
+
+# connect_ex results meaning a non-blocking connect is under way
+_CONNECT_PENDING = {errno.EINPROGRESS, errno.EWOULDBLOCK, getattr(errno, "WSAEWOULDBLOCK", errno.EWOULDBLOCK)}
+
+# Descriptors kept free for stdio, the selector and the output file
+RESERVED_FDS = 64
+
+# select() handles at most 512 sockets on Windows (FD_SETSIZE elsewhere); stay under it
+SELECT_MAX_PROBES = 500
+
+def _fit_fd_limit(concurrency):
+    """Raise the open-file soft limit if needed and clamp concurrency under it"""
+    if (resource is None or selectors.DefaultSelector is selectors.SelectSelector) and concurrency > SELECT_MAX_PROBES:
+        print(f"Limiting concurrent probes to {SELECT_MAX_PROBES} (select() socket limit)")
+        concurrency = SELECT_MAX_PROBES
+    
+    if resource is None:
+        return concurrency
+    
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    if soft != resource.RLIM_INFINITY and soft < concurrency + RESERVED_FDS:
+        try:
+            resource.setrlimit(resource.RLIMIT_NOFILE, (hard, hard))
+            soft = hard
+        except (ValueError, OSError):
+            pass  # e.g. macOS rejects an unlimited hard limit; keep the soft one
+    
+    if soft != resource.RLIM_INFINITY and soft - RESERVED_FDS < concurrency:
+        allowed = max(1, soft - RESERVED_FDS)
+        print(f"Limiting concurrent probes to {allowed} (open file limit is {soft})")
+        return allowed
+    return concurrency
+
+# How long to wait for an SSH server's version line once connected
+BANNER_TIMEOUT = 1.0
+
+def _hosts_with_addresses(hosts):
+    """(ip, dotted-quad address) for each integer address, formatted once per host"""
+    for ip in hosts:
+        yield ip, socket.inet_ntoa(ip.to_bytes(4, "big"))
+
+def port_sweep(hosts, ports=MANAGEMENT_PORTS, timeout=3, concurrency=1000):
+    """Probe each port on every host (IPv4 ints); yield ((ip, address), (open ports, SSH banner)) as hosts finish"""
+    probes = ((host, port) for host in _hosts_with_addresses(hosts) for port in ports)
+    open_ports = {}
+    banners = {}
+    # Probes still running per host, and hosts whose probes have all finished
+    outstanding = {}
+    finished = []
+    # Sockets in start order, so the oldest deadline is always at the front.
+    # Banner reads share one shorter timeout, so they get a queue of their own.
+    connecting = deque()
+    reading = deque()
+    
+    with selectors.DefaultSelector() as selector:
+        def done(host):
+            outstanding[host] -= 1
+            if not outstanding[host]:
+                del outstanding[host]
+                if host in open_ports:
+                    finished.append((host, (sorted(open_ports.pop(host)), banners.pop(host, None))))
+        
+        def opened(sock, host, port):
+            open_ports.setdefault(host, []).append(port)
+            if port == 22:
+                # SSH servers send their version line as soon as they accept,
+                # so reading it costs no extra round trip
+                selector.register(sock, selectors.EVENT_READ, (host, port))
+                reading.append((time.monotonic() + BANNER_TIMEOUT, sock))
+            else:
+                sock.close()
+                done(host)
+        
+        def start_probes():
+            while len(selector.get_map()) < concurrency:
+                probe = next(probes, None)
+                if probe is None:
+                    return
+                outstanding.setdefault(probe[0], len(ports))
+                sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+                sock.setblocking(False)
+                result = sock.connect_ex((probe[0][1], probe[1]))
+                if result == 0:
+                    opened(sock, *probe)
+                elif result in _CONNECT_PENDING:
+                    selector.register(sock, selectors.EVENT_WRITE, probe)
+                    connecting.append((time.monotonic() + timeout, sock))
+                else:
+                    sock.close()
+                    done(probe[0])
+        
+        def expire(queue, events, now):
+            # Drop entries that finished or moved on; close the ones out of time
+            while queue:
+                deadline, sock = queue[0]
+                waiting = sock.fileno() != -1 and selector.get_key(sock).events == events
+                if waiting and deadline > now:
+                    return
+                queue.popleft()
+                if waiting:
+                    host, _ = selector.unregister(sock).data
+                    sock.close()
+                    done(host)
+        
+        start_probes()
+        while selector.get_map():
+            next_deadline = min(queue[0][0] for queue in (connecting, reading) if queue)
+            for key, _ in selector.select(max(0, next_deadline - time.monotonic())):
+                sock = key.fileobj
+                host, port = key.data
+                selector.unregister(sock)
+                if key.events == selectors.EVENT_READ:
+                    try:
+                        data = sock.recv(256)
+                    except OSError:
+                        data = b""
+                    if data.startswith(b"SSH-"):
+                        banners[host] = data.splitlines()[0]
+                    sock.close()
+                    done(host)
+                # Writable means the handshake finished; SO_ERROR says how
+                elif sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR) == 0:
+                    opened(sock, host, port)
+                else:
+                    sock.close()
+                    done(host)
+            
+            now = time.monotonic()
+            expire(connecting, selectors.EVENT_WRITE, now)
+            expire(reading, selectors.EVENT_READ, now)
+            start_probes()
+            
+            yield from finished
+            finished.clear()
+    
+    yield from finished
+
+def discover_network_devices(network_range, concurrency=1000):
+    """Discover network devices in the given range; return {(ip, address): (open ports, SSH banner)}"""
     print(f"Discovering devices in network range: {network_range}")
     
     try:
         network = ipaddress.ip_network(network_range, strict=False)
     except ValueError as e:
         print(f"Invalid network range: {e}")
-        return []
+        return {}
+    if network.version != 4:
+        print("Only IPv4 network ranges are supported")
+        return {}
     
-    # First pass: ping sweep
-    live_hosts = []
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        ping_futures = {executor.submit(ping_host, ip): ip for ip in network.hosts()}
-        
-        for future in as_completed(ping_futures):
-            result = future.result()
-            if result:
-                live_hosts.append(result)
+    # Addresses as a lazy integer range, the same set network.hosts() yields
+    # but without an IPv4Address object per address
+    first, last = int(network.network_address), int(network.broadcast_address)
+    if network.prefixlen < 31:
+        first, last = first + 1, last - 1
     
-    print(f"Found {len(live_hosts)} responding hosts")
+    concurrency = _fit_fd_limit(concurrency)
     
-    # Second pass: SSH port check
-    ssh_hosts = []
-    with ThreadPoolExecutor(max_workers=max_workers // 2) as executor:
-        ssh_futures = {executor.submit(check_ssh_port, ip): ip for ip in live_hosts}
-        
-        for future in as_completed(ssh_futures):
-            result = future.result()
-            if result:
-                ssh_hosts.append(result)
+    # A single connect sweep; no ping pass, since firewalls that drop ICMP
+    # would hide devices and a connect attempt already shows a host is up
+    devices = {}
+    for host, (ports, banner) in port_sweep(range(first, last + 1), concurrency=concurrency):
+        # Report devices as they answer rather than after the whole range
+        detail = f" ({banner.decode(errors='replace')})" if banner else ""
+        print(f"  {host[1]}: ports {', '.join(map(str, ports))}{detail}")
+        devices[host] = (ports, banner)
+    devices = dict(sorted(devices.items()))
     
-    print(f"Found {len(ssh_hosts)} hosts with SSH enabled")
-    return sorted(ssh_hosts)
+    print(f"Found {len(devices)} hosts with management ports open")
+    return devices
 
-def classify_device_type(ip):
-    """Attempt to classify device type based on banner or other characteristics"""
-    # This is a simplified classification - in practice, you'd use SNMP, 
-    # SSH banners, or other methods to identify device types
-    
+def _build_device_lut():
+    """Device group and OS for every possible last octet"""
     # For demonstration, classify based on IP ranges
     # This should be replaced with actual device detection logic
-    last_octet = int(str(ip).split('.')[-1])
-    
-    if 1 <= last_octet <= 10:
-        return "cisco_routers", "ios"
-    elif 11 <= last_octet <= 30:
-        return "cisco_switches", "ios"
-    elif 31 <= last_octet <= 40:
-        return "arista_switches", "eos"
-    elif 41 <= last_octet <= 50:
-        return "juniper_routers", "junos"
-    elif 51 <= last_octet <= 60:
-        return "palo_alto_firewalls", "panos"
-    elif 61 <= last_octet <= 70:
-        return "fortinet_firewalls", "fortios"
-    else:
-        return "unknown_devices", "unknown"
+    for last_octet in range(256):
+        if 1 <= last_octet <= 10:
+            yield "cisco_routers", "ios"
+        elif 11 <= last_octet <= 30:
+            yield "cisco_switches", "ios"
+        elif 31 <= last_octet <= 40:
+            yield "arista_switches", "eos"
+        elif 41 <= last_octet <= 50:
+            yield "juniper_routers", "junos"
+        elif 51 <= last_octet <= 60:
+            yield "palo_alto_firewalls", "panos"
+        elif 61 <= last_octet <= 70:
+            yield "fortinet_firewalls", "fortios"
+        else:
+            yield "unknown_devices", "unknown"
+
+_DEVICE_LUT = tuple(_build_device_lut())
+
+# Vendor markers in lower-cased SSH version lines, e.g. SSH-2.0-Cisco-1.25
+_BANNER_MARKERS = (
+    (b"cisco", ("cisco_routers", "ios")),
+    (b"junos", ("juniper_routers", "junos")),
+    (b"arista", ("arista_switches", "eos")),
+    (b"pan-os", ("palo_alto_firewalls", "panos")),
+    (b"forti", ("fortinet_firewalls", "fortios"))
+)
+
+def classify_device_type(ip, banner=None):
+    """Classify a device from its SSH banner, falling back to its address"""
+    guess = _DEVICE_LUT[int(ip) & 0xff]
+    if banner:
+        banner = banner.lower()
+        for marker, device_type in _BANNER_MARKERS:
+            if marker in banner:
+                # The banner names the vendor, not the role; keep the address
+                # guess when it already picked a Cisco group
+                return guess if device_type[1] == guess[1] else device_type
+    return guess
+
+# OS-specific connection parameters, shared by every host of that OS
+_OS_CONNECTION = {
+    'ios': {
+        'ansible_network_os': 'ios',
+        'ansible_connection': 'network_cli',
+        'ansible_user': '{{ vault_cisco_username }}',
+        'ansible_password': '{{ vault_cisco_password }}'
+    },
+    'eos': {
+        'ansible_network_os': 'eos',
+        'ansible_connection': 'httpapi',
+        'ansible_httpapi_use_ssl': True,
+        'ansible_httpapi_port': 443,
+        'ansible_user': '{{ vault_arista_username }}',
+        'ansible_password': '{{ vault_arista_password }}'
+    },
+    'junos': {
+        'ansible_network_os': 'junos',
+        'ansible_connection': 'netconf',
+        'ansible_user': '{{ vault_juniper_username }}',
+        'ansible_password': '{{ vault_juniper_password }}'
+    },
+    'panos': {
+        'ansible_connection': 'local',
+        'panos_username': '{{ vault_panos_username }}',
+        'panos_password': '{{ vault_panos_password }}',
+        # Only templated values, so one provider dict serves every firewall
+        'panos_provider': {
+            'ip_address': '{{ ansible_host }}',
+            'username': '{{ panos_username }}',
+            'password': '{{ panos_password }}'
+        }
+    },
+    'fortios': {
+        'ansible_connection': 'httpapi',
+        'ansible_httpapi_use_ssl': True,
+        'ansible_httpapi_port': 443,
+        'ansible_httpapi_session_key': '{{ vault_fortigate_api_token }}'
+    }
+}
 
 def generate_inventory(discovered_hosts, output_format='yaml'):
     """Generate Ansible inventory from discovered hosts"""
     
+    # Hosts per device group; each group's dict is attached to the tree once
+    buckets = {group: {} for _, group in _GROUP_LAYOUT}
+    
+    for (ip, address), (_, banner) in discovered_hosts.items():
+        device_group, os_type = classify_device_type(ip, banner)
+        hostname = "device-%d-%d-%d-%d" % (ip >> 24, (ip >> 16) & 0xff, (ip >> 8) & 0xff, ip & 0xff)
+        
+        device_config = {
+            'ansible_host': address,
+            'device_role': 'auto_discovered',
+            'site': 'discovered',
+            **_OS_CONNECTION.get(os_type, {})
+        }
+        
+        buckets[device_group][hostname] = device_config
+    
     inventory = {
         'all': {
             'children': {
                 'cisco_devices': {
                     'children': {
-                        'cisco_routers': {'hosts': {}},
-                        'cisco_switches': {'hosts': {}}
+                        'cisco_routers': {'hosts': buckets['cisco_routers']},
+                        'cisco_switches': {'hosts': buckets['cisco_switches']}
                     }
                 },
                 'palo_alto_devices': {
                     'children': {
-                        'palo_alto_firewalls': {'hosts': {}}
+                        'palo_alto_firewalls': {'hosts': buckets['palo_alto_firewalls']}
                     }
                 },
                 'fortinet_devices': {
                     'children': {
-                        'fortinet_firewalls': {'hosts': {}}
+                        'fortinet_firewalls': {'hosts': buckets['fortinet_firewalls']}
                     }
                 },
                 'juniper_devices': {
                     'children': {
-                        'juniper_routers': {'hosts': {}}
+                        'juniper_routers': {'hosts': buckets['juniper_routers']}
                     }
                 },
                 'arista_devices': {
                     'children': {
-                        'arista_switches': {'hosts': {}}
+                        'arista_switches': {'hosts': buckets['arista_switches']}
                     }
                 },
-                'unknown_devices': {'hosts': {}}
+                'unknown_devices': {'hosts': buckets['unknown_devices']}
             }
         }
     }
     
-    for ip in discovered_hosts:
-        device_group, os_type = classify_device_type(ip)
-        hostname = f"device-{str(ip).replace('.', '-')}"
-        
-        device_config = {
-            'ansible_host': str(ip),
-            'device_role': 'auto_discovered',
-            'site': 'discovered'
-        }
+    return inventory
+
+# YAML for one discovered host, by OS type; the same settings generate_inventory
+# builds, apart from those in a shared anchored block (see _SHARED_YAML)
+_HOST_YAML = {
+    'ios': ("""\
+  ansible_network_os: ios
+  ansible_connection: network_cli
+  ansible_user: '{{ vault_cisco_username }}'
+  ansible_password: '{{ vault_cisco_password }}'
+""", None),
+    'eos': ("""\
+  ansible_network_os: eos
+  ansible_connection: httpapi
+  ansible_user: '{{ vault_arista_username }}'
+  ansible_password: '{{ vault_arista_password }}'
+""", 'httpapi_ssl'),
+    'junos': ("""\
+  ansible_network_os: junos
+  ansible_connection: netconf
+  ansible_user: '{{ vault_juniper_username }}'
+  ansible_password: '{{ vault_juniper_password }}'
+""", None),
+    'panos': ("""\
+  ansible_connection: local
+  panos_username: '{{ vault_panos_username }}'
+  panos_password: '{{ vault_panos_password }}'
+""", 'panos_provider'),
+    'fortios': ("""\
+  ansible_connection: httpapi
+  ansible_httpapi_session_key: '{{ vault_fortigate_api_token }}'
+""", 'httpapi_ssl'),
+    'unknown': ("", None)
+}
+
+# Settings repeated on every host of a kind: the first host defines a YAML
+# anchor and the rest refer to it. (definition, reference) by anchor name.
+_SHARED_YAML = {
+    'httpapi_ssl': ("""\
+  <<: &httpapi_ssl
+    ansible_httpapi_use_ssl: true
+    ansible_httpapi_port: 443
+""", """\
+  <<: *httpapi_ssl
+"""),
+    'panos_provider': ("""\
+  panos_provider: &panos_provider
+    ip_address: '{{ ansible_host }}'
+    username: '{{ panos_username }}'
+    password: '{{ panos_password }}'
+""", """\
+  panos_provider: *panos_provider
+""")
+}
+
+# Inventory groups in output order: (parent group or None, device group)
+_GROUP_LAYOUT = (
+    ('cisco_devices', 'cisco_routers'),
+    ('cisco_devices', 'cisco_switches'),
+    ('palo_alto_devices', 'palo_alto_firewalls'),
+    ('fortinet_devices', 'fortinet_firewalls'),
+    ('juniper_devices', 'juniper_routers'),
+    ('arista_devices', 'arista_switches'),
+    (None, 'unknown_devices')
+)
+
+def _host_templates(indent):
+    """%-templates for a host block at the given indent: {os_type: (anchor, defining, referring)}"""
+    header = "%(hostname)s:\n  ansible_host: %(address)s\n  device_role: auto_discovered\n  site: discovered\n"
+    templates = {}
+    for os_type, (body, anchor) in _HOST_YAML.items():
+        definition, reference = _SHARED_YAML.get(anchor, ("", ""))
+        templates[os_type] = (
+            anchor,
+            textwrap.indent(header + body + definition, " " * indent),
+            textwrap.indent(header + body + reference, " " * indent)
+        )
+    return templates
+
+# Hosts sit 12 spaces deep under a vendor group and 8 deep in unknown_devices
+_NESTED_HOST_TEMPLATES = _host_templates(12)
+_TOP_HOST_TEMPLATES = _host_templates(8)
+
+def write_inventory_yaml(discovered_hosts, out):
+    """Write the discovered inventory as YAML text, without building the nested dict"""
+    buckets = {group: [] for _, group in _GROUP_LAYOUT}
+    for (ip, address), (_, banner) in discovered_hosts.items():
+        device_group, os_type = classify_device_type(ip, banner)
+        buckets[device_group].append((os_type, ip, address))
+    
+    out.write("all:\n  children:\n")
+    defined = set()
+    current_parent = None
+    for parent, group in _GROUP_LAYOUT:
+        if parent is None:
+            out.write(f"    {group}:\n")
+            indent, templates = "      ", _TOP_HOST_TEMPLATES
+        else:
+            if parent != current_parent:
+                out.write(f"    {parent}:\n      children:\n")
+                current_parent = parent
+            out.write(f"        {group}:\n")
+            indent, templates = "          ", _NESTED_HOST_TEMPLATES
         
-        # Add OS-specific connection parameters
-        if os_type == 'ios':
-            device_config.update({
-                'ansible_network_os': 'ios',
-                'ansible_connection': 'network_cli',
-                'ansible_user': '{{ vault_cisco_username }}',
-                'ansible_password': '{{ vault_cisco_password }}'
-            })
-        elif os_type == 'eos':
-            device_config.update({
-                'ansible_network_os': 'eos',
-                'ansible_connection': 'httpapi',
-                'ansible_httpapi_use_ssl': True,
-                'ansible_httpapi_port': 443,
-                'ansible_user': '{{ vault_arista_username }}',
-                'ansible_password': '{{ vault_arista_password }}'
-            })
-        elif os_type == 'junos':
-            device_config.update({
-                'ansible_network_os': 'junos',
-                'ansible_connection': 'netconf',
-                'ansible_user': '{{ vault_juniper_username }}',
-                'ansible_password': '{{ vault_juniper_password }}'
-            })
-        elif os_type == 'panos':
-            device_config.update({
-                'ansible_connection': 'local',
-                'panos_username': '{{ vault_panos_username }}',
-                'panos_password': '{{ vault_panos_password }}',
-                'panos_provider': {
-                    'ip_address': '{{ ansible_host }}',
-                    'username': '{{ panos_username }}',
-                    'password': '{{ panos_password }}'
-                }
-            })
-        elif os_type == 'fortios':
-            device_config.update({
-                'ansible_connection': 'httpapi',
-                'ansible_httpapi_use_ssl': True,
-                'ansible_httpapi_port': 443,
-                'ansible_httpapi_session_key': '{{ vault_fortigate_api_token }}'
+        if not buckets[group]:
+            out.write(f"{indent}hosts: {{}}\n")
+            continue
+        out.write(f"{indent}hosts:\n")
+        for os_type, ip, address in buckets[group]:
+            anchor, defining, referring = templates[os_type]
+            if anchor in defined:
+                template = referring
+            else:
+                template = defining
+                defined.add(anchor)
+            out.write(template % {
+                "hostname": "device-%d-%d-%d-%d" % (ip >> 24, (ip >> 16) & 0xff, (ip >> 8) & 0xff, ip & 0xff),
+                "address": address
             })
-        
-        # Navigate to the correct group in the inventory structure
-        group_path = inventory['all']['children']
-        
-        if device_group in ['cisco_routers', 'cisco_switches']:
-            group_path['cisco_devices']['children'][device_group]['hosts'][hostname] = device_config
-        elif device_group == 'palo_alto_firewalls':
-            group_path['palo_alto_devices']['children'][device_group]['hosts'][hostname] = device_config
-        elif device_group == 'fortinet_firewalls':
-            group_path['fortinet_devices']['children'][device_group]['hosts'][hostname] = device_config
-        elif device_group == 'juniper_routers':
-            group_path['juniper_devices']['children'][device_group]['hosts'][hostname] = device_config
-        elif device_group == 'arista_switches':
-            group_path['arista_devices']['children'][device_group]['hosts'][hostname] = device_config
-        else:
-            group_path['unknown_devices']['hosts'][hostname] = device_config
-    
-    return inventory
 
 def main():
     parser = argparse.ArgumentParser(description='Network Device Discovery Tool')
@@ -210,8 +458,9 @@ def main():
                         help='Output inventory file (default: discovered_inventory.yml)')
     parser.add_argument('-f', '--format', choices=['yaml', 'json'], default='yaml',
                         help='Output format (default: yaml)')
-    parser.add_argument('-w', '--workers', type=int, default=50,
-                        help='Number of worker threads (default: 50)')
+    parser.add_argument('-w', '--workers', type=int, default=1000,
+                        help='Maximum concurrent connection probes (default: 1000; '
+                             f'capped at {SELECT_MAX_PROBES} where only select() is available, e.g. Windows)')
     
     args = parser.parse_args()
     
@@ -222,21 +471,18 @@ def main():
     discovered_hosts = discover_network_devices(args.network, args.workers)
     
     if not discovered_hosts:
-        print("No network devices found with SSH enabled")
+        print("No network devices found with management ports open")
         return
     
-    # Generate inventory
-    inventory = generate_inventory(discovered_hosts, args.format)
-    
-    # Write output
+    # Write output; YAML is emitted host by host, JSON needs the inventory dict
     output_path = Path(args.output)
     
     try:
         with open(output_path, 'w') as f:
             if args.format == 'yaml':
-                yaml.dump(inventory, f, default_flow_style=False, sort_keys=False)
+                write_inventory_yaml(discovered_hosts, f)
             else:
-                json.dump(inventory, f, indent=2)
+                json.dump(generate_inventory(discovered_hosts, args.format), f, indent=2)
         
         print(f"\nInventory file created: {output_path}")
         print(f"Discovered {len(discovered_hosts)} network devices")
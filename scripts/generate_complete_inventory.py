@@ -11,8 +11,16 @@ Target counts:
 Total: 660 network devices
 """
 
-def generate_complete_inventory():
-    inventory = """---
+import io
+
+# Formatted per-site values, shared by every device at a site
+SITE_NAMES = tuple(f"site_{n:02d}" for n in range(32))
+CISCO_BGP_ASNS = tuple(str(65000 + n) for n in range(32))
+JUNIPER_BGP_ASNS = tuple(str(65100 + n) for n in range(32))
+
+def write_complete_inventory(out):
+    """Write the complete inventory to out one device at a time"""
+    out.write("""---
 # Complete Enterprise-Scale Production Network Inventory
 # Total Device Count Summary:
 # - Development: 10 devices (completed)
@@ -31,11 +39,11 @@ all:
       children:
         development_switches:
           hosts:
-"""
+""")
     
     # Development devices (10 total)
     for i in range(1, 6):  # 5 switches
-        inventory += f"""            sw-dev-{i:03d}:
+        out.write(f"""            sw-dev-{i:03d}:
               ansible_host: 10.255.1.{10+i-1}
               ansible_network_os: {'ios' if i <= 3 else 'eos'}
               ansible_connection: {'network_cli' if i <= 3 else 'httpapi'}
@@ -45,14 +53,14 @@ all:
               {'ansible_httpapi_port: 443' if i > 3 else ''}
               device_role: development_switch
               site: dev_lab
-"""
+""")
     
-    inventory += """        development_routers:
+    out.write("""        development_routers:
           hosts:
-"""
+""")
     
     for i in range(1, 4):  # 3 routers  
-        inventory += f"""            rtr-dev-{i:03d}:
+        out.write(f"""            rtr-dev-{i:03d}:
               ansible_host: 10.255.2.{10+i-1}
               ansible_network_os: {'ios' if i <= 2 else 'junos'}
               ansible_connection: {'network_cli' if i <= 2 else 'netconf'}
@@ -60,9 +68,9 @@ all:
               ansible_password: "{{{{ vault_{'cisco' if i <= 2 else 'juniper'}_password }}}}"
               device_role: development_router
               site: dev_lab
-"""
+""")
     
-    inventory += """        development_firewalls:
+    out.write("""        development_firewalls:
           hosts:
             fw-dev-001:
               ansible_host: 10.255.3.10
@@ -71,7 +79,8 @@ all:
               panos_password: "{{ vault_panos_password }}"
               device_role: development_firewall
               site: dev_lab
-              panos_provider:
+              # Anchored here and referred to by every Palo Alto firewall below
+              panos_provider: &panos_provider
                 ip_address: "{{ ansible_host }}"
                 username: "{{ panos_username }}"
                 password: "{{ panos_password }}"
@@ -79,8 +88,10 @@ all:
             fw-dev-002:
               ansible_host: 10.255.3.11
               ansible_connection: httpapi
-              ansible_httpapi_use_ssl: true
-              ansible_httpapi_port: 443
+              # Anchored here and merged into every Arista and Fortinet device below
+              <<: &httpapi_ssl
+                ansible_httpapi_use_ssl: true
+                ansible_httpapi_port: 443
               ansible_httpapi_session_key: "{{ vault_fortigate_api_token }}"
               device_role: development_firewall
               site: dev_lab
@@ -94,14 +105,14 @@ all:
           children:
             core_switches:
               hosts:
-"""
+""")
     
     # Core switches (10 devices)
     sites = ['datacenter_01', 'datacenter_01', 'datacenter_02', 'datacenter_02', 'datacenter_03', 
              'datacenter_03', 'branch_01', 'branch_01', 'branch_02', 'branch_02']
     
     for i in range(1, 11):
-        inventory += f"""                sw-core-{i:03d}:
+        out.write(f"""                sw-core-{i:03d}:
                   ansible_host: 10.0.1.{9+i}
                   ansible_network_os: ios
                   ansible_connection: network_cli
@@ -109,11 +120,11 @@ all:
                   ansible_password: "{{{{ vault_cisco_password }}}}"
                   device_role: core_switch
                   site: {sites[i-1]}
-"""
+""")
     
-    inventory += """            distribution_switches:
+    out.write("""            distribution_switches:
               hosts:
-"""
+""")
     
     # Distribution switches (20 devices)
     dist_sites = ['datacenter_01', 'datacenter_01', 'datacenter_02', 'datacenter_02', 'branch_01', 'branch_01',
@@ -121,7 +132,7 @@ all:
                   'remote_04', 'remote_04', 'remote_05', 'remote_05', 'remote_06', 'remote_06']
     
     for i in range(1, 21):
-        inventory += f"""                sw-dist-{i:02d}:
+        out.write(f"""                sw-dist-{i:02d}:
                   ansible_host: 10.0.2.{9+i}
                   ansible_network_os: ios
                   ansible_connection: network_cli
@@ -129,87 +140,87 @@ all:
                   ansible_password: "{{{{ vault_cisco_password }}}}"
                   device_role: distribution_switch
                   site: {dist_sites[i-1]}
-"""
+""")
     
-    inventory += """            access_switches:
+    out.write("""            access_switches:
               hosts:
-"""
+""")
     
     # Access switches (270 devices)
     for i in range(1, 271):
         site_num = ((i-1) // 10) + 1
         floor = ((i-1) % 10) + 1
-        inventory += f"""                sw-access-{i:03d}:
+        out.write(f"""                sw-access-{i:03d}:
                   ansible_host: 10.0.3.{i}
                   ansible_network_os: ios
                   ansible_connection: network_cli
                   ansible_user: "{{{{ vault_cisco_username }}}}"
                   ansible_password: "{{{{ vault_cisco_password }}}}"
                   device_role: access_switch
-                  site: site_{site_num:02d}
+                  site: {SITE_NAMES[site_num]}
                   floor: {floor}
-"""
+""")
     
-    inventory += """        cisco_routers:
+    out.write("""        cisco_routers:
           children:
             wan_routers:
               hosts:
-"""
+""")
     
     # WAN routers (50 devices)
     for i in range(1, 51):
         site_num = ((i-1) // 8) + 1
-        bgp_asn = 65000 + site_num
-        inventory += f"""                rtr-wan-{i:03d}:
+        bgp_asn = CISCO_BGP_ASNS[site_num]
+        out.write(f"""                rtr-wan-{i:03d}:
                   ansible_host: 10.1.2.{i}
                   ansible_network_os: ios
                   ansible_connection: network_cli
                   ansible_user: "{{{{ vault_cisco_username }}}}"
                   ansible_password: "{{{{ vault_cisco_password }}}}"
                   device_role: wan_router
-                  site: site_{site_num:02d}
+                  site: {SITE_NAMES[site_num]}
                   bgp_asn: {bgp_asn}
-"""
+""")
     
-    inventory += """            branch_routers:
+    out.write("""            branch_routers:
               hosts:
-"""
+""")
     
     # Branch routers (75 devices)
     for i in range(1, 76):
         site_num = ((i-1) // 8) + 1
-        bgp_asn = 65000 + site_num
-        inventory += f"""                rtr-branch-{i:03d}:
+        bgp_asn = CISCO_BGP_ASNS[site_num]
+        out.write(f"""                rtr-branch-{i:03d}:
                   ansible_host: 10.1.3.{i}
                   ansible_network_os: ios
                   ansible_connection: network_cli
                   ansible_user: "{{{{ vault_cisco_username }}}}"
                   ansible_password: "{{{{ vault_cisco_password }}}}"
                   device_role: branch_router
-                  site: site_{site_num:02d}
+                  site: {SITE_NAMES[site_num]}
                   bgp_asn: {bgp_asn}
-"""
+""")
     
-    inventory += """            access_routers:
+    out.write("""            access_routers:
               hosts:
-"""
+""")
     
     # Access routers (75 devices)
     for i in range(1, 76):
         site_num = ((i-1) // 8) + 1
-        bgp_asn = 65000 + site_num
-        inventory += f"""                rtr-access-{i:03d}:
+        bgp_asn = CISCO_BGP_ASNS[site_num]
+        out.write(f"""                rtr-access-{i:03d}:
                   ansible_host: 10.1.4.{i}
                   ansible_network_os: ios
                   ansible_connection: network_cli
                   ansible_user: "{{{{ vault_cisco_username }}}}"
                   ansible_password: "{{{{ vault_cisco_password }}}}"
                   device_role: access_router
-                  site: site_{site_num:02d}
+                  site: {SITE_NAMES[site_num]}
                   bgp_asn: {bgp_asn}
-"""
+""")
     
-    inventory += """
+    out.write("""
     # ===========================
     # ARISTA DEVICES (50 TOTAL)
     # ===========================
@@ -217,26 +228,25 @@ all:
       children:
         arista_switches:
           hosts:
-"""
+""")
     
     # Arista switches (50 devices)
     for i in range(1, 51):
         device_type = 'spine' if i <= 10 else 'leaf'
         base_ip = 10 if device_type == 'spine' else 20
         site_name = f"datacenter_{((i-1) // 5) + 1:02d}"
-        inventory += f"""            sw-{device_type}-{i:03d}:
+        out.write(f"""            sw-{device_type}-{i:03d}:
               ansible_host: 10.2.{1 if device_type == 'spine' else 2}.{base_ip + i - 1}
               ansible_network_os: eos
               ansible_connection: httpapi
-              ansible_httpapi_use_ssl: true
-              ansible_httpapi_port: 443
+              <<: *httpapi_ssl
               ansible_user: "{{{{ vault_arista_username }}}}"
               ansible_password: "{{{{ vault_arista_password }}}}"
               device_role: {device_type}_switch
               site: {site_name}
-"""
+""")
     
-    inventory += """
+    out.write("""
     # ===========================
     # JUNIPER DEVICES (50 TOTAL)
     # ===========================
@@ -244,7 +254,7 @@ all:
       children:
         juniper_routers:
           hosts:
-"""
+""")
     
     # Juniper routers (50 devices)
     for i in range(1, 51):
@@ -261,19 +271,19 @@ all:
             base_ip = 45
             site_num = ((i-36) // 5) + 8
             
-        bgp_asn = 65100 + site_num
-        inventory += f"""            rtr-{device_type}-jun-{i:03d}:
+        bgp_asn = JUNIPER_BGP_ASNS[site_num]
+        out.write(f"""            rtr-{device_type}-jun-{i:03d}:
               ansible_host: 10.3.{1 if device_type == 'core' else 2 if device_type == 'edge' else 3}.{base_ip + ((i-1) % 15)}
               ansible_network_os: junos
               ansible_connection: netconf
               ansible_user: "{{{{ vault_juniper_username }}}}"
               ansible_password: "{{{{ vault_juniper_password }}}}"
               device_role: {device_type}_router
-              site: site_{site_num:02d}
+              site: {SITE_NAMES[site_num]}
               bgp_asn: {bgp_asn}
-"""
+""")
     
-    inventory += """
+    out.write("""
     # ===========================
     # PALO ALTO DEVICES (50 TOTAL)
     # ===========================
@@ -281,7 +291,7 @@ all:
       children:
         palo_alto_firewalls:
           hosts:
-"""
+""")
     
     # Palo Alto firewalls (50 devices)
     for i in range(1, 51):
@@ -298,21 +308,17 @@ all:
             base_ip = 35
             site_num = ((i-26) // 5) + 6
             
-        inventory += f"""            fw-{device_type}-{i:03d}:
+        out.write(f"""            fw-{device_type}-{i:03d}:
               ansible_host: 10.4.{1 if device_type == 'perimeter' else 2 if device_type == 'internal' else 3}.{base_ip + ((i-1) % 10)}
               ansible_connection: local
               panos_username: "{{{{ vault_panos_username }}}}"
               panos_password: "{{{{ vault_panos_password }}}}"
               device_role: {device_type}_firewall
-              site: site_{site_num:02d}
-              panos_provider:
-                ip_address: "{{{{ ansible_host }}}}"
-                username: "{{{{ panos_username }}}}"
-                password: "{{{{ panos_password }}}}"
-                timeout: 120
-"""
+              site: {SITE_NAMES[site_num]}
+              panos_provider: *panos_provider
+""")
     
-    inventory += """
+    out.write("""
     # ===========================
     # FORTINET DEVICES
     # ===========================
@@ -323,8 +329,7 @@ all:
             fw-internal-fort-01:
               ansible_host: 10.0.1.60
               ansible_connection: httpapi
-              ansible_httpapi_use_ssl: true
-              ansible_httpapi_port: 443
+              <<: *httpapi_ssl
               ansible_httpapi_session_key: "{{ vault_fortigate_api_token }}"
               device_role: internal_firewall
               site: datacenter_01
@@ -377,16 +382,19 @@ all:
     development:
       children:
         - development_devices
-"""
-    
-    return inventory
+""")
+
+def generate_complete_inventory():
+    """Return the complete inventory as a string"""
+    out = io.StringIO()
+    write_complete_inventory(out)
+    return out.getvalue()
 
 if __name__ == "__main__":
     print("Generating complete enterprise inventory...")
-    inventory_content = generate_complete_inventory()
     
     with open("inventories/production/hosts_complete_enterprise.yml", "w") as f:
-        f.write(inventory_content)
+        write_complete_inventory(f)
     
     print("Complete enterprise inventory generated successfully!")
     print("\nDevice count summary:")
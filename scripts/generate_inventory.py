@@ -9,6 +9,75 @@ Generates devices according to enterprise requirements:
 - 50 Palo Alto firewalls
 """
 
+# Formatted per-site values, shared by every device at a site
+SITE_NAMES = tuple(f"site_{n:02d}" for n in range(32))
+CISCO_BGP_ASNS = tuple(str(65000 + n) for n in range(32))
+JUNIPER_BGP_ASNS = tuple(str(65100 + n) for n in range(32))
+
+# Settings shared by every device of a kind: the first device defines a YAML
+# anchor and the rest merge or alias it
+HTTPAPI_SSL_ANCHOR = """              <<: &httpapi_ssl
+                ansible_httpapi_use_ssl: true
+                ansible_httpapi_port: 443"""
+HTTPAPI_SSL_ALIAS = "              <<: *httpapi_ssl"
+
+PANOS_PROVIDER_ANCHOR = """              panos_provider: &panos_provider
+                ip_address: "{{ ansible_host }}"
+                username: "{{ panos_username }}"
+                password: "{{ panos_password }}"
+                timeout: 120"""
+PANOS_PROVIDER_ALIAS = "              panos_provider: *panos_provider"
+
+# Per-device YAML, filled in with %-formatting for each generated device
+ACCESS_SWITCH_TEMPLATE = """            sw-access-%(i)03d:
+              ansible_host: 10.0.3.%(i)d
+              ansible_network_os: ios
+              ansible_connection: network_cli
+              ansible_user: "{{ vault_cisco_username }}"
+              ansible_password: "{{ vault_cisco_password }}"
+              device_role: access_switch
+              site: %(site)s
+              floor: %(floor)d"""
+
+CISCO_ROUTER_TEMPLATE = """            rtr-%(prefix)s-%(i)03d:
+              ansible_host: %(subnet)s.%(ip_offset)d
+              ansible_network_os: ios
+              ansible_connection: network_cli
+              ansible_user: "{{ vault_cisco_username }}"
+              ansible_password: "{{ vault_cisco_password }}"
+              device_role: %(role)s
+              site: %(site)s
+              bgp_asn: %(bgp_asn)s"""
+
+ARISTA_SWITCH_TEMPLATE = """            sw-%(prefix)s-%(i)03d:
+              ansible_host: %(subnet)s.%(ip_offset)d
+              ansible_network_os: eos
+              ansible_connection: httpapi
+              ansible_user: "{{ vault_arista_username }}"
+              ansible_password: "{{ vault_arista_password }}"
+              device_role: %(role)s
+              site: datacenter_%(site_num)02d
+%(httpapi_ssl)s"""
+
+JUNIPER_ROUTER_TEMPLATE = """            rtr-%(prefix)s-jun-%(i)03d:
+              ansible_host: %(subnet)s.%(ip_offset)d
+              ansible_network_os: junos
+              ansible_connection: netconf
+              ansible_user: "{{ vault_juniper_username }}"
+              ansible_password: "{{ vault_juniper_password }}"
+              device_role: %(role)s
+              site: %(site)s
+              bgp_asn: %(bgp_asn)s"""
+
+PALO_ALTO_FIREWALL_TEMPLATE = """            fw-%(prefix)s-%(i)03d:
+              ansible_host: %(subnet)s.%(ip_offset)d
+              ansible_connection: local
+              panos_username: "{{ vault_panos_username }}"
+              panos_password: "{{ vault_panos_password }}"
+              device_role: %(role)s
+              site: %(site)s
+%(panos_provider)s"""
+
 def generate_cisco_access_switches():
     """Generate 270 Cisco access switches"""
     switches = []
@@ -16,16 +85,7 @@ def generate_cisco_access_switches():
         site_num = ((i - 1) // 10) + 1
         switch_in_site = ((i - 1) % 10) + 1
         
-        switch_config = f"""            sw-access-{i:03d}:
-              ansible_host: 10.0.3.{i}
-              ansible_network_os: ios
-              ansible_connection: network_cli
-              ansible_user: "{{ vault_cisco_username }}"
-              ansible_password: "{{ vault_cisco_password }}"
-              device_role: access_switch
-              site: site_{site_num:02d}
-              floor: {switch_in_site}"""
-        switches.append(switch_config)
+        switches.append(ACCESS_SWITCH_TEMPLATE % {"i": i, "site": SITE_NAMES[site_num], "floor": switch_in_site})
     
     return '\n'.join(switches)
 
@@ -49,18 +109,11 @@ def generate_cisco_routers():
             subnet = "10.1.4"
         
         ip_offset = ((i - 1) % 254) + 1
-        bgp_asn = 65000 + site_num
         
-        router_config = f"""            rtr-{role.split('_')[0]}-{i:03d}:
-              ansible_host: {subnet}.{ip_offset}
-              ansible_network_os: ios
-              ansible_connection: network_cli
-              ansible_user: "{{ vault_cisco_username }}"
-              ansible_password: "{{ vault_cisco_password }}"
-              device_role: {role}
-              site: site_{site_num:02d}
-              bgp_asn: {bgp_asn}"""
-        routers.append(router_config)
+        routers.append(CISCO_ROUTER_TEMPLATE % {
+            "prefix": role.split('_')[0], "i": i, "subnet": subnet, "ip_offset": ip_offset,
+            "role": role, "site": SITE_NAMES[site_num], "bgp_asn": CISCO_BGP_ASNS[site_num]
+        })
     
     return '\n'.join(routers)
 
@@ -82,17 +135,11 @@ def generate_arista_switches():
         
         ip_offset = ((i - 1) % 50) + 10
         
-        switch_config = f"""            sw-{role.split('_')[0]}-{i:03d}:
-              ansible_host: {subnet}.{ip_offset}
-              ansible_network_os: eos
-              ansible_connection: httpapi
-              ansible_httpapi_use_ssl: true
-              ansible_httpapi_port: 443
-              ansible_user: "{{ vault_arista_username }}"
-              ansible_password: "{{ vault_arista_password }}"
-              device_role: {role}
-              site: datacenter_{site_num:02d}"""
-        switches.append(switch_config)
+        switches.append(ARISTA_SWITCH_TEMPLATE % {
+            "prefix": role.split('_')[0], "i": i, "subnet": subnet, "ip_offset": ip_offset,
+            "role": role, "site_num": site_num,
+            "httpapi_ssl": HTTPAPI_SSL_ANCHOR if i == 1 else HTTPAPI_SSL_ALIAS
+        })
     
     return '\n'.join(switches)
 
@@ -113,18 +160,11 @@ def generate_juniper_routers():
             subnet = "10.3.3"
         
         ip_offset = ((i - 1) % 50) + 10
-        bgp_asn = 65100 + site_num
         
-        router_config = f"""            rtr-{role.split('_')[0]}-jun-{i:03d}:
-              ansible_host: {subnet}.{ip_offset}
-              ansible_network_os: junos
-              ansible_connection: netconf
-              ansible_user: "{{ vault_juniper_username }}"
-              ansible_password: "{{ vault_juniper_password }}"
-              device_role: {role}
-              site: site_{site_num:02d}
-              bgp_asn: {bgp_asn}"""
-        routers.append(router_config)
+        routers.append(JUNIPER_ROUTER_TEMPLATE % {
+            "prefix": role.split('_')[0], "i": i, "subnet": subnet, "ip_offset": ip_offset,
+            "role": role, "site": SITE_NAMES[site_num], "bgp_asn": JUNIPER_BGP_ASNS[site_num]
+        })
     
     return '\n'.join(routers)
 
@@ -149,19 +189,11 @@ def generate_palo_alto_firewalls():
         
         ip_offset = ((i - 1) % 50) + 10
         
-        firewall_config = f"""            fw-{role.split('_')[0]}-{i:03d}:
-              ansible_host: {subnet}.{ip_offset}
-              ansible_connection: local
-              panos_username: "{{ vault_panos_username }}"
-              panos_password: "{{ vault_panos_password }}"
-              device_role: {role}
-              site: site_{site_num:02d}
-              panos_provider:
-                ip_address: "{{ ansible_host }}"
-                username: "{{ panos_username }}"
-                password: "{{ panos_password }}"
-                timeout: 120"""
-        firewalls.append(firewall_config)
+        firewalls.append(PALO_ALTO_FIREWALL_TEMPLATE % {
+            "prefix": role.split('_')[0], "i": i, "subnet": subnet, "ip_offset": ip_offset,
+            "role": role, "site": SITE_NAMES[site_num],
+            "panos_provider": PANOS_PROVIDER_ANCHOR if i == 1 else PANOS_PROVIDER_ALIAS
+        })
     
     return '\n'.join(firewalls)
 
@@ -201,11 +233,10 @@ def generate_complete_inventory():
             fw-internal-01:
               ansible_host: 10.5.1.10
               ansible_connection: httpapi
-              ansible_httpapi_use_ssl: true
-              ansible_httpapi_port: 443
-              ansible_httpapi_session_key: "{{ vault_fortigate_api_token }}"
+              ansible_httpapi_session_key: "{{{{ vault_fortigate_api_token }}}}"
               device_role: internal_firewall
               site: datacenter_01
+{HTTPAPI_SSL_ALIAS}
 """
 
     return inventory_template
@@ -6,25 +6,70 @@ Provides metrics, timing analysis, and optimization recommendations
 """
 
 import os
+import re
 import sys
+import asyncio
+import mmap
 import time
 import json
 import argparse
-import subprocess
 import psutil
-import threading
+import tempfile
+from array import array
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 from typing import Dict, List, Optional, Union
 from datetime import datetime, timedelta
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from rich.console import Console
 from rich.table import Table
 from rich.progress import Progress
 from rich.panel import Panel
 from rich.live import Live
 from rich.layout import Layout
+from rich.style import Style
+from rich.text import Text
 import logging
 
+# Optional faster serializers for saved metrics
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+# Task headers and PLAY RECAP host lines in ansible-playbook output
+_TASK_RE = re.compile(rb'^[ \t]*TASK \[', re.M)
+_RECAP_RE = re.compile(rb'^\S[^\n]*?:\s*ok=\d+[^\n]*?unreachable=(\d+)\s+failed=(\d+)', re.M)
+
+# Between serial iterations, wait up to the pause for system CPU to settle below this
+ITERATION_PAUSE = 2.0
+SETTLE_CPU_PERCENT = 50.0
+
+# Column headers and styles for each report table
+_REPORT_COLUMNS = {
+    "Execution Statistics": (("Metric", Style(color="cyan")), ("Value", Style(color="white"))),
+    "Resource Usage": (("Resource", Style(color="cyan")), ("Average", Style(color="white")),
+                       ("Peak", Style(color="white")), ("Status", Style(bold=True))),
+    "Network I/O": (("Direction", Style(color="cyan")), ("Total", Style(color="white")),
+                    ("Average per Run", Style(color="white"))),
+    "Playbook Statistics": (("Metric", Style(color="cyan")), ("Average", Style(color="white")))
+}
+
+# Resource status cells, built once so no markup is parsed per report, indexed
+# by how many of the 50% and 80% thresholds the usage has reached
+_RESOURCE_STATUS = (
+    Text("Good", style=Style(color="green")),
+    Text("Moderate", style=Style(color="yellow")),
+    Text("High", style=Style(color="red"))
+)
+
+_BYTE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
+
 # Setup logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -32,6 +77,14 @@ logger = logging.getLogger(__name__)
 @dataclass
 class PerformanceMetrics:
     """Data class for performance metrics"""
+    __slots__ = (
+        "start_time", "end_time", "duration",
+        "cpu_usage_avg", "cpu_usage_max", "memory_usage_avg", "memory_usage_max",
+        "net_bytes_sent", "net_bytes_recv", "net_packets_sent", "net_packets_recv",
+        "disk_read_bytes", "disk_write_bytes", "disk_read_count", "disk_write_count",
+        "task_count", "host_count", "success_rate"
+    )
+    
     start_time: str
     end_time: str
     duration: float
@@ -39,8 +92,14 @@ class PerformanceMetrics:
     cpu_usage_max: float
     memory_usage_avg: float
     memory_usage_max: float
-    network_io: Dict[str, int]
-    disk_io: Dict[str, int]
+    net_bytes_sent: int
+    net_bytes_recv: int
+    net_packets_sent: int
+    net_packets_recv: int
+    disk_read_bytes: int
+    disk_write_bytes: int
+    disk_read_count: int
+    disk_write_count: int
     task_count: int
     host_count: int
     success_rate: float
@@ -51,67 +110,147 @@ class AnsiblePerformanceMonitor:
     def __init__(self, base_path: str = None):
         self.console = Console()
         self.base_path = Path(base_path) if base_path else Path.cwd()
-        self.monitoring = False
         self.metrics = []
         
+        # On Linux the network and disk counters are read through descriptors kept
+        # open for the monitor's lifetime; elsewhere psutil provides them
+        self._net_fd = self._disk_fd = None
+        self._whole_disks = frozenset()
+        if sys.platform.startswith("linux"):
+            try:
+                self._net_fd = os.open("/proc/net/dev", os.O_RDONLY)
+                self._disk_fd = os.open("/proc/diskstats", os.O_RDONLY)
+                # Partitions are left out of the totals, as psutil does
+                self._whole_disks = frozenset(
+                    name.replace("!", "/").encode() for name in os.listdir("/sys/block")
+                )
+            except OSError:
+                self.close()
+    
+    def close(self):
+        """Close the descriptors held for reading I/O counters"""
+        for fd in (self._net_fd, self._disk_fd):
+            if fd is not None:
+                os.close(fd)
+        self._net_fd = self._disk_fd = None
+    
+    def __del__(self):
+        if getattr(self, "_net_fd", None) is not None:
+            self.close()
+    
+    def _net_io_counters(self) -> tuple:
+        """Return (bytes_sent, bytes_recv, packets_sent, packets_recv) summed over all interfaces"""
+        if self._net_fd is None:
+            counters = psutil.net_io_counters()
+            return counters.bytes_sent, counters.bytes_recv, counters.packets_sent, counters.packets_recv
+        
+        bytes_sent = bytes_recv = packets_sent = packets_recv = 0
+        # Two header lines, then "iface: rx_bytes rx_packets ... tx_bytes tx_packets ..."
+        for line in _pread_all(self._net_fd).splitlines()[2:]:
+            fields = line.partition(b":")[2].split()
+            bytes_recv += int(fields[0])
+            packets_recv += int(fields[1])
+            bytes_sent += int(fields[8])
+            packets_sent += int(fields[9])
+        return bytes_sent, bytes_recv, packets_sent, packets_recv
+    
+    def _disk_io_counters(self) -> Optional[tuple]:
+        """Return (read_bytes, write_bytes, read_count, write_count) summed over whole disks"""
+        if self._disk_fd is None:
+            counters = psutil.disk_io_counters()
+            if counters is None:
+                return None
+            return counters.read_bytes, counters.write_bytes, counters.read_count, counters.write_count
+        
+        read_bytes = write_bytes = read_count = write_count = 0
+        # "major minor name reads merged sectors_read ms writes merged sectors_written ..."
+        for line in _pread_all(self._disk_fd).splitlines():
+            fields = line.split()
+            if fields[2] in self._whole_disks:
+                read_count += int(fields[3])
+                read_bytes += int(fields[5]) * 512
+                write_count += int(fields[7])
+                write_bytes += int(fields[9]) * 512
+        return read_bytes, write_bytes, read_count, write_count
+    
     def monitor_playbook_execution(self, 
                                   command: List[str],
-                                  sample_interval: float = 1.0) -> PerformanceMetrics:
+                                  sample_interval: float = 1.0,
+                                  capture_output: bool = True) -> PerformanceMetrics:
         """Monitor a playbook execution and collect performance metrics"""
+        return asyncio.run(
+            self._monitor_playbook_execution_async(command, sample_interval, capture_output)
+        )
+    
+    async def _monitor_playbook_execution_async(self, command: List[str], sample_interval: float,
+                                                capture_output: bool):
+        """Run the command and sample system resources on one event loop until it exits"""
         
         # Initialize metrics tracking
-        cpu_samples = []
-        memory_samples = []
-        start_network = psutil.net_io_counters()
-        start_disk = psutil.disk_io_counters()
+        # Samples are stored unboxed, 8 bytes each, for long monitoring runs
+        cpu_samples = array('d')
+        memory_samples = array('d')
+        start_network = self._net_io_counters()
+        start_disk = self._disk_io_counters()
         
         start_time = datetime.now()
         
+        # Ansible output goes straight to temporary files so this process does
+        # no pipe polling while the playbook runs; only the sampler wakes up,
+        # keeping the monitor's own CPU out of the measurements
+        stdout_file = tempfile.TemporaryFile()
+        stderr_file = tempfile.TemporaryFile()
+        
+        # Baseline the CPU counters so the first sample covers the process start-up
+        psutil.cpu_percent(interval=None)
+        
         # Start the Ansible process
-        process = subprocess.Popen(
-            command,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
+        process = await asyncio.create_subprocess_exec(
+            *command,
+            stdout=stdout_file,
+            stderr=stderr_file,
             cwd=self.base_path
         )
         
-        # Monitor system resources
-        def collect_metrics():
-            while self.monitoring:
-                try:
-                    cpu_percent = psutil.cpu_percent(interval=None)
-                    memory = psutil.virtual_memory()
-                    
-                    cpu_samples.append(cpu_percent)
-                    memory_samples.append(memory.percent)
-                    
-                    time.sleep(sample_interval)
-                except:
-                    break
-        
-        # Start monitoring thread
-        self.monitoring = True
-        monitor_thread = threading.Thread(target=collect_metrics)
-        monitor_thread.daemon = True
-        monitor_thread.start()
-        
-        # Wait for process to complete
-        stdout, stderr = process.communicate()
-        
-        # Stop monitoring
-        self.monitoring = False
-        monitor_thread.join(timeout=1)
+        # Sample system resources alongside the process; the sampler takes a last
+        # reading and returns as soon as the process exits
+        exited = asyncio.ensure_future(process.wait())
+        sampler = asyncio.create_task(
+            self._sample_resources(exited, sample_interval, cpu_samples, memory_samples)
+        )
+        await exited
+        await sampler
         
         end_time = datetime.now()
         duration = (end_time - start_time).total_seconds()
         
         # Collect final network and disk stats
-        end_network = psutil.net_io_counters()
-        end_disk = psutil.disk_io_counters()
-        
-        # Parse Ansible output for task and host information
-        task_count, host_count, success_rate = self._parse_ansible_output(stdout, stderr)
+        end_network = self._net_io_counters()
+        end_disk = self._disk_io_counters()
+        
+        stdout = stderr = ""
+        with stdout_file, stderr_file:
+            # Parse Ansible output for task and host information straight from the
+            # page cache; it is only read into memory if the caller wants it back
+            if os.fstat(stdout_file.fileno()).st_size:
+                with mmap.mmap(stdout_file.fileno(), 0, access=mmap.ACCESS_READ) as output:
+                    task_count, host_count, success_rate = self._parse_ansible_output(output)
+            else:
+                task_count, host_count, success_rate = self._parse_ansible_output(b"")
+            
+            if capture_output:
+                stdout_file.seek(0)
+                stderr_file.seek(0)
+                stdout = stdout_file.read().decode(errors="replace")
+                stderr = stderr_file.read().decode(errors="replace")
+        
+        net_bytes_sent, net_bytes_recv, net_packets_sent, net_packets_recv = (
+            end - start for start, end in zip(start_network, end_network)
+        )
+        disk_read_bytes, disk_write_bytes, disk_read_count, disk_write_count = (
+            (end - start for start, end in zip(start_disk, end_disk))
+            if end_disk and start_disk else (0, 0, 0, 0)
+        )
         
         # Create performance metrics
         metrics = PerformanceMetrics(
@@ -122,18 +261,14 @@ class AnsiblePerformanceMonitor:
             cpu_usage_max=max(cpu_samples) if cpu_samples else 0,
             memory_usage_avg=sum(memory_samples) / len(memory_samples) if memory_samples else 0,
             memory_usage_max=max(memory_samples) if memory_samples else 0,
-            network_io={
-                "bytes_sent": end_network.bytes_sent - start_network.bytes_sent,
-                "bytes_recv": end_network.bytes_recv - start_network.bytes_recv,
-                "packets_sent": end_network.packets_sent - start_network.packets_sent,
-                "packets_recv": end_network.packets_recv - start_network.packets_recv
-            },
-            disk_io={
-                "read_bytes": end_disk.read_bytes - start_disk.read_bytes if end_disk and start_disk else 0,
-                "write_bytes": end_disk.write_bytes - start_disk.write_bytes if end_disk and start_disk else 0,
-                "read_count": end_disk.read_count - start_disk.read_count if end_disk and start_disk else 0,
-                "write_count": end_disk.write_count - start_disk.write_count if end_disk and start_disk else 0
-            },
+            net_bytes_sent=net_bytes_sent,
+            net_bytes_recv=net_bytes_recv,
+            net_packets_sent=net_packets_sent,
+            net_packets_recv=net_packets_recv,
+            disk_read_bytes=disk_read_bytes,
+            disk_write_bytes=disk_write_bytes,
+            disk_read_count=disk_read_count,
+            disk_write_count=disk_write_count,
             task_count=task_count,
             host_count=host_count,
             success_rate=success_rate
@@ -141,33 +276,40 @@ class AnsiblePerformanceMonitor:
         
         return metrics, stdout, stderr, process.returncode
     
-    def _parse_ansible_output(self, stdout: str, stderr: str) -> tuple:
+    async def _sample_resources(self, exited: asyncio.Future, sample_interval: float,
+                                cpu_samples: array, memory_samples: array):
+        """Append CPU and memory usage every sample interval, and once more when the process exits"""
+        # With no positive interval the only reading spans the whole run
+        timeout = sample_interval if sample_interval > 0 else None
+        
+        while True:
+            # Wakes on whichever comes first, so the final partial interval is still measured
+            done, _ = await asyncio.wait({exited}, timeout=timeout)
+            try:
+                cpu_samples.append(psutil.cpu_percent(interval=None))
+                memory_samples.append(psutil.virtual_memory().percent)
+            except (psutil.Error, OSError) as e:
+                logger.debug("Resource sample failed: %s", e)
+            if done:
+                break
+    
+    def _parse_ansible_output(self, stdout: bytes) -> tuple:
         """Parse Ansible output to extract task and host information"""
-        task_count = 0
-        host_count = 0
         success_rate = 0.0
         
-        lines = stdout.split('\n')
-        
         # Count tasks (lines starting with "TASK [")
-        task_count = len([line for line in lines if line.strip().startswith('TASK [')])
+        task_count = sum(1 for _ in _TASK_RE.finditer(stdout))
         
-        # Look for play recap section
-        in_recap = False
+        # Parse recap lines like: "hostname : ok=5 changed=0 unreachable=0 failed=0"
         successful_hosts = 0
         total_hosts = 0
+        recap_start = stdout.find(b'PLAY RECAP')
         
-        for line in lines:
-            if 'PLAY RECAP' in line:
-                in_recap = True
-                continue
-            
-            if in_recap:
-                # Parse recap lines like: "hostname : ok=5 changed=0 failed=0 skipped=0"
-                if ':' in line and ('ok=' in line or 'failed=' in line):
-                    total_hosts += 1
-                    if 'failed=0' in line and 'unreachable=0' in line:
-                        successful_hosts += 1
+        if recap_start != -1:
+            for unreachable, failed in _RECAP_RE.findall(stdout, recap_start):
+                total_hosts += 1
+                if unreachable == b'0' and failed == b'0':
+                    successful_hosts += 1
         
         host_count = total_hosts
         if total_hosts > 0:
@@ -179,8 +321,14 @@ class AnsiblePerformanceMonitor:
                            playbook_name: str,
                            inventory: str = "production",
                            iterations: int = 1,
-                           sample_interval: float = 1.0) -> List[PerformanceMetrics]:
-        """Run performance test with multiple iterations"""
+                           sample_interval: float = 1.0,
+                           concurrency: int = 1) -> List[PerformanceMetrics]:
+        """Run performance test with multiple iterations
+        
+        With concurrency > 1, iterations run in parallel worker processes.
+        Resource samples are system-wide, so concurrent runs see each
+        other's CPU and memory load.
+        """
         
         playbook_path = self.base_path / "playbooks" / playbook_name
         if not playbook_path.exists():
@@ -200,11 +348,29 @@ class AnsiblePerformanceMonitor:
         with Progress(console=self.console) as progress:
             task = progress.add_task(f"Running performance test ({iterations} iterations)...", total=iterations)
             
+            if concurrency > 1 and iterations > 1:
+                progress.console.print(f"[blue]Running {iterations} iterations, {concurrency} at a time...[/blue]")
+                
+                # Separate processes keep each iteration's monitoring state apart
+                with ProcessPoolExecutor(max_workers=min(concurrency, iterations)) as executor:
+                    futures = [
+                        executor.submit(_run_monitored_iteration, str(self.base_path), cmd, sample_interval)
+                        for _ in range(iterations)
+                    ]
+                    
+                    for future in as_completed(futures):
+                        results.append(future.result())
+                        progress.advance(task)
+                
+                results.sort(key=lambda m: m.start_time)
+                return results
+            
             for i in range(iterations):
                 progress.console.print(f"[blue]Running iteration {i+1}/{iterations}...[/blue]")
                 
+                # Only the metrics are kept, so the output is never read into memory
                 metrics, stdout, stderr, return_code = self.monitor_playbook_execution(
-                    cmd, sample_interval
+                    cmd, sample_interval, capture_output=False
                 )
                 
                 results.append(metrics)
@@ -212,53 +378,69 @@ class AnsiblePerformanceMonitor:
                 
                 # Brief pause between iterations
                 if i < iterations - 1:
-                    time.sleep(2)
+                    self._settle()
         
         return results
     
+    def _settle(self, timeout: float = ITERATION_PAUSE):
+        """Wait until system CPU drops below SETTLE_CPU_PERCENT, for at most timeout seconds"""
+        deadline = time.monotonic() + timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+            # Sleeps for the window while measuring it
+            if psutil.cpu_percent(interval=min(0.25, remaining)) < SETTLE_CPU_PERCENT:
+                return
+    
     def analyze_performance(self, metrics_list: List[PerformanceMetrics]) -> Dict:
         """Analyze performance metrics and provide insights"""
         
         if not metrics_list:
             return {"error": "No metrics to analyze"}
         
-        # Calculate averages and statistics
-        durations = [m.duration for m in metrics_list]
-        cpu_avgs = [m.cpu_usage_avg for m in metrics_list]
-        cpu_maxs = [m.cpu_usage_max for m in metrics_list]
-        memory_avgs = [m.memory_usage_avg for m in metrics_list]
-        memory_maxs = [m.memory_usage_max for m in metrics_list]
+        # Transpose the runs into one column per metric in a single pass
+        (durations, cpu_avgs, cpu_maxs, memory_avgs, memory_maxs,
+         bytes_sent, bytes_recv, task_counts, host_counts, success_rates) = zip(*(
+            (m.duration, m.cpu_usage_avg, m.cpu_usage_max, m.memory_usage_avg, m.memory_usage_max,
+             m.net_bytes_sent, m.net_bytes_recv,
+             m.task_count, m.host_count, m.success_rate)
+            for m in metrics_list
+        ))
+        runs = len(metrics_list)
+        total_sent = sum(bytes_sent)
+        total_recv = sum(bytes_recv)
         
         analysis = {
             "execution_stats": {
-                "iterations": len(metrics_list),
-                "avg_duration": sum(durations) / len(durations),
+                "iterations": runs,
+                "avg_duration": sum(durations) / runs,
                 "min_duration": min(durations),
                 "max_duration": max(durations),
                 "duration_variance": self._calculate_variance(durations)
             },
             "resource_usage": {
                 "cpu": {
-                    "avg_usage": sum(cpu_avgs) / len(cpu_avgs),
+                    "avg_usage": sum(cpu_avgs) / runs,
                     "max_usage": max(cpu_maxs),
-                    "avg_peak": sum(cpu_maxs) / len(cpu_maxs)
+                    "avg_peak": sum(cpu_maxs) / runs
                 },
                 "memory": {
-                    "avg_usage": sum(memory_avgs) / len(memory_avgs),
+                    "avg_usage": sum(memory_avgs) / runs,
                     "max_usage": max(memory_maxs),
-                    "avg_peak": sum(memory_maxs) / len(memory_maxs)
+                    "avg_peak": sum(memory_maxs) / runs
                 }
             },
             "network_io": {
-                "total_bytes_sent": sum(m.network_io["bytes_sent"] for m in metrics_list),
-                "total_bytes_recv": sum(m.network_io["bytes_recv"] for m in metrics_list),
-                "avg_bytes_sent": sum(m.network_io["bytes_sent"] for m in metrics_list) / len(metrics_list),
-                "avg_bytes_recv": sum(m.network_io["bytes_recv"] for m in metrics_list) / len(metrics_list)
+                "total_bytes_sent": total_sent,
+                "total_bytes_recv": total_recv,
+                "avg_bytes_sent": total_sent / runs,
+                "avg_bytes_recv": total_recv / runs
             },
             "playbook_stats": {
-                "avg_tasks": sum(m.task_count for m in metrics_list) / len(metrics_list),
-                "avg_hosts": sum(m.host_count for m in metrics_list) / len(metrics_list),
-                "avg_success_rate": sum(m.success_rate for m in metrics_list) / len(metrics_list)
+                "avg_tasks": sum(task_counts) / runs,
+                "avg_hosts": sum(host_counts) / runs,
+                "avg_success_rate": sum(success_rates) / runs
             }
         }
         
@@ -274,7 +456,8 @@ class AnsiblePerformanceMonitor:
             return 0.0
         
         mean = sum(values) / len(values)
-        return sum((x - mean) ** 2 for x in values) / len(values)
+        # A list comprehension with a plain multiply is the fastest pure-Python pass here
+        return sum([(x - mean) * (x - mean) for x in values]) / len(values)
     
     def _generate_recommendations(self, analysis: Dict, metrics_list: List[PerformanceMetrics]) -> List[str]:
         """Generate performance optimization recommendations"""
@@ -338,9 +521,7 @@ class AnsiblePerformanceMonitor:
         
         # Execution Statistics
         exec_stats = analysis["execution_stats"]
-        stats_table = Table(title="Execution Statistics")
-        stats_table.add_column("Metric", style="cyan")
-        stats_table.add_column("Value", style="white")
+        stats_table = _report_table("Execution Statistics")
         
         stats_table.add_row("Iterations", str(exec_stats["iterations"]))
         stats_table.add_row("Average Duration", f"{exec_stats['avg_duration']:.2f} seconds")
@@ -353,20 +534,16 @@ class AnsiblePerformanceMonitor:
         
         # Resource Usage
         resource_stats = analysis["resource_usage"]
-        resource_table = Table(title="Resource Usage")
-        resource_table.add_column("Resource", style="cyan")
-        resource_table.add_column("Average", style="white")
-        resource_table.add_column("Peak", style="white")
-        resource_table.add_column("Status", style="bold")
+        resource_table = _report_table("Resource Usage")
         
         # CPU status
         cpu_avg = resource_stats["cpu"]["avg_usage"]
-        cpu_status = "[green]Good[/green]" if cpu_avg < 50 else "[yellow]Moderate[/yellow]" if cpu_avg < 80 else "[red]High[/red]"
+        cpu_status = _RESOURCE_STATUS[(cpu_avg >= 50) + (cpu_avg >= 80)]
         resource_table.add_row("CPU Usage", f"{cpu_avg:.1f}%", f"{resource_stats['cpu']['max_usage']:.1f}%", cpu_status)
         
         # Memory status
         mem_avg = resource_stats["memory"]["avg_usage"]
-        mem_status = "[green]Good[/green]" if mem_avg < 50 else "[yellow]Moderate[/yellow]" if mem_avg < 80 else "[red]High[/red]"
+        mem_status = _RESOURCE_STATUS[(mem_avg >= 50) + (mem_avg >= 80)]
         resource_table.add_row("Memory Usage", f"{mem_avg:.1f}%", f"{resource_stats['memory']['max_usage']:.1f}%", mem_status)
         
         self.console.print(resource_table)
@@ -374,10 +551,7 @@ class AnsiblePerformanceMonitor:
         
         # Network I/O
         network_stats = analysis["network_io"]
-        network_table = Table(title="Network I/O")
-        network_table.add_column("Direction", style="cyan")
-        network_table.add_column("Total", style="white")
-        network_table.add_column("Average per Run", style="white")
+        network_table = _report_table("Network I/O")
         
         network_table.add_row("Bytes Sent", self._format_bytes(network_stats["total_bytes_sent"]), 
                              self._format_bytes(network_stats["avg_bytes_sent"]))
@@ -389,9 +563,7 @@ class AnsiblePerformanceMonitor:
         
         # Playbook Statistics
         playbook_stats = analysis["playbook_stats"]
-        playbook_table = Table(title="Playbook Statistics")
-        playbook_table.add_column("Metric", style="cyan")
-        playbook_table.add_column("Average", style="white")
+        playbook_table = _report_table("Playbook Statistics")
         
         playbook_table.add_row("Tasks per Run", f"{playbook_stats['avg_tasks']:.0f}")
         playbook_table.add_row("Hosts per Run", f"{playbook_stats['avg_hosts']:.0f}")
@@ -411,25 +583,93 @@ class AnsiblePerformanceMonitor:
     
     def _format_bytes(self, bytes_count: int) -> str:
         """Format bytes in human readable format"""
-        for unit in ['B', 'KB', 'MB', 'GB']:
-            if bytes_count < 1024.0:
-                return f"{bytes_count:.1f} {unit}"
-            bytes_count /= 1024.0
-        return f"{bytes_count:.1f} TB"
+        # Each unit spans 10 bits, so the bit length picks the unit directly
+        unit = min(max(int(bytes_count).bit_length() - 1, 0) // 10, len(_BYTE_UNITS) - 1)
+        return f"{bytes_count / (1 << (10 * unit)):.1f} {_BYTE_UNITS[unit]}"
     
     def save_metrics(self, metrics_list: List[PerformanceMetrics], filename: str):
-        """Save metrics to JSON file"""
-        metrics_data = [asdict(metric) for metric in metrics_list]
+        """Save metrics to a JSON file, MessagePack for .msgpack, or append to a .ndjson file"""
+        metrics_data = [_metrics_to_dict(metric) for metric in metrics_list]
         
         reports_dir = self.base_path / "reports"
         reports_dir.mkdir(exist_ok=True)
         
         output_file = reports_dir / filename
-        with open(output_file, 'w') as f:
-            json.dump(metrics_data, f, indent=2)
+        if output_file.suffix == ".msgpack":
+            if msgpack is None:
+                self.console.print("[red]msgpack is not installed - use a .json filename or pip install msgpack[/red]")
+                return
+            output_file.write_bytes(msgpack.packb(metrics_data))
+        elif output_file.suffix == ".ndjson":
+            # One metric per line, appended so repeated runs build up a single history
+            with open(output_file, 'ab') as f:
+                f.write(b"".join(_ndjson_line(data) for data in metrics_data))
+        elif orjson is not None:
+            output_file.write_bytes(orjson.dumps(metrics_data, option=orjson.OPT_INDENT_2))
+        else:
+            output_file.write_text(json.dumps(metrics_data, indent=2))
         
         self.console.print(f"[green]Metrics saved to: {output_file}[/green]")
 
+def _ndjson_line(data: Dict) -> bytes:
+    """Serialize one record as a newline-terminated compact JSON line"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(data, separators=(",", ":")) + "\n").encode()
+
+def _report_table(title: str) -> Table:
+    """Create an empty report table with the columns defined for its title"""
+    table = Table(title=title)
+    for header, style in _REPORT_COLUMNS[title]:
+        table.add_column(header, style=style)
+    return table
+
+def _metrics_to_dict(metric: PerformanceMetrics) -> Dict:
+    """Convert metrics to the saved-file layout, with nested network_io and disk_io"""
+    return {
+        "start_time": metric.start_time,
+        "end_time": metric.end_time,
+        "duration": metric.duration,
+        "cpu_usage_avg": metric.cpu_usage_avg,
+        "cpu_usage_max": metric.cpu_usage_max,
+        "memory_usage_avg": metric.memory_usage_avg,
+        "memory_usage_max": metric.memory_usage_max,
+        "network_io": {
+            "bytes_sent": metric.net_bytes_sent,
+            "bytes_recv": metric.net_bytes_recv,
+            "packets_sent": metric.net_packets_sent,
+            "packets_recv": metric.net_packets_recv
+        },
+        "disk_io": {
+            "read_bytes": metric.disk_read_bytes,
+            "write_bytes": metric.disk_write_bytes,
+            "read_count": metric.disk_read_count,
+            "write_count": metric.disk_write_count
+        },
+        "task_count": metric.task_count,
+        "host_count": metric.host_count,
+        "success_rate": metric.success_rate
+    }
+
+def _pread_all(fd: int) -> bytes:
+    """Read a whole /proc file from offset 0 without reopening it"""
+    chunks = []
+    offset = 0
+    while True:
+        chunk = os.pread(fd, 65536, offset)
+        if not chunk:
+            return b"".join(chunks)
+        chunks.append(chunk)
+        offset += len(chunk)
+
+def _run_monitored_iteration(base_path: str, command: List[str], sample_interval: float) -> PerformanceMetrics:
+    """Run a single monitored iteration in a worker process"""
+    monitor = AnsiblePerformanceMonitor(base_path)
+    metrics, stdout, stderr, return_code = monitor.monitor_playbook_execution(
+        command, sample_interval, capture_output=False
+    )
+    return metrics
+
 def main():
     """Main CLI interface"""
     parser = argparse.ArgumentParser(description="Ansible Performance Monitor")
@@ -443,7 +683,10 @@ def main():
     test_parser.add_argument("-i", "--inventory", default="production", help="Inventory to use")
     test_parser.add_argument("--iterations", type=int, default=1, help="Number of test iterations")
     test_parser.add_argument("--interval", type=float, default=1.0, help="Sampling interval in seconds")
-    test_parser.add_argument("--save", help="Save metrics to JSON file")
+    test_parser.add_argument("--no-sampling", action="store_true",
+                             help="Take one CPU/memory reading per run instead of periodic samples (for short playbooks)")
+    test_parser.add_argument("--concurrency", type=int, default=1, help="Number of iterations to run in parallel")
+    test_parser.add_argument("--save", help="Save metrics to a JSON (or .msgpack, or appended .ndjson) file")
     
     # Monitor command (for monitoring existing executions)
     monitor_parser = subparsers.add_parser("monitor", help="Monitor playbook execution")
@@ -467,7 +710,8 @@ def main():
                 playbook_name=args.playbook,
                 inventory=args.inventory,
                 iterations=args.iterations,
-                sample_interval=args.interval
+                sample_interval=0 if args.no_sampling else args.interval,
+                concurrency=args.concurrency
             )
             
             # Analyze results
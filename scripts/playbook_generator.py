@@ -8,129 +8,34 @@ Supports multi-vendor network device configurations
 import os
 import sys
 import argparse
-import yaml
 import json
+import textwrap
+import yaml
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Union
+from types import MappingProxyType, SimpleNamespace
+from typing import Dict, List, Optional, Tuple, Union
 from jinja2 import Environment, FileSystemLoader, Template
-from rich.console import Console
-from rich.prompt import Prompt, Confirm, IntPrompt
-from rich.table import Table
-from rich.panel import Panel
 import logging
 
+# Prefer the libyaml-backed dumper; fall back to the pure-Python one
+try:
+    from yaml import CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeDumper
+
+# Optional faster JSON codec for --vars
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Setup logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-class PlaybookGenerator:
-    """Generator for Ansible playbooks"""
-    
-    def __init__(self, base_path: str = None):
-        self.console = Console()
-        self.base_path = Path(base_path) if base_path else Path.cwd()
-        self.playbook_path = self.base_path / "playbooks"
-        self.templates_path = self.base_path / "templates"
-        self.roles_path = self.base_path / "roles"
-        
-        # Ensure directories exist
-        self.playbook_path.mkdir(exist_ok=True)
-        self.templates_path.mkdir(exist_ok=True)
-        self.roles_path.mkdir(exist_ok=True)
-        
-        # Setup Jinja2 environment
-        self.jinja_env = Environment(
-            loader=FileSystemLoader(str(self.templates_path)),
-            trim_blocks=True,
-            lstrip_blocks=True
-        )
-        
-        # Playbook templates
-        self.playbook_templates = {
-            "basic_config": self._basic_config_template(),
-            "backup_config": self._backup_config_template(),
-            "security_hardening": self._security_hardening_template(),
-            "monitoring_config": self._monitoring_config_template(),
-            "compliance_audit": self._compliance_audit_template(),
-            "firmware_update": self._firmware_update_template(),
-            "network_troubleshooting": self._troubleshooting_template(),
-            "disaster_recovery": self._disaster_recovery_template()
-        }
-        
-        # Device type configurations
-        self.device_configs = {
-            "cisco_ios": {
-                "connection": "network_cli",
-                "network_os": "ios",
-                "modules": ["ios_config", "ios_command", "ios_facts", "ios_vlans", "ios_interfaces"]
-            },
-            "cisco_nxos": {
-                "connection": "network_cli", 
-                "network_os": "nxos",
-                "modules": ["nxos_config", "nxos_command", "nxos_facts", "nxos_vlans", "nxos_interfaces"]
-            },
-            "arista_eos": {
-                "connection": "httpapi",
-                "network_os": "eos", 
-                "modules": ["eos_config", "eos_command", "eos_facts", "eos_vlans", "eos_interfaces"]
-            },
-            "juniper_junos": {
-                "connection": "netconf",
-                "network_os": "junos",
-                "modules": ["junos_config", "junos_command", "junos_facts", "junos_vlans", "junos_interfaces"]
-            },
-            "palo_alto": {
-                "connection": "local",
-                "modules": ["panos_config_element", "panos_op", "panos_facts", "panos_security_rule"]
-            },
-            "fortinet": {
-                "connection": "httpapi",
-                "modules": ["fortios_configuration_fact", "fortios_system_global", "fortios_firewall_policy"]
-            }
-        }
-    
-    def generate_playbook(self, 
-                         playbook_type: str,
-                         device_types: List[str],
-                         playbook_name: str,
-                         custom_vars: Dict = None) -> bool:
-        """Generate a playbook based on type and device configuration"""
-        
-        if playbook_type not in self.playbook_templates:
-            self.console.print(f"[red]Unknown playbook type: {playbook_type}[/red]")
-            return False
-        
-        # Get template
-        template_content = self.playbook_templates[playbook_type]
-        
-        # Prepare variables
-        template_vars = {
-            "device_types": device_types,
-            "device_configs": self.device_configs,
-            "playbook_name": playbook_name,
-            "custom_vars": custom_vars or {}
-        }
-        
-        # Render template
-        try:
-            template = Template(template_content)
-            playbook_content = template.render(**template_vars)
-            
-            # Write playbook file
-            playbook_file = self.playbook_path / f"{playbook_name}.yml"
-            with open(playbook_file, 'w') as f:
-                f.write(playbook_content)
-            
-            self.console.print(f"[green]✓ Generated playbook: {playbook_file}[/green]")
-            return True
-            
-        except Exception as e:
-            self.console.print(f"[red]Error generating playbook: {str(e)}[/red]")
-            return False
-    
-    def _basic_config_template(self) -> str:
-        """Basic device configuration template"""
-        return """---
+# Basic device configuration template
+BASIC_CONFIG_TEMPLATE = """---
 - name: {{ playbook_name | title }}
   hosts: "{{ '{{ target_hosts | default(\"all\") }}' }}"
   gather_facts: false
@@ -139,15 +44,11 @@ class PlaybookGenerator:
   vars:
     ansible_command_timeout: 60
     ansible_connect_timeout: 60
-{% if custom_vars %}
-{% for key, value in custom_vars.items() %}
-    {{ key }}: {{ value }}
-{% endfor %}
-{% endif %}
+{{ custom_vars_block }}
 
   tasks:
     - name: Gather device facts
-      {{ device_configs[device_types[0]]['modules'][2] }}:
+      {{ dev_modules[device_types[0]].facts }}:
       register: device_facts
       when: ansible_network_os == "{{ device_configs[device_types[0]]['network_os'] }}"
 
@@ -156,26 +57,26 @@ class PlaybookGenerator:
         msg: "Device {{ '{{ inventory_hostname }}' }} is running {{ '{{ device_facts.ansible_facts.ansible_net_version }}' }}"
       when: device_facts is defined
 
-{% for device_type in device_types %}
+{% for device_type in device_types %}{% set dev = dev_modules[device_type] %}
     - name: Configure {{ device_type }} devices
       block:
         - name: Apply basic configuration
-          {{ device_configs[device_type]['modules'][0] }}:
+          {{ dev.config }}:
             lines:
               - hostname {{ '{{ inventory_hostname }}' }}
               - no ip domain-lookup
               - ip domain-name {{ '{{ domain_name | default("example.com") }}' }}
               - ntp server {{ '{{ ntp_server | default("pool.ntp.org") }}' }}
             save_when: changed
-          when: ansible_network_os == "{{ device_configs[device_type].get('network_os', device_type) }}"
+          when: ansible_network_os == "{{ dev.network_os }}"
           
         - name: Verify configuration
-          {{ device_configs[device_type]['modules'][1] }}:
+          {{ dev.command }}:
             commands:
               - show running-config | include hostname
               - show running-config | include ntp
           register: config_verification
-          when: ansible_network_os == "{{ device_configs[device_type].get('network_os', device_type) }}"
+          when: ansible_network_os == "{{ dev.network_os }}"
           
       rescue:
         - name: Configuration failed for {{ device_type }}
@@ -195,9 +96,8 @@ class PlaybookGenerator:
         configuration_status: "{{ '{{ config_verification.stdout if config_verification is defined else \"Not verified\" }}' }}"
 """
 
-    def _backup_config_template(self) -> str:
-        """Configuration backup template"""
-        return """---
+# Configuration backup template
+BACKUP_CONFIG_TEMPLATE = """---
 - name: {{ playbook_name | title }}
   hosts: "{{ '{{ target_hosts | default(\"all\") }}' }}"
   gather_facts: false
@@ -215,15 +115,15 @@ class PlaybookGenerator:
       delegate_to: localhost
       run_once: true
 
-{% for device_type in device_types %}
+{% for device_type in device_types %}{% set dev = dev_modules[device_type] %}
     - name: Backup {{ device_type }} configuration
       block:
         - name: Get running configuration
-          {{ device_configs[device_type]['modules'][1] }}:
+          {{ dev.command }}:
             commands:
               - show running-config
           register: running_config
-          when: ansible_network_os == "{{ device_configs[device_type].get('network_os', device_type) }}"
+          when: ansible_network_os == "{{ dev.network_os }}"
 
         - name: Save configuration backup
           copy:
@@ -256,9 +156,8 @@ class PlaybookGenerator:
         backup_timestamp: "{{ '{{ ansible_date_time.iso8601 }}' }}"
 """
 
-    def _security_hardening_template(self) -> str:
-        """Security hardening template"""
-        return """---
+# Security hardening template
+SECURITY_HARDENING_TEMPLATE = """---
 - name: {{ playbook_name | title }}
   hosts: "{{ '{{ target_hosts | default(\"all\") }}' }}"
   gather_facts: false
@@ -272,18 +171,18 @@ class PlaybookGenerator:
       **************************************************************************
 
   tasks:
-{% for device_type in device_types %}
+{% for device_type in device_types %}{% set dev = dev_modules[device_type] %}
     - name: Apply security hardening for {{ device_type }}
       block:
         - name: Configure login banner
-          {{ device_configs[device_type]['modules'][0] }}:
+          {{ dev.config }}:
             lines:
               - banner login ^{{ '{{ security_banner }}' }}^
             save_when: changed
-          when: ansible_network_os == "{{ device_configs[device_type].get('network_os', device_type) }}"
-
+          when: ansible_network_os == "{{ dev.network_os }}"
+{% if dev.network_os in ('ios', 'nxos') %}
         - name: Disable unused services
-          {{ device_configs[device_type]['modules'][0] }}:
+          {{ dev.config }}:
             lines:
               - no ip http server
               - no ip http secure-server
@@ -292,40 +191,34 @@ class PlaybookGenerator:
               - no service finger
               - no ip bootp server
             save_when: changed
-          when: 
-            - ansible_network_os == "{{ device_configs[device_type].get('network_os', device_type) }}"
-            - device_configs[device_type].get('network_os') in ['ios', 'nxos']
+          when: ansible_network_os == "{{ dev.network_os }}"
 
         - name: Configure password policies
-          {{ device_configs[device_type]['modules'][0] }}:
+          {{ dev.config }}:
             lines:
               - service password-encryption
               - security passwords min-length 8
               - login block-for 120 attempts 3 within 60
             save_when: changed
-          when: 
-            - ansible_network_os == "{{ device_configs[device_type].get('network_os', device_type) }}"
-            - device_configs[device_type].get('network_os') in ['ios', 'nxos']
+          when: ansible_network_os == "{{ dev.network_os }}"
 
         - name: Configure SSH security
-          {{ device_configs[device_type]['modules'][0] }}:
+          {{ dev.config }}:
             lines:
               - ip ssh version 2
               - ip ssh time-out 60
               - ip ssh authentication-retries 2
             save_when: changed
-          when: 
-            - ansible_network_os == "{{ device_configs[device_type].get('network_os', device_type) }}"
-            - device_configs[device_type].get('network_os') in ['ios', 'nxos']
-
+          when: ansible_network_os == "{{ dev.network_os }}"
+{% endif %}
         - name: Verify security settings
-          {{ device_configs[device_type]['modules'][1] }}:
+          {{ dev.command }}:
             commands:
               - show running-config | include banner
               - show running-config | include service password-encryption
               - show ip ssh
           register: security_verification
-          when: ansible_network_os == "{{ device_configs[device_type].get('network_os', device_type) }}"
+          when: ansible_network_os == "{{ dev.network_os }}"
 {% endfor %}
 
     - name: Generate security compliance report
@@ -337,9 +230,8 @@ class PlaybookGenerator:
         security_check_results: "{{ '{{ security_verification.stdout if security_verification is defined else [] }}' }}"
 """
 
-    def _monitoring_config_template(self) -> str:
-        """Monitoring configuration template"""
-        return """---
+# Monitoring configuration template
+MONITORING_CONFIG_TEMPLATE = """---
 - name: {{ playbook_name | title }}
   hosts: "{{ '{{ target_hosts | default(\"all\") }}' }}"
   gather_facts: false
@@ -353,35 +245,31 @@ class PlaybookGenerator:
       - "{{ '{{ ntp_server2 | default(\"1.pool.ntp.org\") }}' }}"
 
   tasks:
-{% for device_type in device_types %}
+{% for device_type in device_types %}{% set dev = dev_modules[device_type] %}
     - name: Configure monitoring for {{ device_type }}
-      block:
+      block:{% if dev.network_os in ('ios', 'nxos') %}
         - name: Configure SNMP
-          {{ device_configs[device_type]['modules'][0] }}:
+          {{ dev.config }}:
             lines:
               - snmp-server community {{ '{{ snmp_community }}' }} RO
               - snmp-server location {{ '{{ site_location | default("Datacenter") }}' }}
               - snmp-server contact {{ '{{ admin_contact | default("admin@example.com") }}' }}
               - snmp-server enable traps
             save_when: changed
-          when: 
-            - ansible_network_os == "{{ device_configs[device_type].get('network_os', device_type) }}"
-            - device_configs[device_type].get('network_os') in ['ios', 'nxos']
+          when: ansible_network_os == "{{ dev.network_os }}"
 
         - name: Configure syslog
-          {{ device_configs[device_type]['modules'][0] }}:
+          {{ dev.config }}:
             lines:
               - logging {{ '{{ syslog_server }}' }}
               - logging trap informational
               - logging source-interface Loopback0
               - service timestamps log datetime msec
             save_when: changed
-          when: 
-            - ansible_network_os == "{{ device_configs[device_type].get('network_os', device_type) }}"
-            - device_configs[device_type].get('network_os') in ['ios', 'nxos']
+          when: ansible_network_os == "{{ dev.network_os }}"
 
         - name: Configure NTP
-          {{ device_configs[device_type]['modules'][0] }}:
+          {{ dev.config }}:
             lines: |
               {% raw %}
               {% for ntp_server in ntp_servers %}
@@ -390,18 +278,16 @@ class PlaybookGenerator:
               {% endraw %}
               ntp update-calendar
             save_when: changed
-          when: 
-            - ansible_network_os == "{{ device_configs[device_type].get('network_os', device_type) }}"
-            - device_configs[device_type].get('network_os') in ['ios', 'nxos']
-
+          when: ansible_network_os == "{{ dev.network_os }}"
+{% endif %}
         - name: Verify monitoring configuration
-          {{ device_configs[device_type]['modules'][1] }}:
+          {{ dev.command }}:
             commands:
               - show snmp community
               - show logging
               - show ntp status
           register: monitoring_verification
-          when: ansible_network_os == "{{ device_configs[device_type].get('network_os', device_type) }}"
+          when: ansible_network_os == "{{ dev.network_os }}"
 {% endfor %}
 
     - name: Create monitoring report
@@ -413,9 +299,8 @@ class PlaybookGenerator:
         monitoring_status: "{{ '{{ monitoring_verification.stdout if monitoring_verification is defined else [] }}' }}"
 """
 
-    def _compliance_audit_template(self) -> str:
-        """Compliance audit template"""
-        return """---
+# Compliance audit template
+COMPLIANCE_AUDIT_TEMPLATE = """---
 - name: {{ playbook_name | title }}
   hosts: "{{ '{{ target_hosts | default(\"all\") }}' }}"
   gather_facts: true
@@ -434,15 +319,15 @@ class PlaybookGenerator:
         expected: "banner"
 
   tasks:
-{% for device_type in device_types %}
+{% for device_type in device_types %}{% set dev = dev_modules[device_type] %}
     - name: Run compliance audit for {{ device_type }}
       block:
         - name: Execute compliance checks
-          {{ device_configs[device_type]['modules'][1] }}:
+          {{ dev.command }}:
             commands: "{{ '{{ item.command }}' }}"
           register: compliance_results
           loop: "{{ '{{ compliance_checks }}' }}"
-          when: ansible_network_os == "{{ device_configs[device_type].get('network_os', device_type) }}"
+          when: ansible_network_os == "{{ dev.network_os }}"
 
         - name: Evaluate compliance results
           set_fact:
@@ -479,9 +364,8 @@ class PlaybookGenerator:
         audit_results: "{{ '{{ compliance_status | default([]) }}' }}"
 """
 
-    def _firmware_update_template(self) -> str:
-        """Firmware update template"""
-        return """---
+# Firmware update template
+FIRMWARE_UPDATE_TEMPLATE = """---
 - name: {{ playbook_name | title }}
   hosts: "{{ '{{ target_hosts | default(\"all\") }}' }}"
   gather_facts: false
@@ -500,22 +384,22 @@ class PlaybookGenerator:
       delegate_to: localhost
       run_once: true
 
-{% for device_type in device_types %}
+{% for device_type in device_types %}{% set dev = dev_modules[device_type] %}
     - name: Firmware update for {{ device_type }}
       block:
         - name: Check current firmware version
-          {{ device_configs[device_type]['modules'][1] }}:
+          {{ dev.command }}:
             commands:
               - show version
           register: current_version
-          when: ansible_network_os == "{{ device_configs[device_type].get('network_os', device_type) }}"
+          when: ansible_network_os == "{{ dev.network_os }}"
 
         - name: Backup current configuration
-          {{ device_configs[device_type]['modules'][1] }}:
+          {{ dev.command }}:
             commands:
               - show running-config
           register: running_config
-          when: ansible_network_os == "{{ device_configs[device_type].get('network_os', device_type) }}"
+          when: ansible_network_os == "{{ dev.network_os }}"
 
         - name: Save pre-update backup
           copy:
@@ -531,24 +415,24 @@ class PlaybookGenerator:
           when: running_config is defined
 
         - name: Copy firmware image
-          {{ device_configs[device_type]['modules'][0] }}:
+          {{ dev.config }}:
             lines:
               - copy {{ '{{ firmware_server }}' }}/{{ '{{ firmware_image }}' }} bootflash:
           when: 
-            - ansible_network_os == "{{ device_configs[device_type].get('network_os', device_type) }}"
+            - ansible_network_os == "{{ dev.network_os }}"
             - firmware_image is defined
 
         - name: Set boot image
-          {{ device_configs[device_type]['modules'][0] }}:
+          {{ dev.config }}:
             lines:
               - boot system bootflash:{{ '{{ firmware_image }}' }}
             save_when: changed
           when: 
-            - ansible_network_os == "{{ device_configs[device_type].get('network_os', device_type) }}"
+            - ansible_network_os == "{{ dev.network_os }}"
             - firmware_image is defined
 
         - name: Verify firmware installation
-          {{ device_configs[device_type]['modules'][1] }}:
+          {{ dev.command }}:
             commands:
               - show boot
               - dir bootflash: | include {{ '{{ firmware_image }}' }}
@@ -566,55 +450,54 @@ class PlaybookGenerator:
         firmware_status: "{{ '{{ firmware_verification.stdout if firmware_verification is defined else [] }}' }}"
 """
 
-    def _troubleshooting_template(self) -> str:
-        """Network troubleshooting template"""
-        return """---
+# Network troubleshooting template
+TROUBLESHOOTING_TEMPLATE = """---
 - name: {{ playbook_name | title }}
   hosts: "{{ '{{ target_hosts | default(\"all\") }}' }}"
   gather_facts: false
   connection: "{{ '{{ ansible_connection }}' }}"
   
   tasks:
-{% for device_type in device_types %}
+{% for device_type in device_types %}{% set dev = dev_modules[device_type] %}
     - name: Troubleshooting for {{ device_type }}
       block:
         - name: Collect system information
-          {{ device_configs[device_type]['modules'][1] }}:
+          {{ dev.command }}:
             commands:
               - show version
               - show processes cpu
               - show memory summary
               - show environment all
           register: system_info
-          when: ansible_network_os == "{{ device_configs[device_type].get('network_os', device_type) }}"
+          when: ansible_network_os == "{{ dev.network_os }}"
 
         - name: Collect interface status
-          {{ device_configs[device_type]['modules'][1] }}:
+          {{ dev.command }}:
             commands:
               - show interfaces status
               - show interfaces description
               - show ip interface brief
           register: interface_info
-          when: ansible_network_os == "{{ device_configs[device_type].get('network_os', device_type) }}"
+          when: ansible_network_os == "{{ dev.network_os }}"
 
         - name: Collect routing information
-          {{ device_configs[device_type]['modules'][1] }}:
+          {{ dev.command }}:
             commands:
               - show ip route summary
               - show ip protocols
               - show ip bgp summary
           register: routing_info
           ignore_errors: true
-          when: ansible_network_os == "{{ device_configs[device_type].get('network_os', device_type) }}"
+          when: ansible_network_os == "{{ dev.network_os }}"
 
         - name: Collect logs
-          {{ device_configs[device_type]['modules'][1] }}:
+          {{ dev.command }}:
             commands:
               - show logging | last 50
               - show logging | include ERROR
               - show logging | include WARN
           register: log_info
-          when: ansible_network_os == "{{ device_configs[device_type].get('network_os', device_type) }}"
+          when: ansible_network_os == "{{ dev.network_os }}"
 {% endfor %}
 
     - name: Generate troubleshooting report
@@ -629,9 +512,8 @@ class PlaybookGenerator:
         log_entries: "{{ '{{ log_info.stdout if log_info is defined else [] }}' }}"
 """
 
-    def _disaster_recovery_template(self) -> str:
-        """Disaster recovery template"""
-        return """---
+# Disaster recovery template
+DISASTER_RECOVERY_TEMPLATE = """---
 - name: {{ playbook_name | title }}
   hosts: "{{ '{{ target_hosts | default(\"all\") }}' }}"
   gather_facts: false
@@ -648,7 +530,7 @@ class PlaybookGenerator:
       delegate_to: localhost
       run_once: true
 
-{% for device_type in device_types %}
+{% for device_type in device_types %}{% set dev = dev_modules[device_type] %}
     - name: Disaster recovery for {{ device_type }}
       block:
         - name: Check if recovery config exists
@@ -658,12 +540,12 @@ class PlaybookGenerator:
           delegate_to: localhost
 
         - name: Load recovery configuration
-          {{ device_configs[device_type]['modules'][0] }}:
+          {{ dev.config }}:
             src: "{{ '{{ recovery_config_path }}' }}/{{ '{{ inventory_hostname }}' }}_recovery.cfg"
             save_when: changed
           when: 
             - recovery_file.stat.exists
-            - ansible_network_os == "{{ device_configs[device_type].get('network_os', device_type) }}"
+            - ansible_network_os == "{{ dev.network_os }}"
 
         - name: Restore from backup if no recovery config
           block:
@@ -676,22 +558,22 @@ class PlaybookGenerator:
               delegate_to: localhost
 
             - name: Load latest backup
-              {{ device_configs[device_type]['modules'][0] }}:
+              {{ dev.config }}:
                 src: "{{ '{{ (backup_files.files | sort(attribute=\"mtime\") | last).path }}' }}"
                 save_when: changed
               when: 
                 - backup_files.files | length > 0
-                - ansible_network_os == "{{ device_configs[device_type].get('network_os', device_type) }}"
+                - ansible_network_os == "{{ dev.network_os }}"
           when: not recovery_file.stat.exists
 
         - name: Verify recovery
-          {{ device_configs[device_type]['modules'][1] }}:
+          {{ dev.command }}:
             commands:
               - show running-config | include hostname
               - show ip interface brief
               - show ip route summary
           register: recovery_verification
-          when: ansible_network_os == "{{ device_configs[device_type].get('network_os', device_type) }}"
+          when: ansible_network_os == "{{ dev.network_os }}"
 {% endfor %}
 
     - name: Generate recovery report
@@ -704,8 +586,171 @@ class PlaybookGenerator:
         recovery_status: "{{ '{{ recovery_verification.stdout if recovery_verification is defined else [] }}' }}"
 """
 
+# Template source for each playbook type, read-only and shared by every generator
+PLAYBOOK_TEMPLATES = MappingProxyType({
+    "basic_config": BASIC_CONFIG_TEMPLATE,
+    "backup_config": BACKUP_CONFIG_TEMPLATE,
+    "security_hardening": SECURITY_HARDENING_TEMPLATE,
+    "monitoring_config": MONITORING_CONFIG_TEMPLATE,
+    "compliance_audit": COMPLIANCE_AUDIT_TEMPLATE,
+    "firmware_update": FIRMWARE_UPDATE_TEMPLATE,
+    "network_troubleshooting": TROUBLESHOOTING_TEMPLATE,
+    "disaster_recovery": DISASTER_RECOVERY_TEMPLATE
+})
+
+# Connection settings and modules for each device type, read-only and shared by every generator
+DEVICE_CONFIGS = MappingProxyType({
+    "cisco_ios": MappingProxyType({
+        "connection": "network_cli",
+        "network_os": "ios",
+        "modules": ("ios_config", "ios_command", "ios_facts", "ios_vlans", "ios_interfaces")
+    }),
+    "cisco_nxos": MappingProxyType({
+        "connection": "network_cli", 
+        "network_os": "nxos",
+        "modules": ("nxos_config", "nxos_command", "nxos_facts", "nxos_vlans", "nxos_interfaces")
+    }),
+    "arista_eos": MappingProxyType({
+        "connection": "httpapi",
+        "network_os": "eos", 
+        "modules": ("eos_config", "eos_command", "eos_facts", "eos_vlans", "eos_interfaces")
+    }),
+    "juniper_junos": MappingProxyType({
+        "connection": "netconf",
+        "network_os": "junos",
+        "modules": ("junos_config", "junos_command", "junos_facts", "junos_vlans", "junos_interfaces")
+    }),
+    "palo_alto": MappingProxyType({
+        "connection": "local",
+        "modules": ("panos_config_element", "panos_op", "panos_facts", "panos_security_rule")
+    }),
+    "fortinet": MappingProxyType({
+        "connection": "httpapi",
+        "modules": ("fortios_configuration_fact", "fortios_system_global", "fortios_firewall_policy")
+    })
+})
+
+# Compiled templates keyed by source, shared by every generator instance
+_COMPILED_TEMPLATES = {}
+
+def _get_compiled(playbook_type: str) -> Template:
+    """Return the compiled template for a playbook type, compiling it once"""
+    source = PLAYBOOK_TEMPLATES[playbook_type]
+    template = _COMPILED_TEMPLATES.get(source)
+    if template is None:
+        template = _COMPILED_TEMPLATES[source] = Template(source)
+    return template
+
+@lru_cache(maxsize=256)
+def _render_playbook(playbook_type: str,
+                     device_types: Tuple[str, ...],
+                     playbook_name: str,
+                     custom_vars_block: str) -> str:
+    """Render a playbook; rendering is pure, so repeated requests are served from the cache"""
+    return _get_compiled(playbook_type).render(
+        device_types=list(device_types),
+        device_configs=DEVICE_CONFIGS,
+        # Per-device module names and OS, so templates use one attribute per lookup
+        dev_modules={
+            device_type: SimpleNamespace(
+                config=DEVICE_CONFIGS[device_type]['modules'][0],
+                command=DEVICE_CONFIGS[device_type]['modules'][1],
+                facts=DEVICE_CONFIGS[device_type]['modules'][2],
+                network_os=DEVICE_CONFIGS[device_type].get('network_os', device_type)
+            )
+            for device_type in device_types
+        },
+        playbook_name=playbook_name,
+        custom_vars_block=custom_vars_block
+    )
+
+class PlaybookGenerator:
+    """Generator for Ansible playbooks"""
+    
+    # Base paths whose directories were already created in this process
+    _dirs_ready = set()
+    
+    def __init__(self, base_path: str = None):
+        self.base_path = Path(base_path) if base_path else Path.cwd()
+        self.playbook_path = self.base_path / "playbooks"
+        self.templates_path = self.base_path / "templates"
+        self.roles_path = self.base_path / "roles"
+        
+        # Path of the most recently generated playbook, if any
+        self.last_generated = None
+        
+        # Ensure directories exist, once per base path
+        key = str(self.base_path)
+        if key not in PlaybookGenerator._dirs_ready:
+            for path in (self.playbook_path, self.templates_path, self.roles_path):
+                path.mkdir(exist_ok=True)
+            PlaybookGenerator._dirs_ready.add(key)
+        
+        # Setup Jinja2 environment
+        self.jinja_env = Environment(
+            loader=FileSystemLoader(str(self.templates_path)),
+            trim_blocks=True,
+            lstrip_blocks=True
+        )
+        
+        # Playbook templates
+        self.playbook_templates = PLAYBOOK_TEMPLATES
+        
+        # Device type configurations
+        self.device_configs = DEVICE_CONFIGS
+    
+    @cached_property
+    def console(self):
+        """Rich console, created lazily since library callers may never print"""
+        from rich.console import Console
+        return Console()
+    
+    def generate_playbook(self, 
+                         playbook_type: str,
+                         device_types: List[str],
+                         playbook_name: str,
+                         custom_vars: Dict = None) -> bool:
+        """Generate a playbook based on type and device configuration"""
+        
+        if playbook_type not in self.playbook_templates:
+            self.console.print(f"[red]Unknown playbook type: {playbook_type}[/red]")
+            return False
+        
+        unknown_devices = [device_type for device_type in device_types if device_type not in self.device_configs]
+        if unknown_devices:
+            self.console.print(f"[red]Unknown device type: {', '.join(unknown_devices)}[/red]")
+            return False
+        
+        # The dumped YAML block doubles as the canonical cache key for custom_vars
+        custom_vars_block = textwrap.indent(
+            yaml.dump(custom_vars, Dumper=SafeDumper, default_flow_style=False, sort_keys=False),
+            "    "
+        ) if custom_vars else ""
+        
+        # Render template
+        try:
+            playbook_content = _render_playbook(
+                playbook_type, tuple(device_types), playbook_name, custom_vars_block
+            )
+            
+            # Write playbook file
+            playbook_file = self.playbook_path / f"{playbook_name}.yml"
+            playbook_file.write_bytes(playbook_content.encode('utf-8'))
+            
+            self.last_generated = playbook_file
+            self.console.print(f"[green]✓ Generated playbook: {playbook_file}[/green]")
+            return True
+            
+        except Exception as e:
+            self.console.print(f"[red]Error generating playbook: {str(e)}[/red]")
+            return False
+    
     def interactive_generator(self):
         """Interactive playbook generator"""
+        # Prompt and panel widgets are only needed here, so one-shot generation skips importing them
+        from rich.panel import Panel
+        from rich.prompt import Prompt, Confirm, IntPrompt
+        
         self.console.print(Panel.fit("[bold blue]Ansible Playbook Generator[/bold blue]"))
         
         # Get playbook type
@@ -752,7 +797,11 @@ class PlaybookGenerator:
                 if not var_name:
                     break
                 var_value = Prompt.ask(f"Value for {var_name}")
-                custom_vars[var_name] = var_value
+                # Typed values are YAML scalars, so "60" stays a number and "false" a boolean
+                try:
+                    custom_vars[var_name] = yaml.safe_load(var_value)
+                except yaml.YAMLError:
+                    custom_vars[var_name] = var_value
         
         # Generate playbook
         success = self.generate_playbook(
@@ -770,6 +819,8 @@ class PlaybookGenerator:
     
     def list_templates(self):
         """List available playbook templates"""
+        from rich.table import Table
+        
         table = Table(title="Available Playbook Templates")
         table.add_column("Template", style="cyan")
         table.add_column("Description", style="white")
@@ -800,13 +851,11 @@ def main():
     
     # Generate command
     generate_parser = subparsers.add_parser("generate", help="Generate a playbook")
-    generate_parser.add_argument("--type", choices=["basic_config", "backup_config", "security_hardening", 
-                                                   "monitoring_config", "compliance_audit", "firmware_update",
-                                                   "network_troubleshooting", "disaster_recovery"],
+    # Choices come from the template and device tables: hashed lookups, in table order for --help
+    generate_parser.add_argument("--type", choices=PLAYBOOK_TEMPLATES.keys(),
                                 help="Playbook type")
     generate_parser.add_argument("--devices", nargs="+", 
-                                choices=["cisco_ios", "cisco_nxos", "arista_eos", "juniper_junos", 
-                                        "palo_alto", "fortinet"],
+                                choices=DEVICE_CONFIGS.keys(),
                                 help="Device types")
     generate_parser.add_argument("--name", help="Playbook name")
     generate_parser.add_argument("--vars", help="Custom variables (JSON format)")
@@ -834,7 +883,11 @@ def main():
             
             custom_vars = {}
             if args.vars:
-                custom_vars = json.loads(args.vars)
+                custom_vars = orjson.loads(args.vars) if orjson is not None else json.loads(args.vars)
+                # The values become play vars, so only a mapping makes sense
+                if not isinstance(custom_vars, dict):
+                    generator.console.print("[red]--vars must be a JSON object[/red]")
+                    sys.exit(1)
             
             success = generator.generate_playbook(
                 playbook_type=args.type,
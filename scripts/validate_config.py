@@ -7,63 +7,116 @@ Validates network device configurations against defined standards
 import argparse
 import json
 import sys
+from dataclasses import dataclass
 from pathlib import Path
 
 import yaml
 
+# Prefer the libyaml-backed loader; fall back to the pure-Python one
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+# Optional faster JSON codec for the compliance report
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+@dataclass
+class ConfigRecord:
+    """Parsed configuration data for one device"""
+    __slots__ = ("device_type", "services", "vlans", "zones", "logging_enabled")
+    
+    device_type: str
+    services: list
+    vlans: list
+    zones: list
+    logging_enabled: bool
+
+@dataclass
+class ValidationResult:
+    """Validation outcome for one device"""
+    __slots__ = ("device_type", "violations")
+    
+    device_type: str
+    violations: list
+
 def load_config_standards(standards_file):
     """Load configuration standards from YAML file"""
     try:
         with open(standards_file, 'r') as f:
-            return yaml.safe_load(f)
+            return yaml.load(f, Loader=SafeLoader)
     except Exception as e:
         print(f"Error loading standards file: {e}")
         return {}
 
-def validate_cisco_config(config_data, standards):
-    """Validate Cisco device configuration"""
-    violations = []
+def build_cisco_validator(standards):
+    """Build the Cisco checks once; each takes config data and returns violations"""
     cisco_standards = standards.get('cisco', {})
+    checks = []
     
     # Check for required global settings
     required_services = cisco_standards.get('required_services', [])
-    for service in required_services:
-        if service not in config_data:
-            violations.append(f"Missing required service: {service}")
-    
-    # Check VLAN configurations
-    vlan_standards = cisco_standards.get('vlans', {})
-    if 'vlan_ranges' in vlan_standards:
-        allowed_range = vlan_standards['vlan_ranges']
-        # This would check actual VLAN configurations
-        # Implementation would parse actual config data
-    
-    # Check interface naming conventions
-    interface_standards = cisco_standards.get('interfaces', {})
-    if 'description_required' in interface_standards:
-        # Check that all interfaces have descriptions
-        pass
-    
-    return violations
+    if required_services:
+        required_set = frozenset(required_services)
+        
+        def check_required_services(config_data):
+            missing = required_set.difference(config_data.services)
+            # Report in the order the standards list them
+            return [f"Missing required service: {service}"
+                    for service in required_services if service in missing] if missing else []
+        checks.append(check_required_services)
+    
+    # VLAN ranges (vlans.vlan_ranges) and interface descriptions
+    # (interfaces.description_required) would be checked here once
+    # actual config data is parsed
+    
+    return checks
 
-def validate_panos_config(config_data, standards):
-    """Validate Palo Alto configuration"""
-    violations = []
+def build_panos_validator(standards):
+    """Build the Palo Alto checks once; each takes config data and returns violations"""
     panos_standards = standards.get('panos', {})
+    checks = []
     
     # Check security zones
     required_zones = panos_standards.get('required_zones', [])
-    for zone in required_zones:
-        if zone not in config_data.get('zones', []):
-            violations.append(f"Missing required security zone: {zone}")
+    if required_zones:
+        required_set = frozenset(required_zones)
+        
+        def check_required_zones(config_data):
+            missing = required_set.difference(config_data.zones)
+            # Report in the order the standards list them
+            return [f"Missing required security zone: {zone}"
+                    for zone in required_zones if zone in missing] if missing else []
+        checks.append(check_required_zones)
     
     # Check logging configuration
     if panos_standards.get('logging_required', True):
-        if not config_data.get('logging_enabled', False):
-            violations.append("Logging is not enabled")
+        def check_logging(config_data):
+            if not config_data.logging_enabled:
+                return ["Logging is not enabled"]
+            return []
+        checks.append(check_logging)
     
+    return checks
+
+def run_checks(checks, config_data):
+    """Run prebuilt checks against one device's config data"""
+    violations = []
+    for check in checks:
+        violations.extend(check(config_data))
     return violations
 
+def validate_cisco_config(config_data, standards):
+    """Validate Cisco device configuration"""
+    return run_checks(build_cisco_validator(standards), config_data)
+
+def validate_panos_config(config_data, standards):
+    """Validate Palo Alto configuration"""
+    return run_checks(build_panos_validator(standards), config_data)
+
 def generate_compliance_report(validation_results):
     """Generate compliance report"""
     report = {
@@ -75,7 +128,7 @@ def generate_compliance_report(validation_results):
     }
     
     for device, results in validation_results.items():
-        is_compliant = len(results['violations']) == 0
+        is_compliant = len(results.violations) == 0
         
         if is_compliant:
             report['compliant_devices'] += 1
@@ -84,8 +137,8 @@ def generate_compliance_report(validation_results):
         
         report['device_results'][device] = {
             'compliant': is_compliant,
-            'violations': results['violations'],
-            'device_type': results.get('device_type', 'unknown')
+            'violations': results.violations,
+            'device_type': results.device_type
         }
     
     return report
@@ -107,6 +160,12 @@ def main():
     if not standards:
         sys.exit(1)
     
+    # Build each device type's checks once for all configurations
+    validators = {
+        'cisco': build_cisco_validator(standards),
+        'panos': build_panos_validator(standards)
+    }
+    
     # Process configuration files
     config_dir = Path(args.configs)
     validation_results = {}
@@ -116,32 +175,32 @@ def main():
         
         # This is a simplified example - actual implementation would
         # parse device configurations using appropriate parsers
-        config_data = {
-            'device_type': 'cisco',  # Would be detected from config
-            'services': [],  # Would be parsed from config
-            'vlans': [],     # Would be parsed from config
-            'zones': []      # For firewalls
-        }
+        config_data = ConfigRecord(
+            device_type='cisco',  # Would be detected from config
+            services=[],          # Would be parsed from config
+            vlans=[],             # Would be parsed from config
+            zones=[],             # For firewalls
+            logging_enabled=False
+        )
         
         # Validate based on device type
-        if config_data['device_type'] == 'cisco':
-            violations = validate_cisco_config(config_data, standards)
-        elif config_data['device_type'] == 'panos':
-            violations = validate_panos_config(config_data, standards)
+        checks = validators.get(config_data.device_type)
+        if checks is not None:
+            violations = run_checks(checks, config_data)
         else:
             violations = ['Unknown device type - cannot validate']
         
-        validation_results[device_name] = {
-            'device_type': config_data['device_type'],
-            'violations': violations
-        }
+        validation_results[device_name] = ValidationResult(config_data.device_type, violations)
     
     # Generate compliance report
     report = generate_compliance_report(validation_results)
     
     # Write report
-    with open(args.output, 'w') as f:
-        json.dump(report, f, indent=2)
+    if orjson is not None:
+        Path(args.output).write_bytes(orjson.dumps(report, option=orjson.OPT_INDENT_2))
+    else:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
     
     # Display summary
     print("Configuration Validation Complete")